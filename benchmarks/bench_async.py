@@ -0,0 +1,98 @@
+"""Threaded vs asyncio client: throughput, memory and threads.
+
+Both clients fetch the same mock dataset with the same REQUEST_DELAY and
+server latency, so the difference is how well each overlaps round-trips.
+Thread counts include the mock server's per-connection threads.
+
+    python benchmarks/bench_async.py --sizes 100 1000 --latency 0.05 --delay 0.01
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from elementary_l10n import weblate, weblate_async  # noqa: E402
+from bench_fetch import point_client_at  # noqa: E402
+from mock_weblate import Dataset, MockWeblate  # noqa: E402
+
+
+def run(fetch) -> tuple[int, int]:
+    """Run a fetch_all_data implementation; return (rows, peak thread count)."""
+    done = threading.Event()
+    out = {}
+    peak_threads = threading.active_count()
+
+    def on_data(rows):
+        out["rows"] = rows
+        done.set()
+
+    def on_error(e):
+        out["error"] = e
+        done.set()
+
+    fetch("sv", on_data, on_error)
+    while not done.wait(0.01):
+        peak_threads = max(peak_threads, threading.active_count())
+    if "error" in out:
+        raise out["error"]
+    return len(out["rows"]), peak_threads
+
+
+def bench(sizes: list[int], latency: float, delay: float) -> list[dict]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            with MockWeblate(Dataset(size), latency=latency) as server:
+                point_client_at(server, Path(tmp) / str(size), delay)
+                for name, fetch in [("threaded", weblate.fetch_all_data),
+                                    ("asyncio", weblate_async.fetch_all_data)]:
+                    server.reset_counters()
+                    tracemalloc.start()
+                    start = time.perf_counter()
+                    rows, threads = run(fetch)
+                    wall = time.perf_counter() - start
+                    peak = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+                    results.append({
+                        "client": name, "components": size, "rows": rows,
+                        "wall_s": round(wall, 3),
+                        "req_per_s": round(server.requests / wall, 1),
+                        "requests": server.requests,
+                        "peak_mib": round(peak / 2**20, 2),
+                        "threads": threads,
+                    })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--delay", type=float, default=0.0,
+                        help="override weblate.REQUEST_DELAY")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = bench(args.sizes, args.latency, args.delay)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'client':<10}{'components':>11}{'wall s':>9}{'req/s':>8}"
+          f"{'requests':>10}{'peak MiB':>10}{'threads':>9}")
+    for r in results:
+        print(f"{r['client']:<10}{r['components']:>11}{r['wall_s']:>9.3f}"
+              f"{r['req_per_s']:>8.1f}{r['requests']:>10}{r['peak_mib']:>10.2f}"
+              f"{r['threads']:>9}")
+
+
+if __name__ == "__main__":
+    main()
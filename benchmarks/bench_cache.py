@@ -0,0 +1,138 @@
+"""Cache format and transfer encoding benchmarks.
+
+Compares the old pretty-printed JSON cache with the compact store in every
+codec available here (size on disk, write time, time to list languages
+and to load one language), and measures bytes over the wire for a
+statistics refresh with and without compressed transport:
+
+    python benchmarks/bench_cache.py --components 5000 --languages 20
+    python benchmarks/bench_cache.py --components 1000 --json
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from elementary_l10n import store, weblate  # noqa: E402
+from mock_weblate import Dataset, MockWeblate  # noqa: E402
+
+
+def make_rows(dataset: Dataset, language: str, base: str = "https://l10n.example.org") -> list:
+    rows = []
+    for proj in dataset.projects:
+        for comp in dataset.components[proj["slug"]]:
+            stats = dataset.stats[(proj["slug"], comp["slug"], language)]
+            rows.append({
+                "instance": "elementary",
+                "project": proj["name"],
+                "project_slug": proj["slug"],
+                "component": comp["name"],
+                "component_slug": comp["slug"],
+                "translated_percent": stats["translated_percent"],
+                "total_words": stats["total_words"],
+                "translated_words": stats["translated_words"],
+                "url": f"{base}/projects/{proj['slug']}/{comp['slug']}/",
+                "translate_url": f"{base}/projects/{proj['slug']}/{comp['slug']}/{language}/",
+            })
+    return rows
+
+
+def timed(fn, repeat: int = 5) -> tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_disk(dataset: Dataset, tmp: Path) -> list[dict]:
+    per_language = {lang: make_rows(dataset, lang) for lang in dataset.languages}
+    probe = dataset.languages[0]
+    now = time.time()
+    results = []
+
+    # Old format: one pretty-printed JSON document, parsed whole on load
+    legacy = tmp / "cache.json"
+    payload = {"languages": {lang: {"data": rows, "timestamp": now}
+                             for lang, rows in per_language.items()}}
+    write_s, _ = timed(lambda: legacy.write_text(json.dumps(payload, indent=2)), 1)
+    list_s, _ = timed(lambda: list(json.loads(legacy.read_text())["languages"]))
+    load_s, _ = timed(lambda: json.loads(legacy.read_text())["languages"][probe]["data"])
+    results.append({"format": "json (legacy)", "bytes": legacy.stat().st_size,
+                    "write_s": write_s, "list_s": list_s, "load_one_s": load_s})
+
+    for codec in store.available_codecs():
+        path = tmp / f"cache-{codec.replace('+', '-')}.bin"
+
+        def write():
+            store.write_store(path, {lang: (now, *store.encode_rows(rows, codec))
+                                     for lang, rows in per_language.items()})
+
+        write_s, _ = timed(write, 1)
+        list_s, _ = timed(lambda: store.StoreFile.open(path).languages())
+        load_s, rows = timed(lambda: store.StoreFile.open(path).rows(probe))
+        assert rows[0] == per_language[probe]
+        results.append({"format": codec, "bytes": path.stat().st_size,
+                        "write_s": write_s, "list_s": list_s, "load_one_s": load_s})
+    return results
+
+
+def bench_wire(dataset: Dataset, language: str) -> list[dict]:
+    results = []
+    with MockWeblate(dataset) as server:
+        api = f"{server.url}/api"
+        tasks = [(p["slug"], c["slug"]) for p in dataset.projects
+                 for c in dataset.components[p["slug"]]]
+        for label, encoding in (("identity", "identity"),
+                                ("compressed", weblate.requests.utils.DEFAULT_ACCEPT_ENCODING)):
+            session = weblate._make_session()
+            session.headers["Accept-Encoding"] = encoding
+            server.reset_counters()
+            start = time.perf_counter()
+            for ps, cs in tasks:
+                session.get(f"{api}/translations/{ps}/{cs}/{language}/statistics/").json()
+            for proj in dataset.projects:
+                session.get(f"{api}/projects/{proj['slug']}/components/").json()
+            results.append({"transport": label, "requests": server.requests,
+                            "bytes": server.bytes_sent,
+                            "wall_s": time.perf_counter() - start})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--components", type=int, default=5000)
+    parser.add_argument("--languages", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    languages = [f"l{i:02d}" for i in range(args.languages)]
+    dataset = Dataset(args.components, languages=languages)
+    with tempfile.TemporaryDirectory() as tmp:
+        disk = bench_disk(dataset, Path(tmp))
+    wire = bench_wire(dataset, languages[0])
+
+    if args.json:
+        print(json.dumps({"disk": disk, "wire": wire}, indent=2))
+        return
+    print(f"{args.components} components x {args.languages} languages")
+    print(f"{'format':<16}{'bytes':>12}{'write s':>10}{'list s':>10}{'load one s':>12}")
+    for r in disk:
+        print(f"{r['format']:<16}{r['bytes']:>12}{r['write_s']:>10.3f}"
+              f"{r['list_s']:>10.4f}{r['load_one_s']:>12.4f}")
+    print()
+    print(f"{'transport':<16}{'requests':>10}{'bytes':>12}{'wall s':>10}")
+    for r in wire:
+        print(f"{r['transport']:<16}{r['requests']:>10}{r['bytes']:>12}{r['wall_s']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
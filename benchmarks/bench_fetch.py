@@ -0,0 +1,146 @@
+"""End-to-end fetch benchmarks against the local mock Weblate server.
+
+Drives weblate.fetch_all_data, _get_all and _request_with_retry and
+reports wall time, request count, bytes transferred and peak memory:
+
+    python benchmarks/bench_fetch.py --sizes 10 100 1000 10000
+    python benchmarks/bench_fetch.py --sizes 100 --latency 0.02 --json
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from elementary_l10n import weblate  # noqa: E402
+from mock_weblate import Dataset, MockWeblate  # noqa: E402
+
+
+def point_client_at(server: MockWeblate, tmp: Path, delay: float):
+    """Redirect the client's endpoints, config and cache to the mock."""
+    weblate.BASE_URL = server.url
+    weblate.API = f"{server.url}/api"
+    weblate.REQUEST_DELAY = delay
+    weblate.CONFIG_DIR = tmp / "config"
+    weblate.CONFIG_FILE = weblate.CONFIG_DIR / "config.json"
+    weblate.CACHE_DIR = tmp / "cache"
+    weblate.CACHE_FILE = weblate.CACHE_DIR / "cache.bin"
+
+
+def measure(server: MockWeblate, fn) -> dict:
+    """Run fn() and collect wall time, server counters and peak memory."""
+    server.reset_counters()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    wall = time.perf_counter() - start
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "wall_s": round(wall, 3),
+        "requests": server.requests,
+        "bytes": server.bytes_sent,
+        "throttled": server.throttled,
+        "peak_mib": round(peak / 2**20, 2),
+        "result": result,
+    }
+
+
+def run_fetch_all(language: str = "sv") -> int:
+    done = threading.Event()
+    out = {}
+
+    def on_data(rows):
+        out["rows"] = rows
+        done.set()
+
+    def on_error(e):
+        out["error"] = e
+        done.set()
+
+    weblate.fetch_all_data(language, on_data, on_error)
+    done.wait()
+    if "error" in out:
+        raise out["error"]
+    return len(out["rows"])
+
+
+def run_fetch_all_warm(language: str = "sv") -> int:
+    """Statistics refresh with the catalog cached by a previous run."""
+    weblate.CACHE_FILE.unlink(missing_ok=True)
+    return run_fetch_all(language)
+
+
+def run_get_all(server: MockWeblate) -> int:
+    session = weblate._make_session()
+    project = server.dataset.projects[0]["slug"]
+    return len(weblate._get_all(f"{weblate.API}/projects/{project}/components/", session))
+
+
+def run_request_with_retry(server: MockWeblate, count: int = 50) -> int:
+    session = weblate._make_session()
+    ok = 0
+    for _ in range(count):
+        weblate._request_with_retry(session, f"{weblate.API}/projects/")
+        ok += 1
+    return ok
+
+
+def bench(sizes: list[int], latency: float, rate_limit: float, delay: float) -> list[dict]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            dataset = Dataset(size)
+            with MockWeblate(dataset, latency=latency, rate_limit=rate_limit) as server:
+                point_client_at(server, Path(tmp) / str(size), delay)
+                for name, fn in [
+                    ("fetch_all_data", run_fetch_all),
+                    ("fetch_all_data warm", run_fetch_all_warm),
+                    ("_get_all", lambda: run_get_all(server)),
+                    ("_request_with_retry", lambda: run_request_with_retry(server)),
+                ]:
+                    row = measure(server, fn)
+                    row.update({"benchmark": name, "components": size})
+                    results.append(row)
+    return results
+
+
+def print_table(results: list[dict]):
+    header = f"{'benchmark':<24}{'components':>11}{'wall s':>10}{'requests':>10}" \
+             f"{'bytes':>12}{'429s':>6}{'peak MiB':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r['benchmark']:<24}{r['components']:>11}{r['wall_s']:>10.3f}"
+              f"{r['requests']:>10}{r['bytes']:>12}{r['throttled']:>6}{r['peak_mib']:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="seconds of server latency per request")
+    parser.add_argument("--rate-limit", type=float, default=0.0,
+                        help="requests per second before the mock answers 429")
+    parser.add_argument("--delay", type=float, default=0.0,
+                        help="override weblate.REQUEST_DELAY")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = bench(args.sizes, args.latency, args.rate_limit, args.delay)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_table(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Local .po scanner benchmark.
+
+Writes a synthetic tree of repositories (repo/po/<lang>.po plus a .pot)
+and times a cold scan on one process and on a pool, a warm scan (stat
+only) and a scan after touching every file (hash, no parse):
+
+    python benchmarks/bench_scan.py --repos 200 --languages 30 --entries 300
+    python benchmarks/bench_scan.py --repos 50 --json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from elementary_l10n import scanner  # noqa: E402
+
+HEADER = 'msgid ""\nmsgstr ""\n"Content-Type: text/plain; charset=UTF-8\\n"\n\n'
+
+
+def make_tree(root: Path, repos: int, languages: list[str], entries: int, seed: int = 1):
+    rng = random.Random(seed)
+    for r in range(repos):
+        po = root / f"repo-{r}" / "po"
+        po.mkdir(parents=True)
+        sources = [" ".join(f"word{rng.randint(0, 999)}" for _ in range(rng.randint(1, 12)))
+                   for _ in range(entries)]
+        (po / f"repo-{r}.pot").write_text(
+            HEADER + "".join(f'#: src/file.vala:{i}\nmsgid "{s}"\nmsgstr ""\n\n'
+                             for i, s in enumerate(sources)))
+        for lang in languages:
+            done = rng.random()
+            parts = [HEADER]
+            for i, s in enumerate(sources):
+                roll = rng.random()
+                flag = "#, fuzzy\n" if done < roll < done + 0.05 else ""
+                target = s.upper() if roll < done + 0.05 else ""
+                parts.append(f'#: src/file.vala:{i}\n{flag}msgid "{s}"\nmsgstr "{target}"\n\n')
+            (po / f"{lang}.po").write_text("".join(parts))
+
+
+def timed(fn) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repos", type=int, default=200)
+    parser.add_argument("--languages", type=int, default=30)
+    parser.add_argument("--entries", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    languages = [f"l{i:02d}" for i in range(args.languages)]
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        tree, cache = Path(tmp) / "tree", Path(tmp) / "scan.json"
+        make_tree(tree, args.repos, languages, args.entries)
+        files = args.repos * (args.languages + 1)
+        size = sum(f.stat().st_size for f in tree.rglob("*.po*"))
+
+        for label, workers in (("cold, 1 process", 1), (f"cold, {args.workers} workers",
+                                                        args.workers)):
+            cache.unlink(missing_ok=True)
+            seconds, rows = timed(lambda: scanner.scan([tree], workers=workers,
+                                                       cache_file=cache))
+            results.append({"run": label, "seconds": seconds})
+        seconds, warm = timed(lambda: scanner.scan([tree], cache_file=cache))
+        assert warm == rows
+        results.append({"run": "warm (unchanged)", "seconds": seconds})
+        for f in tree.rglob("*.po"):
+            os.utime(f)
+        seconds, _ = timed(lambda: scanner.scan([tree], cache_file=cache))
+        results.append({"run": "touched (same hash)", "seconds": seconds})
+
+    if args.json:
+        print(json.dumps({"files": files, "bytes": size, "runs": results}, indent=2))
+        return
+    print(f"{args.repos} repositories x {args.languages} languages: "
+          f"{files} files, {size / 1e6:.1f} MB")
+    for r in results:
+        print(f"{r['run']:<24}{r['seconds']:>10.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Tile background benchmark: Python work per frame.
+
+Before tile textures, every visible tile ran a cairo draw function on
+each repaint, so scrolling the heatmap cost Python time per tile per
+frame. Tiles now show a texture from rendering.TileTextures, rendered
+once per (percent, size, scale). This replays frames of a scrolling grid
+and times the main-thread Python work in both modes (needs pycairo and
+PyGObject, like the app):
+
+    python benchmarks/bench_tiles.py --tiles 60 --frames 600
+    python benchmarks/bench_tiles.py --json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from elementary_l10n import rendering  # noqa: E402
+
+if rendering.HAS_GDK:
+    import cairo
+
+
+def draw_bg(cr, w: int, h: int, pct: float):
+    """The per-frame draw function tiles used before textures."""
+    r, g, b = rendering.pct_rgb(pct)
+    cr.set_source_rgba(r, g, b, 0.15)
+    cr.rectangle(0, 0, w, h)
+    cr.fill()
+    cr.set_source_rgba(r, g, b, 0.7)
+    cr.rectangle(0, h - rendering.BAR_HEIGHT, w * (pct / 100), rendering.BAR_HEIGHT)
+    cr.fill()
+    cr.set_source_rgba(0.5, 0.5, 0.5, 0.15)
+    cr.rectangle(w * (pct / 100), h - rendering.BAR_HEIGHT, w - w * (pct / 100),
+                 rendering.BAR_HEIGHT)
+    cr.fill()
+
+
+def frames(percents: list[float], visible: int, count: int):
+    """Visible tile percentages per frame while the grid scrolls one row a frame."""
+    for i in range(count):
+        start = (i * 4) % len(percents)
+        yield [percents[(start + j) % len(percents)] for j in range(visible)]
+
+
+def run(mode: str, percents: list[float], visible: int, count: int, scale: int) -> dict:
+    w, h = rendering.TILE_WIDTH * scale, rendering.TILE_HEIGHT * scale
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, w, h)
+    textures = rendering.TileTextures()
+    times = []
+    for tiles in frames(percents, visible, count):
+        start = time.perf_counter()
+        if mode == "draw":
+            for pct in tiles:
+                draw_bg(cairo.Context(surface), w, h, pct)
+        else:
+            for pct in tiles:
+                textures.get(pct, scale=scale)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return {"mode": mode, "frame_avg": sum(times) / len(times),
+            "frame_p95": times[int(len(times) * 0.95)], "frame_max": times[-1],
+            "rendered": textures.misses if mode == "texture" else visible * count}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--components", type=int, default=600)
+    parser.add_argument("--tiles", type=int, default=60, help="tiles visible per frame")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+    if not rendering.HAS_GDK:
+        sys.exit("bench_tiles.py needs pycairo and PyGObject with GTK 4")
+
+    rng = random.Random(1)
+    percents = [round(rng.uniform(0, 100), 1) for _ in range(args.components)]
+    results = [run(mode, percents, args.tiles, args.frames, args.scale)
+               for mode in ("draw", "texture")]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{args.tiles} visible tiles, {args.frames} frames, scale {args.scale}")
+    print(f"{'mode':<10}{'avg ms':>10}{'p95 ms':>10}{'max ms':>10}{'rendered':>10}")
+    for r in results:
+        print(f"{r['mode']:<10}{r['frame_avg'] * 1000:>10.3f}{r['frame_p95'] * 1000:>10.3f}"
+              f"{r['frame_max'] * 1000:>10.3f}{r['rendered']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""Local stand-in for the Weblate REST API used by the benchmarks.
+
+Serves projects, components, translations, units and statistics with Weblate's
+pagination format, gzip encoding and ETag revalidation, and can inject latency and 429 responses with
+Retry-After so the client's backoff paths can be exercised offline.
+
+Run standalone:
+
+    python benchmarks/mock_weblate.py --components 500 --port 8000
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import math
+import random
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+LANGUAGES = ["de", "es", "fr", "pt_BR", "sv", "uk", "zh_CN"]
+
+
+class Dataset:
+    """Deterministic projects/components/statistics for a given size."""
+
+    def __init__(self, components: int, per_project: int = 25,
+                 languages: list[str] | None = None, seed: int = 1):
+        rng = random.Random(seed)
+        self.languages = languages or LANGUAGES
+        self.projects = []
+        self.components = {}
+        self.stats = {}
+        n_projects = max(1, math.ceil(components / per_project))
+        remaining = components
+        for p in range(n_projects):
+            ps = f"project-{p}"
+            self.projects.append({"name": f"Project {p}", "slug": ps})
+            comps = []
+            for c in range(min(per_project, remaining)):
+                cs = f"component-{c}"
+                comps.append({"name": f"Component {p}.{c}", "slug": cs,
+                              "project": {"slug": ps}})
+                for lang in self.languages:
+                    total = rng.randint(10, 2000)
+                    translated = rng.choice([0, total, rng.randint(0, total)])
+                    words = total * rng.randint(2, 8)
+                    self.stats[(ps, cs, lang)] = {
+                        "total": total,
+                        "translated": translated,
+                        "translated_percent": round(100 * translated / total, 1),
+                        "fuzzy": rng.randint(0, total - translated),
+                        "total_words": words,
+                        "translated_words": words * translated // total,
+                        "code": lang,
+                    }
+            remaining -= len(comps)
+            self.components[ps] = comps
+
+    def open_units(self, project: str, component: str, language: str) -> list[dict]:
+        """Untranslated and fuzzy units (the state:<translated search)."""
+        stats = self.stats[(project, component, language)]
+        fuzzy = stats["fuzzy"]
+        return [{"id": i, "position": i + 1, "context": "", "note": "",
+                 "source": [f"{component} string {i}"],
+                 "target": [f"{component} fuzzy {i}"] if i < fuzzy else [""],
+                 "state": 10 if i < fuzzy else 0,
+                 "web_url": f"/translate/{project}/{component}/{language}/?checksum={i:x}"}
+                for i in range(stats["total"] - stats["translated"])]
+
+
+class MockWeblate:
+    """Threaded HTTP server speaking a subset of the Weblate API.
+
+    latency: seconds added to every response.
+    rate_limit: max requests per second before answering 429 (0 = off).
+    retry_after: value of the Retry-After header on 429 responses.
+    """
+
+    def __init__(self, dataset: Dataset, page_size: int = 20, latency: float = 0.0,
+                 rate_limit: float = 0.0, retry_after: int = 1, port: int = 0):
+        self.dataset = dataset
+        self.page_size = page_size
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self._lock = threading.Lock()
+        self._window = []
+        self.reset_counters()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset_counters(self):
+        with self._lock:
+            self.requests = 0
+            self.bytes_sent = 0
+            self.throttled = 0
+            self.not_modified = 0
+            self.paths = {}
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *_exc):
+        self.stop()
+
+    def _throttle(self) -> bool:
+        """Record a request; return True if it should get a 429."""
+        if not self.rate_limit:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            self._window = [t for t in self._window if now - t < 1.0]
+            if len(self._window) >= self.rate_limit:
+                self.throttled += 1
+                return True
+            self._window.append(now)
+        return False
+
+    def _page(self, items: list, path: str, query: dict) -> dict:
+        page = int(query.get("page", ["1"])[0])
+        start = (page - 1) * self.page_size
+        chunk = items[start:start + self.page_size]
+        more = start + self.page_size < len(items)
+        return {
+            "count": len(items),
+            "next": f"{self.url}{path}?page={page + 1}" if more else None,
+            "previous": f"{self.url}{path}?page={page - 1}" if page > 1 else None,
+            "results": chunk,
+        }
+
+    def route(self, path: str, query: dict) -> tuple[int, dict]:
+        ds = self.dataset
+        if path == "/api/projects/":
+            return 200, self._page(ds.projects, path, query)
+        if path == "/api/languages/":
+            return 200, self._page([{"code": code, "name": code} for code in ds.languages],
+                                   path, query)
+        m = re.fullmatch(r"/api/projects/([^/]+)/languages/", path)
+        if m:
+            if m[1] not in ds.components:
+                return 404, {"detail": "Not found."}
+            comps = ds.components[m[1]]
+            return 200, [{"code": code, "name": code} for code in ds.languages
+                         if any((m[1], c["slug"], code) in ds.stats for c in comps)]
+        m = re.fullmatch(r"/api/projects/([^/]+)/components/", path)
+        if m:
+            if m[1] not in ds.components:
+                return 404, {"detail": "Not found."}
+            return 200, self._page(ds.components[m[1]], path, query)
+        m = re.fullmatch(r"/api/translations/([^/]+)/([^/]+)/([^/]+)/statistics/", path)
+        if m:
+            stats = ds.stats.get((m[1], m[2], m[3]))
+            return (200, stats) if stats else (404, {"detail": "Not found."})
+        m = re.fullmatch(r"/api/translations/([^/]+)/([^/]+)/([^/]+)/units/", path)
+        if m:
+            stats = ds.stats.get((m[1], m[2], m[3]))
+            if not stats:
+                return 404, {"detail": "Not found."}
+            return 200, self._page(ds.open_units(m[1], m[2], m[3]), path, query)
+        m = re.fullmatch(r"/api/translations/([^/]+)/([^/]+)/([^/]+)/", path)
+        if m and (m[1], m[2], m[3]) in ds.stats:
+            return 200, {"language_code": m[3], "component": {"slug": m[2]},
+                         "statistics_url": f"{self.url}{path}statistics/"}
+        m = re.fullmatch(r"/api/components/([^/]+)/([^/]+)/statistics/", path)
+        if m:
+            rows = [ds.stats[(m[1], m[2], lang)] for lang in ds.languages
+                    if (m[1], m[2], lang) in ds.stats]
+            if not rows:
+                return 404, {"detail": "Not found."}
+            return 200, self._page(rows, path, query)
+        return 404, {"detail": "Not found."}
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                # Headers and body go out in separate writes; avoid the
+                # Nagle/delayed-ACK stall that would dominate timings.
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def log_message(self, *_args):
+                pass
+
+            def _send(self, status: int, payload: dict, headers: dict | None = None):
+                body = json.dumps(payload).encode()
+                gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+                if gzipped:
+                    body = gzip.compress(body, compresslevel=6)
+                # Count before answering, so a client that has its response
+                # always sees the request counted
+                with mock._lock:
+                    mock.requests += 1
+                    mock.bytes_sent += len(body)
+                    parts = urlsplit(self.path)
+                    mock.paths[parts.path] = mock.paths.get(parts.path, 0) + 1
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                if gzipped:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                for k, v in (headers or {}).items():
+                    self.send_header(k, v)
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(body)
+
+            def do_GET(self):
+                if mock.latency:
+                    time.sleep(mock.latency)
+                if mock._throttle():
+                    self._send(429, {"errors": [{
+                        "code": "throttled",
+                        "detail": f"Request was throttled. Expected available in "
+                                  f"{mock.retry_after} seconds."}]},
+                               {"Retry-After": str(mock.retry_after)})
+                    return
+                parts = urlsplit(self.path)
+                status, payload = mock.route(parts.path, parse_qs(parts.query))
+                if status != 200:
+                    self._send(status, payload)
+                    return
+                etag = '"%s"' % hashlib.sha1(json.dumps(payload).encode()).hexdigest()
+                if self.headers.get("If-None-Match") == etag:
+                    with mock._lock:
+                        mock.requests += 1
+                        mock.not_modified += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self._send(status, payload, {"ETag": etag})
+
+            do_HEAD = do_GET
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--components", type=int, default=100)
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    args = parser.parse_args()
+
+    server = MockWeblate(Dataset(args.components), latency=args.latency,
+                         rate_limit=args.rate_limit, retry_after=args.retry_after,
+                         port=args.port)
+    print(f"Mock Weblate with {args.components} components at {server.url}/api/")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ import json
 import locale
 import os
 import sys
+import threading
+import time
 import webbrowser
 
 import gi
@@ -21,6 +23,19 @@ except (ValueError, ImportError):
 from gi.repository import Gtk, Adw, Gio, GLib, Gdk, Pango  # noqa: E402
 
 from . import weblate  # noqa: E402
+from . import diff  # noqa: E402
+from . import events  # noqa: E402
+from . import languages  # noqa: E402
+from . import notifications  # noqa: E402
+from . import offline  # noqa: E402
+from . import weblate_async  # noqa: E402
+from . import print_helper  # noqa: E402
+from . import rendering  # noqa: E402
+from . import rollups  # noqa: E402
+from . import units  # noqa: E402
+from .planner import WatchList  # noqa: E402
+from .scheduler import VISIBILITY  # noqa: E402
+from .diagnostics import DIAGNOSTICS  # noqa: E402
 from . import __version__  # noqa: E402
 
 # i18n setup
@@ -31,7 +46,21 @@ gettext.bindtextdomain('elementary-l10n', LOCALEDIR)
 gettext.textdomain('elementary-l10n')
 _ = gettext.gettext
 
-# Common languages on Weblate
+MAX_CHANGES = 200  # rows listed per kind in the Changes view
+
+
+def _event_language(kind, args):
+    """Language of a row event; rows only replace rows of their own language."""
+    return args[1] if kind in ("populate", "merge") else None
+
+
+def _combine_merges(old, new):
+    """One merge event for two pinned-row batches of the same language."""
+    (old_rows, old_lang), (new_rows, new_lang) = old, new
+    return (old_rows + new_rows, new_lang) if old_lang == new_lang else None
+
+
+# Common languages on Weblate, used until the server's language list is cached
 LANGUAGES = [
     ("aa", "Afar"), ("af", "Afrikaans"), ("am", "Amharic"), ("an", "Aragonese"),
     ("ar", "Arabic"), ("as", "Assamese"), ("ast", "Asturian"), ("az", "Azerbaijani"),
@@ -65,32 +94,30 @@ LANGUAGES = [
 ]
 
 
-def get_system_language() -> str:
+_FALLBACK_INDEX = languages.LanguageIndex(dict(LANGUAGES))
+
+
+def get_system_language(index: languages.LanguageIndex | None = None) -> str:
     """Detect system language code."""
     try:
         loc = locale.getlocale()[0]  # e.g. 'sv_SE'
         if loc:
-            for code, _ in LANGUAGES:
-                if code == loc:
-                    return code
-            lang = loc.split("_")[0]
-            for code, _ in LANGUAGES:
-                if code == lang:
-                    return code
+            code = (index or _FALLBACK_INDEX).lookup(loc)
+            if code:
+                return code
     except Exception:
         pass
     return "sv"
 
 
-def pct_to_color(pct: float) -> Gdk.RGBA:
-    """Map 0-100% to red→yellow→green."""
-    rgba = Gdk.RGBA()
-    if pct < 50:
-        r, g = 0.9, 0.2 + (pct / 50) * 0.7
-    else:
-        r, g = 0.9 - ((pct - 50) / 50) * 0.7, 0.9
-    rgba.red, rgba.green, rgba.blue, rgba.alpha = r, g, 0.2, 1.0
-    return rgba
+def _language_index(instances=None) -> languages.LanguageIndex | None:
+    """Cached language indexes of all instances, merged (no network)."""
+    index = None
+    for inst in instances if instances is not None else weblate.load_instances():
+        inst_index, _ts = weblate.load_language_index(inst)
+        if inst_index is not None:
+            index = inst_index if index is None else index.merge(inst_index)
+    return index
 
 
 
@@ -101,6 +128,16 @@ from pathlib import Path as _Path
 _NOTIFY_APP = "elementary-l10n"
 
 
+def _format_age(seconds: float) -> str:
+    minutes = int(seconds // 60)
+    if minutes < 60:
+        return _("{n} min").format(n=minutes)
+    hours = minutes // 60
+    if hours < 48:
+        return _("{n} h").format(n=hours)
+    return _("{n} days").format(n=hours // 24)
+
+
 def _notify_config_path():
     return _Path(GLib.get_user_config_dir()) / _NOTIFY_APP / "notifications.json"
 
@@ -135,6 +172,9 @@ def _get_system_info():
         f"Adw: {Adw.get_major_version()}.{Adw.get_minor_version()}.{Adw.get_micro_version()}",
         f"Python: {_platform.python_version()}",
         f"OS: {_platform.system()} {_platform.release()} ({_platform.machine()})",
+        "",
+        "Diagnostics:",
+        DIAGNOSTICS.format(),
     ])
 
 
@@ -145,24 +185,54 @@ class MainWindow(Adw.ApplicationWindow):
 
         self._data = []
         self._sort_ascending = True
-        self._current_lang = get_system_language()
+        index = _language_index()
+        self._current_lang = get_system_language(index)
+        self._notifier = None
+        self._data_lang = None
+        self._watch = WatchList.from_config(weblate.load_config())
+        self._rollups = rollups.RollupIndex()
+        self._group_by_project = False
+        self._collapsed_projects = set()
+        self._textures = rendering.TileTextures()
+        self._last_frame = None
+        self._multi_instance = False
+        self._updated_at = None
+        self._offline = False
+        self._work_offline = bool(weblate.load_config().get("offline"))
+        self._offline_queue = offline.OfflineQueue()
+        self._offline_retry = None
+        self._prefetch_thread = None
+        self._changes = None
+        self._instances = []  # resolved by _load_data, with the keyring lookups
+        self._prefetch_languages = []
+        # Worker threads report through one channel, flushed once per frame
+        self._events = events.EventChannel({
+            "progress": self._update_progress,
+            "populate": self._populate,
+            "merge": self._merge_rows,
+            "offline": self._go_offline,
+            "error": self._on_fetch_error,
+        }, self._schedule_frame,
+            # A full populate makes pending ones and pinned-row merges obsolete
+            replaces={"progress": ("progress",), "populate": ("populate", "merge")},
+            combine={"merge": _combine_merges}, scope=_event_language)
+        self._in_flush = False
+        self._render_pending = False
+        self._units_pager = None
+        self._units_item = None
+        self._units_number = 1
+        self._units_return = "data"
 
         # Header bar
         header = Adw.HeaderBar()
 
-        # Language dropdown
-        lang_model = Gtk.StringList()
+        # Language dropdown: languages with translations on the server
         self._lang_codes = []
-        selected_idx = 0
-        for i, (code, name) in enumerate(LANGUAGES):
-            lang_model.append(f"{name} ({code})")
-            self._lang_codes.append(code)
-            if code == self._current_lang:
-                selected_idx = i
-
-        self._lang_dropdown = Gtk.DropDown(model=lang_model, selected=selected_idx)
+        self._updating_langs = False
+        self._lang_dropdown = Gtk.DropDown()
         self._lang_dropdown.set_tooltip_text(_("Select language"))
         self._lang_dropdown.connect("notify::selected", self._on_lang_changed)
+        self._set_language_choices(index.choices() if index else LANGUAGES)
         header.pack_start(self._lang_dropdown)
 
         # Status filter dropdown
@@ -186,6 +256,18 @@ class MainWindow(Adw.ApplicationWindow):
         sort_btn.connect("clicked", self._on_sort_clicked)
         header.pack_start(sort_btn)
 
+        # Group by project toggle
+        group_btn = Gtk.ToggleButton(icon_name="view-list-symbolic",
+                                     tooltip_text=_("Group by project"))
+        group_btn.connect("toggled", self._on_group_toggled)
+        header.pack_start(group_btn)
+
+        # Changes since the previous refresh
+        self._changes_btn = Gtk.ToggleButton(icon_name="document-open-recent-symbolic",
+                                             tooltip_text=_("Changes since last refresh"))
+        self._changes_btn.connect("toggled", self._on_changes_toggled)
+        header.pack_start(self._changes_btn)
+
         # Export button
         export_btn = Gtk.Button(icon_name="document-save-symbolic",
                                 tooltip_text=_("Export data"))
@@ -210,12 +292,25 @@ class MainWindow(Adw.ApplicationWindow):
         self._theme_btn.connect("clicked", self._on_theme_toggle)
         header.pack_end(self._theme_btn)
 
+        # Diagnostics button
+        diag_btn = Gtk.Button(icon_name="utilities-system-monitor-symbolic",
+                              tooltip_text=_("Diagnostics"))
+        diag_btn.connect("clicked", self._on_diagnostics_clicked)
+        header.pack_end(diag_btn)
+
         # Info button
         info_btn = Gtk.Button(icon_name="dialog-information-symbolic",
                               tooltip_text=_("How to help translate"))
         info_btn.connect("clicked", self._on_info_clicked)
         header.pack_end(info_btn)
 
+        # Offline mode toggle
+        offline_btn = Gtk.ToggleButton(icon_name="network-offline-symbolic",
+                                       tooltip_text=_("Work offline"),
+                                       active=self._work_offline)
+        offline_btn.connect("toggled", self._on_offline_toggled)
+        header.pack_end(offline_btn)
+
         # Refresh button
         refresh_btn = Gtk.Button(icon_name="view-refresh-symbolic",
                                  tooltip_text=_("Refresh data"))
@@ -241,6 +336,7 @@ class MainWindow(Adw.ApplicationWindow):
         loading_box.append(self._eta_label)
         self._stack.add_named(loading_box, "loading")
         self._progress_start_time = None
+        self._progress_class = None
 
         # Error view
         self._error_label = Gtk.Label(wrap=True, halign=Gtk.Align.CENTER,
@@ -263,13 +359,87 @@ class MainWindow(Adw.ApplicationWindow):
 
         scroll.set_child(self._flow_box)
         self._stack.add_named(scroll, "data")
+        self._scroll = scroll
+        self._tiles = []
+        self._shown_keys = []
+        self._visibility_source = None
+        scroll.get_vadjustment().connect("value-changed", self._queue_visibility_update)
+
+        # Data view - collapsible project groups
+        groups_scroll = Gtk.ScrolledWindow(vexpand=True, hexpand=True)
+        self._groups_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8,
+                                   margin_top=16, margin_bottom=16,
+                                   margin_start=16, margin_end=16)
+        groups_scroll.set_child(self._groups_box)
+        self._stack.add_named(groups_scroll, "groups")
+        self._groups_scroll = groups_scroll
+        groups_scroll.get_vadjustment().connect("value-changed",
+                                                self._queue_visibility_update)
+
+        # Changes view
+        changes_scroll = Gtk.ScrolledWindow(vexpand=True, hexpand=True)
+        self._changes_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=18,
+                                    margin_top=16, margin_bottom=16,
+                                    margin_start=16, margin_end=16)
+        changes_scroll.set_child(self._changes_box)
+        self._stack.add_named(changes_scroll, "changes")
+
+        # Units view - untranslated and fuzzy strings of one component
+        units_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        units_bar = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6,
+                            margin_top=8, margin_bottom=8,
+                            margin_start=16, margin_end=16)
+        back_btn = Gtk.Button(icon_name="go-previous-symbolic", tooltip_text=_("Back"))
+        back_btn.connect("clicked", self._on_units_back)
+        units_bar.append(back_btn)
+        self._units_title = Gtk.Label(hexpand=True, xalign=0,
+                                      ellipsize=Pango.EllipsizeMode.END)
+        self._units_title.add_css_class("heading")
+        units_bar.append(self._units_title)
+        open_btn = Gtk.Button(label=_("Open on Weblate"))
+        open_btn.connect("clicked", lambda _b: self._units_item and webbrowser.open(
+            self._units_item["translate_url"]))
+        units_bar.append(open_btn)
+        units_box.append(units_bar)
+
+        units_scroll = Gtk.ScrolledWindow(vexpand=True, hexpand=True)
+        self._units_list = Gtk.ListBox(selection_mode=Gtk.SelectionMode.NONE,
+                                       valign=Gtk.Align.START,
+                                       margin_start=16, margin_end=16, margin_bottom=8)
+        self._units_list.add_css_class("boxed-list")
+        units_scroll.set_child(self._units_list)
+        self._units_scroll = units_scroll
+        units_box.append(units_scroll)
+
+        units_nav = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12,
+                            halign=Gtk.Align.CENTER, margin_top=6, margin_bottom=6)
+        self._units_prev = Gtk.Button(icon_name="go-previous-symbolic",
+                                      tooltip_text=_("Previous page"))
+        self._units_prev.connect("clicked",
+                                 lambda _b: self._show_units_page(self._units_number - 1))
+        self._units_page_label = Gtk.Label()
+        self._units_page_label.add_css_class("numeric")
+        self._units_next = Gtk.Button(icon_name="go-next-symbolic",
+                                      tooltip_text=_("Next page"))
+        self._units_next.connect("clicked",
+                                 lambda _b: self._show_units_page(self._units_number + 1))
+        units_nav.append(self._units_prev)
+        units_nav.append(self._units_page_label)
+        units_nav.append(self._units_next)
+        units_box.append(units_nav)
+        self._stack.add_named(units_box, "units")
 
         # Summary bar
         self._summary = Gtk.Label(halign=Gtk.Align.CENTER,
                                   margin_top=6, margin_bottom=6)
         self._summary.add_css_class("dim-label")
 
+        # Offline banner
+        self._offline_banner = Adw.Banner(button_label=_("Retry"))
+        self._offline_banner.connect("button-clicked", lambda _b: self._check_online())
+
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        content_box.append(self._offline_banner)
         content_box.append(self._stack)
         content_box.append(self._summary)
 
@@ -287,9 +457,16 @@ class MainWindow(Adw.ApplicationWindow):
 
         # Load CSS
         self._setup_css()
+        self.connect("realize", self._on_realize)
+        Gio.NetworkMonitor.get_default().connect("network-changed",
+                                                 self._on_network_changed)
+        if self._work_offline:
+            self._set_offline(True)
 
         # Check for API key before making any requests
         config = weblate.load_config()
+        if config.get("trace_file") and not os.environ.get("ELEMENTARY_L10N_TRACE"):
+            DIAGNOSTICS.start_trace(os.path.expanduser(config["trace_file"]))
         if not config.get("api_key"):
             GLib.idle_add(self._show_api_key_setup)
         else:
@@ -316,13 +493,50 @@ class MainWindow(Adw.ApplicationWindow):
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
 
+    def _on_realize(self, _widget):
+        self.get_frame_clock().connect("after-paint", self._on_after_paint)
+
+    def _on_after_paint(self, clock):
+        """Record frame intervals while frames are produced back to back."""
+        now = clock.get_frame_time()
+        if self._last_frame is not None:
+            DIAGNOSTICS.record_frame((now - self._last_frame) / 1e6)
+        self._last_frame = now
+
+    def _schedule_frame(self, flush):
+        """Run flush on the main loop, at the next frame while mapped."""
+        def _arm():
+            if self.get_mapped():
+                self.add_tick_callback(lambda *_a: self._flush_events(flush)
+                                       or GLib.SOURCE_REMOVE)
+            else:
+                self._flush_events(flush)
+            return GLib.SOURCE_REMOVE
+        GLib.idle_add(_arm)
+
+    def _flush_events(self, flush):
+        """Deliver a batch of worker events, then render at most once."""
+        self._in_flush = True
+        try:
+            flush()
+        finally:
+            self._in_flush = False
+        if self._render_pending:
+            self._render_pending = False
+            self._render()
+
+    def _request_render(self):
+        if self._in_flush:
+            self._render_pending = True
+        else:
+            self._render()
+
     def _on_progress(self, current, total, component_name):
         """Called from worker thread with progress updates."""
-        GLib.idle_add(self._update_progress, current, total, component_name)
+        self._events.post("progress", current, total, component_name)
 
     def _update_progress(self, current, total, component_name):
         """Update progress bar, percentage, and ETA on the main thread."""
-        import time as _time
         if total <= 0:
             return
         fraction = current / total
@@ -340,11 +554,11 @@ class MainWindow(Adw.ApplicationWindow):
             css_class = "accent"
         else:
             css_class = "success"
-        for c in ("error", "warning", "accent", "success"):
-            if c == css_class:
-                self._progress_bar.add_css_class(c)
-            else:
-                self._progress_bar.remove_css_class(c)
+        if css_class != self._progress_class:
+            if self._progress_class:
+                self._progress_bar.remove_css_class(self._progress_class)
+            self._progress_bar.add_css_class(css_class)
+            self._progress_class = css_class
 
         if component_name:
             self._loading_label.set_text(
@@ -352,10 +566,10 @@ class MainWindow(Adw.ApplicationWindow):
 
         # ETA calculation
         if self._progress_start_time is None:
-            self._progress_start_time = _time.time()
+            self._progress_start_time = time.monotonic()
             self._eta_label.set_text("")
         elif current > 0:
-            elapsed = _time.time() - self._progress_start_time
+            elapsed = time.monotonic() - self._progress_start_time
             rate = current / elapsed  # items per second
             remaining = total - current
             if rate > 0:
@@ -368,6 +582,7 @@ class MainWindow(Adw.ApplicationWindow):
                 self._eta_label.set_text(eta_str)
 
     def _load_data(self, force=False):
+        self._changes = None  # belongs to the data being replaced
         self._stack.set_visible_child_name("loading")
         self._summary.set_text("")
         self._progress_bar.set_fraction(0)
@@ -376,20 +591,73 @@ class MainWindow(Adw.ApplicationWindow):
         self._loading_label.set_text(_("Loading translation data…"))
         self._progress_start_time = None
 
+        config = weblate.load_config()
+        self._watch = WatchList.from_config(config)
+        self._instances = instances = weblate.load_instances(config)
+        self._prefetch_languages = config.get("prefetch_languages", [])
+        self._multi_instance = len(instances) > 1
+        # Every event names the language it is for; the user may have
+        # switched to another one by the time it is delivered
+        lang = self._current_lang
+
+        # The callbacks below run on worker threads, so reading the store
+        # for the diff and the language index stays off the main loop
+        def changes_for(rows):
+            previous, _ts = weblate.load_previous_store(lang, instances)
+            return diff.diff_rows(previous, rows, lang)
+
         def on_data(rows):
-            GLib.idle_add(self._populate, rows, False)
+            # The fetch refreshes the language index when it is stale
+            self._events.post("populate", rows, lang, False, 0, changes_for(rows),
+                              _language_index(instances))
 
         def on_error(e):
-            GLib.idle_add(self._show_error, str(e))
+            self._events.post("error", str(e), lang)
 
         def on_cache(rows, age_minutes):
-            GLib.idle_add(self._populate, rows, True, age_minutes)
-
-        weblate.fetch_all_data(
-            self._current_lang, on_data, on_error,
-            cache_cb=None if force else on_cache,
-            progress_cb=self._on_progress,
-        )
+            self._events.post("populate", rows, lang, True, age_minutes, changes_for(rows))
+
+        def on_partial(rows):
+            self._events.post("merge", rows, lang)
+
+        def on_offline(rows, timestamp):
+            self._events.post("offline", rows, timestamp, lang, changes_for(rows))
+
+        use_async = (weblate_async.HAS_HTTPX and config.get("async_client")
+                     and not self._multi_instance)
+
+        def _start():
+            if self._offline:
+                # Serve the local store; the refresh runs once we are back online
+                on_offline(*weblate.load_store(lang, instances))
+            elif use_async:
+                # Opt-in asyncio client: one loop thread, overlapping requests
+                weblate_async.fetch_all_data(
+                    lang, on_data, on_error,
+                    cache_cb=None if force else on_cache,
+                    progress_cb=self._on_progress,
+                    offline_cb=on_offline,
+                    partial_cb=on_partial,
+                    max_age=None if force else weblate.PREFETCH_MAX_AGE,
+                )
+            else:
+                weblate.fetch_all_data(
+                    lang, on_data, on_error,
+                    cache_cb=None if force else on_cache,
+                    progress_cb=self._on_progress,
+                    instances=instances,
+                    partial_cb=on_partial,
+                    offline_cb=on_offline,
+                    # Prefetched languages are shown straight from the store
+                    max_age=None if force else weblate.PREFETCH_MAX_AGE,
+                )
+
+        # The stored rows are decoded on this thread, before the fetch starts
+        threading.Thread(target=_start, daemon=True, name="load").start()
+
+    def _on_fetch_error(self, msg, lang):
+        if lang == self._current_lang:
+            self._show_error(msg)
 
     def _show_error(self, msg):
         self._error_label.set_markup(
@@ -399,94 +667,364 @@ class MainWindow(Adw.ApplicationWindow):
         )
         self._stack.set_visible_child_name("error")
 
-    def _populate(self, rows, from_cache=False, age_minutes=0):
+    # Offline mode
+
+    def _set_offline(self, offline_mode):
+        self._offline = offline_mode
+        self._offline_banner.set_revealed(offline_mode)
+        if offline_mode and not self._work_offline and self._offline_retry is None:
+            self._offline_retry = GLib.timeout_add_seconds(offline.RETRY_INTERVAL,
+                                                           self._on_retry_timeout)
+
+    def _go_offline(self, rows, timestamp, lang, changes=None):
+        """No server could be reached: switch to the local store."""
+        self._offline_queue.add(lang)
+        self._set_offline(True)
+        if lang == self._current_lang:
+            self._show_offline(rows, timestamp, changes)
+
+    def _show_offline(self, rows, timestamp, changes=None):
+        if self._work_offline:
+            title = _("Working offline. Refreshes are queued until you go online.")
+        else:
+            title = _("Offline. Refreshes are queued until the connection returns.")
+        if not rows:
+            self._offline_banner.set_title(title)
+            self._error_label.set_markup(
+                f"<b>{_('No stored data for this language')}</b>\n\n"
+                f"{_('It will be fetched when the connection returns.')}")
+            self._stack.set_visible_child_name("error")
+            return
+        age = time.time() - timestamp
+        self._offline_banner.set_title(
+            title + " " + _("Data is {age} old.").format(age=_format_age(age)))
+        self._populate(rows, self._current_lang, True, int(age / 60), changes)
+
+    def _on_retry_timeout(self):
+        if not self._offline or self._work_offline:
+            self._offline_retry = None
+            return GLib.SOURCE_REMOVE
+        self._check_online()
+        return GLib.SOURCE_CONTINUE
+
+    def _on_network_changed(self, monitor, available):
+        if available and self._offline:
+            self._check_online()
+
+    def _check_online(self):
+        """Probe the servers off the main thread; go online if any answers."""
+        if not self._offline or self._work_offline:
+            return
+        instances = self._instances
+
+        def _probe():
+            if any(weblate.check_health(inst) for inst in instances):
+                GLib.idle_add(self._go_online)
+
+        threading.Thread(target=_probe, daemon=True).start()
+
+    def _go_online(self):
+        """Back online: refresh this language, then replay the queued ones."""
+        if not self._offline:
+            return
+        self._set_offline(False)
+        queued = [code for code in self._offline_queue.take() if code != self._current_lang]
+        self._load_data(force=True)
+        if queued:
+            offline.replay(queued, lambda fetched, failed: GLib.idle_add(
+                self._on_replayed, fetched, failed))
+
+    def _on_replayed(self, fetched, failed):
+        for code in failed:
+            self._offline_queue.add(code)
+        if fetched:
+            self._status_bar.set_text(
+                _("Updated {n} languages queued while offline").format(n=len(fetched)))
+
+    def _on_offline_toggled(self, btn):
+        self._work_offline = btn.get_active()
+        config = weblate.load_config()
+        config["offline"] = self._work_offline
+        weblate.save_config(config)
+        if self._work_offline:
+            self._set_offline(True)
+            self._load_data()
+        else:
+            self._go_online()
+
+    def _merge_rows(self, rows, lang):
+        """Show freshly fetched pinned rows while the full refresh continues."""
+        if lang != self._current_lang:
+            return
+        base = self._data if self._data_lang == lang else []
+        fresh = {rollups.row_key(r): r for r in rows}
+        self._data = [fresh.pop(rollups.row_key(r), r) for r in base] + list(fresh.values())
+        self._data_lang = lang
+        self._rollups.replace(lang, self._data)
+        self._request_render()
+
+    def _populate(self, rows, lang, from_cache=False, age_minutes=0, changes=None,
+                  index=None):
+        """Show rows; changes and index were prepared by the worker thread."""
+        if lang != self._current_lang:
+            return  # a fetch for a language no longer shown; it is in the store
         self._data = rows
+        self._data_lang = lang
         self._from_cache = from_cache
         self._cache_age = age_minutes
-        # Notify about low translations
-        low = [r["component"] for r in rows if r["translated_percent"] < 50 and r["translated_percent"] > 0]
-        if low:
-            _send_notification(
-                _("elementary L10n: Low translations"),
-                _("{count} components below 50%").format(count=len(low)),
-                "se.danielnylander.TranslationStatus")
-        self._render()
+        self._updated_at = time.time() - age_minutes * 60
+        self._rollups.replace(lang, rows)
+        # Cached and offline rows are the store's latest refresh, so the diff
+        # against the rows it replaced holds for them too
+        self._changes = changes
+        # Cached rows were already announced when they were fetched
+        if not from_cache:
+            self._notify_changes(rows, lang)
+        if index:
+            self._set_language_choices(index.choices())
+        self._request_render()
+        if not self._offline:
+            self._start_prefetch()
+
+    def _start_prefetch(self):
+        """Fetch the system language and favourites in the background.
+
+        Favourites come from config["prefetch_languages"]; the fetch runs at
+        background priority, so it never delays the language on screen.
+        """
+        if self._prefetch_thread is not None and self._prefetch_thread.is_alive():
+            return
+        wanted = [get_system_language(), *self._prefetch_languages]
+        languages = [code for code in dict.fromkeys(wanted) if code != self._current_lang]
+        if languages:
+            self._prefetch_thread = weblate.prefetch_languages(
+                languages, instances=self._instances)
+
+    def _notify_changes(self, rows, lang):
+        """Send one batched notification for changes since the last one."""
+        config = _load_notify_config()
+        if not (HAS_NOTIFY and config.get("enabled")):
+            return
+        if self._notifier is None:
+            self._notifier = notifications.NotificationEngine(config.get("rules"))
+        message = self._notifier.process(lang, rows)
+        if message:
+            _send_notification(*message, "se.danielnylander.TranslationStatus")
 
     def _render(self):
+        showing_units = self._stack.get_visible_child_name() == "units"
+        start = time.perf_counter()
+        tiles = self._render_tiles()
+        DIAGNOSTICS.record_render(start, time.perf_counter() - start, tiles)
+        if self._changes_btn.get_active():
+            self._render_changes()
+        if showing_units:
+            # Keep the open component; Back returns to the refreshed view
+            self._units_return = self._stack.get_visible_child_name()
+            self._stack.set_visible_child_name("units")
+
+    def _render_changes(self):
+        """List what moved in the latest refresh, largest moves first."""
+        while (child := self._changes_box.get_first_child()) is not None:
+            self._changes_box.remove(child)
+        self._stack.set_visible_child_name("changes")
+        if not self._changes:
+            self._changes_box.append(Gtk.Label(
+                label=_("No changes since the previous refresh."), vexpand=True))
+            return
+        titles = {diff.REGRESSED: _("Regressed"), diff.IMPROVED: _("Improved"),
+                  diff.NEW: _("New"), diff.REMOVED: _("Removed")}
+        for kind in diff.KINDS:
+            changes = self._changes[kind]
+            if not changes:
+                continue
+            group = Adw.PreferencesGroup(title=f"{titles[kind]} ({len(changes)})")
+            for change in changes[:MAX_CHANGES]:
+                group.add(self._make_change_row(change))
+            if len(changes) > MAX_CHANGES:
+                group.add(Adw.ActionRow(title=_("and {count} more").format(
+                    count=len(changes) - MAX_CHANGES)))
+            self._changes_box.append(group)
+
+    def _make_change_row(self, change):
+        row = change.row
+        old = "–" if change.old is None else f"{change.old:.1f}%"
+        new = "–" if change.new is None else f"{change.new:.1f}%"
+        action_row = Adw.ActionRow(
+            title=GLib.markup_escape_text(f"{row['project']} / {row['component']}"),
+            subtitle=f"{old} → {new}")
+        if change.kind in (diff.IMPROVED, diff.REGRESSED):
+            delta = Gtk.Label(label=f"{change.delta:+.1f}")
+            delta.add_css_class("success" if change.delta > 0 else "error")
+            action_row.add_suffix(delta)
+        if change.kind != diff.REMOVED:
+            action_row.set_activatable(True)
+            action_row.connect("activated",
+                               lambda _r, url=row["translate_url"]: webbrowser.open(url))
+        return action_row
+
+    def _on_changes_toggled(self, btn):
+        if btn.get_active():
+            self._render_changes()
+        elif self._data:
+            self._render()
+
+    def _render_tiles(self):
         # Clear
-        while True:
-            child = self._flow_box.get_first_child()
-            if child is None:
-                break
-            self._flow_box.remove(child)
+        self._tiles = []
+        for box in (self._flow_box, self._groups_box):
+            while True:
+                child = box.get_first_child()
+                if child is None:
+                    break
+                box.remove(child)
 
         # Apply status filter
         filter_key = self._filter_options[self._filter_dropdown.get_selected()][0]
         data = self._data
-        if filter_key == "complete":
-            data = [r for r in data if r["translated_percent"] >= 100]
-        elif filter_key == "partial":
-            data = [r for r in data if 0 < r["translated_percent"] < 100]
-        elif filter_key == "untranslated":
-            data = [r for r in data if r["translated_percent"] == 0]
+        if filter_key != "all":
+            data = [r for r in data
+                    if rollups.row_status(r["translated_percent"]) == filter_key]
 
         data = sorted(data, key=lambda r: r["translated_percent"],
                        reverse=not self._sort_ascending)
+        # Pinned components first; sort is stable so the order holds within
+        if self._watch:
+            data.sort(key=lambda r: not self._watch.is_pinned(
+                r["project_slug"], r["component_slug"]))
 
         if not data:
             self._show_error(_("No components found."))
-            return
+            return 0
 
-        avg = sum(r["translated_percent"] for r in data) / len(data)
-        complete = sum(1 for r in data if r["translated_percent"] >= 100)
+        # Summary comes from the precomputed rollups, not a pass over data
+        stats = self._rollups.status(self._current_lang, filter_key)
         summary = (
             _("{count} components · {complete} fully translated · "
               "Average: {avg}%").format(
-                count=len(data), complete=complete, avg=f"{avg:.1f}")
+                count=stats.count, complete=stats.complete, avg=f"{stats.average:.1f}")
         )
-        if getattr(self, '_from_cache', False):
+        summary += " · " + _("Word-weighted: {avg}%").format(
+            avg=f"{stats.weighted_average:.1f}")
+        if self._changes:
+            summary += " · " + _("{count} changes").format(count=len(self._changes))
+        if self._offline:
+            summary += " · " + _("Offline, data from {age} ago").format(
+                age=_format_age(self._cache_age * 60))
+        elif getattr(self, '_from_cache', False):
             summary += " · " + _("Cached data ({age} min ago)").format(
                 age=self._cache_age)
         self._summary.set_text(summary)
+        self._summary.set_tooltip_text(stats.histogram_text())
 
+        if self._group_by_project:
+            self._render_groups(data)
+            self._stack.set_visible_child_name("groups")
+        else:
+            for row in data:
+                self._flow_box.append(self._make_tile(row))
+            self._stack.set_visible_child_name("data")
+        self._update_status_bar()
+        self._shown_keys = [rollups.row_key(r) for r in data]
+        self._queue_visibility_update()
+        return len(data)
+
+    def _queue_visibility_update(self, *_args):
+        """Debounce viewport changes before telling the fetch scheduler."""
+        if self._visibility_source is None:
+            self._visibility_source = GLib.timeout_add(150, self._publish_visibility)
+
+    def _publish_visibility(self):
+        """Report on-screen and filtered tiles so refreshes fetch them first."""
+        self._visibility_source = None
+        scroll = self._groups_scroll if self._group_by_project else self._scroll
+        height = scroll.get_height()
+        visible = []
+        for tile, key in self._tiles:
+            if not tile.get_mapped():
+                continue
+            ok, bounds = tile.compute_bounds(scroll)
+            if ok and bounds.get_y() + bounds.get_height() >= 0 and bounds.get_y() <= height:
+                visible.append(key)
+        VISIBILITY.update(self._current_lang, visible, self._shown_keys)
+        return GLib.SOURCE_REMOVE
+
+    def _make_flow_box(self):
+        return Gtk.FlowBox(
+            selection_mode=Gtk.SelectionMode.NONE,
+            homogeneous=True,
+            min_children_per_line=2,
+            max_children_per_line=4,
+            column_spacing=8,
+            row_spacing=8,
+        )
+
+    def _render_groups(self, data):
+        """One expander per project; tiles are only built once expanded."""
+        groups = {}
         for row in data:
-            self._flow_box.append(self._make_tile(row))
+            groups.setdefault(rollups.project_key(row), []).append(row)
+
+        for key, rows in sorted(groups.items(), key=lambda kv: kv[1][0]["project"].lower()):
+            stats = self._rollups.project(self._current_lang, key)
+            if stats.count != len(rows):
+                # A filter hides some of the project: sum what is shown
+                stats = rollups.Rollup()
+                for row in rows:
+                    stats.add(row)
+            title = GLib.markup_escape_text(rows[0]["project"])
+            if self._multi_instance:
+                title = f"{GLib.markup_escape_text(key[0])} · {title}"
+            label = Gtk.Label(use_markup=True, xalign=0)
+            label.set_markup(
+                f"<b>{title}</b>  <span alpha='60%'>" + GLib.markup_escape_text(
+                    _("{count} components · {complete} fully translated · "
+                      "Weighted average: {avg}%").format(
+                        count=stats.count, complete=stats.complete,
+                        avg=f"{stats.weighted_average:.1f}")) + "</span>")
+            flow = self._make_flow_box()
+            expander = Gtk.Expander(label_widget=label, child=flow,
+                                    expanded=key not in self._collapsed_projects)
+            if expander.get_expanded():
+                for row in rows:
+                    flow.append(self._make_tile(row))
+            expander.connect("notify::expanded", self._on_group_expanded, key, rows, flow)
+            self._groups_box.append(expander)
+
+    def _on_group_expanded(self, expander, _pspec, key, rows, flow):
+        if expander.get_expanded():
+            self._collapsed_projects.discard(key)
+            if flow.get_first_child() is None:
+                for row in rows:
+                    flow.append(self._make_tile(row))
+        else:
+            self._collapsed_projects.add(key)
+        self._queue_visibility_update()
 
-        self._stack.set_visible_child_name("data")
-        self._update_status_bar()
+    def _on_group_toggled(self, btn):
+        self._group_by_project = btn.get_active()
+        if self._data:
+            self._render()
 
     def _make_tile(self, item):
         """Create a compact heatmap tile for a component."""
         pct = item["translated_percent"]
-        color = pct_to_color(pct)
 
         # Outer box as a clickable button-like tile
         tile = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4,
-                       width_request=200, height_request=80)
+                       width_request=rendering.TILE_WIDTH,
+                       height_request=rendering.TILE_HEIGHT)
         tile.add_css_class("card")
         tile.set_margin_top(2)
         tile.set_margin_bottom(2)
 
-        # Heatmap background
-        bg = Gtk.DrawingArea(vexpand=True, hexpand=True)
-
-        def draw_bg(area, cr, w, h, p=pct, c=color):
-            # Background with heatmap color at low opacity
-            cr.set_source_rgba(c.red, c.green, c.blue, 0.15)
-            cr.rectangle(0, 0, w, h)
-            cr.fill()
-            # Progress bar at bottom
-            cr.set_source_rgba(c.red, c.green, c.blue, 0.7)
-            cr.rectangle(0, h - 4, w * (p / 100), 4)
-            cr.fill()
-            # Track
-            cr.set_source_rgba(0.5, 0.5, 0.5, 0.15)
-            cr.rectangle(w * (p / 100), h - 4, w - w * (p / 100), 4)
-            cr.fill()
-
-        bg.set_draw_func(draw_bg)
-
-        # Overlay text on the drawing area
+        # Heatmap background: a cached texture per percent, scaled by GTK
+        bg = Gtk.Picture(
+            paintable=self._textures.get(pct, scale=self.get_scale_factor()),
+            content_fit=Gtk.ContentFit.FILL, can_shrink=True,
+            vexpand=True, hexpand=True)
+
+        # Overlay text on the background
         overlay = Gtk.Overlay()
         overlay.set_child(bg)
 
@@ -503,8 +1041,11 @@ class MainWindow(Adw.ApplicationWindow):
         )
         comp_label.add_css_class("heading")
 
+        project = item["project"]
+        if self._multi_instance:
+            project = f"{item.get('instance', '')} · {project}"
         proj_label = Gtk.Label(
-            label=item["project"],
+            label=project,
             halign=Gtk.Align.START,
             ellipsize=Pango.EllipsizeMode.END,
             max_width_chars=25,
@@ -529,6 +1070,18 @@ class MainWindow(Adw.ApplicationWindow):
         top_row.append(labels_box)
         top_row.append(pct_label)
 
+        pin_btn = Gtk.ToggleButton(
+            icon_name="view-pin-symbolic", has_frame=False, valign=Gtk.Align.START,
+            active=self._watch.is_pinned(item["project_slug"], item["component_slug"]),
+            tooltip_text=_("Pin to refresh first"))
+        if item["project_slug"] in self._watch.projects:
+            # Pinned through its project in config.json; can't unpin one component
+            pin_btn.set_sensitive(False)
+            pin_btn.set_tooltip_text(_("Pinned with its project"))
+        pin_btn.connect("toggled", self._on_pin_toggled, item)
+        top_row.append(pin_btn)
+        self._tiles.append((tile, rollups.row_key(item)))
+
         text_box.append(top_row)
         overlay.add_overlay(text_box)
 
@@ -536,14 +1089,104 @@ class MainWindow(Adw.ApplicationWindow):
 
         # Make clickable
         gesture = Gtk.GestureClick()
-        gesture.connect("released", lambda g, n, x, y, url=item["translate_url"]: webbrowser.open(url))
+        gesture.connect("released", lambda g, n, x, y, item=item: self._open_units(item))
         tile.add_controller(gesture)
         tile.set_cursor(Gdk.Cursor.new_from_name("pointer"))
-        tile.set_tooltip_text(_("Open {component} on Weblate").format(
+        tile.set_tooltip_text(_("Show untranslated strings in {component}").format(
             component=item["component"]))
 
         return tile
 
+    def _open_units(self, item):
+        """Show the untranslated and fuzzy strings of a component."""
+        instance = next((inst for inst in self._instances
+                         if inst.name == item.get("instance")), weblate.default_instance())
+        self._units_item = item
+        self._units_pager = units.UnitPager(instance, item["project_slug"],
+                                            item["component_slug"], self._current_lang)
+        self._units_return = self._stack.get_visible_child_name()
+        self._units_title.set_label(f"{item['project']} / {item['component']}")
+        self._stack.set_visible_child_name("units")
+        self._show_units_page(1)
+
+    def _show_units_page(self, number):
+        pager = self._units_pager
+        self._units_number = number
+        while (child := self._units_list.get_first_child()) is not None:
+            self._units_list.remove(child)
+        self._units_list.append(Gtk.Spinner(spinning=True, margin_top=12, margin_bottom=12))
+        self._units_prev.set_sensitive(False)
+        self._units_next.set_sensitive(False)
+
+        def _worker():
+            try:
+                page = pager.page(number)
+            except Exception as e:
+                GLib.idle_add(self._render_units, pager, number, None, str(e))
+                return
+            GLib.idle_add(self._render_units, pager, number, page, None)
+            # Likely next; it is usually on disk by the time it is asked for
+            pager.prefetch(number + 1)
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _render_units(self, pager, number, page, error):
+        if pager is not self._units_pager or number != self._units_number:
+            return  # the user moved on while this page loaded
+        while (child := self._units_list.get_first_child()) is not None:
+            self._units_list.remove(child)
+        if error is not None:
+            self._units_list.append(Gtk.Label(label=error, wrap=True,
+                                              margin_top=12, margin_bottom=12))
+        elif not page:
+            self._units_list.append(Gtk.Label(label=_("Nothing left to translate."),
+                                              margin_top=12, margin_bottom=12))
+        for unit in page or ():
+            self._units_list.append(self._make_unit_row(unit))
+        self._units_scroll.get_vadjustment().set_value(0)
+
+        pages = pager.pages
+        if pages is None:
+            self._units_page_label.set_text(str(number))
+        else:
+            self._units_page_label.set_text(
+                _("Page {page} of {pages} · {count} strings").format(
+                    page=number, pages=pages, count=pager.count))
+        self._units_prev.set_sensitive(number > 1)
+        self._units_next.set_sensitive(error is None and (pages is None or number < pages))
+
+    def _make_unit_row(self, unit):
+        source = "\n".join(unit.get("source") or [])
+        target = "\n".join(t for t in unit.get("target") or [] if t)
+        row = Adw.ActionRow(title=GLib.markup_escape_text(source),
+                            subtitle=GLib.markup_escape_text(target) or _("Untranslated"),
+                            title_lines=4, subtitle_lines=2)
+        if unit.get("context"):
+            row.set_tooltip_text(unit["context"])
+        if unit.get("state") == units.STATE_FUZZY:
+            state = Gtk.Label(label=_("Needs editing"))
+            state.add_css_class("warning")
+            row.add_suffix(state)
+        if unit.get("web_url"):
+            row.set_activatable(True)
+            row.connect("activated", lambda _r, url=unit["web_url"]: webbrowser.open(url))
+        return row
+
+    def _on_units_back(self, *_args):
+        self._units_pager = None  # drop its pages
+        self._stack.set_visible_child_name(self._units_return)
+
+    def _on_pin_toggled(self, btn, item):
+        """Add or remove a component from the watch list in config.json."""
+        ps, cs = item["project_slug"], item["component_slug"]
+        if btn.get_active() == self._watch.is_pinned(ps, cs):
+            return
+        config = weblate.load_config()
+        self._watch = WatchList.from_config(config)
+        self._watch.toggle_component(ps, cs)
+        config["watch"] = self._watch.to_config()
+        weblate.save_config(config)
+
     def _on_export_clicked(self, *_args):
         dialog = Adw.MessageDialog(transient_for=self,
                                    heading=_("Export Data"),
@@ -551,12 +1194,15 @@ class MainWindow(Adw.ApplicationWindow):
         dialog.add_response("cancel", _("Cancel"))
         dialog.add_response("csv", "CSV")
         dialog.add_response("json", "JSON")
+        if print_helper.HAS_CAIRO:
+            dialog.add_response("pdf", _("PDF report"))
+            dialog.add_response("svg", _("SVG report"))
         dialog.set_response_appearance("csv", Adw.ResponseAppearance.SUGGESTED)
         dialog.connect("response", self._on_export_format_chosen)
         dialog.present()
 
     def _on_export_format_chosen(self, dialog, response):
-        if response not in ("csv", "json"):
+        if response not in ("csv", "json", "pdf", "svg"):
             return
         self._export_fmt = response
         fd = Gtk.FileDialog()
@@ -568,6 +1214,9 @@ class MainWindow(Adw.ApplicationWindow):
             path = dialog.save_finish(result).get_path()
         except Exception:
             return
+        if self._export_fmt in ("pdf", "svg"):
+            self._export_report(path, self._export_fmt)
+            return
         data = [{"project": r["project"], "component": r["component"],
                  "translated_percent": r["translated_percent"],
                  "translate_url": r["translate_url"]}
@@ -582,6 +1231,23 @@ class MainWindow(Adw.ApplicationWindow):
                 json.dump(data, f, ensure_ascii=False, indent=2)
 
 
+    def _export_report(self, path, fmt):
+        """Render the paginated report off the main thread."""
+        rows = sorted(self._data, key=lambda r: r["translated_percent"],
+                      reverse=not self._sort_ascending)
+        self._status_bar.set_text(_("Rendering report…"))
+
+        def on_done(paths):
+            GLib.idle_add(self._status_bar.set_text,
+                          _("Report saved to {path}").format(path=paths[0]))
+
+        def on_error(e):
+            GLib.idle_add(self._status_bar.set_text,
+                          _("Report failed: {error}").format(error=e))
+
+        print_helper.render_report_async(rows, path, on_done, on_error, fmt=fmt,
+                                         title=_("Translation Status"))
+
     def _on_theme_toggle(self, _btn):
         sm = Adw.StyleManager.get_default()
         if sm.get_color_scheme() == Adw.ColorScheme.FORCE_DARK:
@@ -593,9 +1259,31 @@ class MainWindow(Adw.ApplicationWindow):
 
     def _update_status_bar(self):
         import datetime as _dt
-        self._status_bar.set_text("Last updated: " + _dt.datetime.now().strftime("%Y-%m-%d %H:%M"))
+        updated = _dt.datetime.fromtimestamp(self._updated_at or time.time())
+        self._status_bar.set_text("Last updated: " + updated.strftime("%Y-%m-%d %H:%M"))
+
+    def _set_language_choices(self, choices):
+        choices = list(choices)
+        codes = [code for code, _name in choices]
+        if self._current_lang not in codes:
+            # Keep the selected language listed even if it has no translations
+            choices.append((self._current_lang,
+                            _FALLBACK_INDEX.names.get(self._current_lang, self._current_lang)))
+            codes.append(self._current_lang)
+        if codes == self._lang_codes:
+            return
+        model = Gtk.StringList()
+        for code, name in choices:
+            model.append(f"{name} ({code})")
+        self._lang_codes = codes
+        self._updating_langs = True
+        self._lang_dropdown.set_model(model)
+        self._lang_dropdown.set_selected(codes.index(self._current_lang))
+        self._updating_langs = False
 
     def _on_lang_changed(self, dropdown, _pspec):
+        if self._updating_langs:
+            return
         idx = dropdown.get_selected()
         if idx < len(self._lang_codes):
             self._current_lang = self._lang_codes[idx]
@@ -666,6 +1354,7 @@ class MainWindow(Adw.ApplicationWindow):
         config = _load_notify_config()
         config["enabled"] = not config.get("enabled", False)
         _save_notify_config(config)
+        self._notifier = None
 
     def _on_settings_clicked(self, _btn):
         """Show settings dialog for API key."""
@@ -734,6 +1423,24 @@ class MainWindow(Adw.ApplicationWindow):
         about.set_debug_info_filename("elementary-l10n-debug.txt")
         about.present(self)
 
+    def _on_diagnostics_clicked(self, _btn):
+        """Show request, retry, cache and render timings."""
+        dialog = Adw.MessageDialog(transient_for=self, heading=_("Diagnostics"))
+        label = Gtk.Label(label=DIAGNOSTICS.format(), selectable=True,
+                          wrap=True, xalign=0)
+        label.add_css_class("monospace")
+        dialog.set_extra_child(label)
+        dialog.add_response("reset", _("Reset"))
+        dialog.add_response("close", _("Close"))
+        dialog.set_close_response("close")
+
+        def on_response(dlg, response):
+            if response == "reset":
+                DIAGNOSTICS.reset()
+
+        dialog.connect("response", on_response)
+        dialog.present()
+
     def _on_info_clicked(self, _btn):
         dialog = Adw.MessageDialog(
             transient_for=self,
@@ -0,0 +1,221 @@
+"""Command-line entry point for headless use (no GTK required).
+
+    elementary-l10n-cli serve --port 9273 --languages sv de
+    elementary-l10n-cli diff --languages sv --json
+    elementary-l10n-cli scan ~/src/elementary --languages sv --compare
+    elementary-l10n-cli site public/ --fetch
+"""
+
+import argparse
+import json
+import locale
+import sys
+import threading
+
+from . import __version__, dashboard, diff, scanner, server, weblate
+
+
+def _default_languages() -> list[str]:
+    """Configured prefetch languages plus the locale's, for fetching."""
+    config = weblate.load_config()
+    codes = list(config.get("prefetch_languages", []))
+    loc = locale.getlocale()[0]
+    if loc and loc not in ("C", "POSIX"):
+        code = None
+        for inst in weblate.load_instances(config):
+            index, _ts = weblate.load_language_index(inst)
+            code = code or (index.lookup(loc) if index else None)
+        codes.append(code or loc.split("_", 1)[0])
+    return list(dict.fromkeys(codes)) or ["sv"]
+
+
+def _stored_languages(instances) -> list[str]:
+    """Every language in the local store of any instance (no network)."""
+    return sorted({code for inst in instances for code in weblate.cached_languages(inst)})
+
+
+def cmd_serve(args) -> int:
+    languages = args.languages or _default_languages()
+    runtime = server.Runtime(languages, args.interval, refresh=not args.no_refresh)
+    httpd = server.serve(runtime, args.host, args.port)
+    runtime.start()
+    print(f"Serving {', '.join(languages)} on http://{args.host}:{httpd.server_address[1]}/metrics",
+          file=sys.stderr)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        runtime.stop()
+        httpd.server_close()
+    return 0
+
+
+def cmd_diff(args) -> int:
+    instances = weblate.load_instances()
+    languages = args.languages or _stored_languages(instances)
+    old = {code: weblate.load_previous_store(code, instances)[0] for code in languages}
+    new = {code: weblate.load_store(code, instances)[0] for code in languages}
+    result = diff.diff_snapshots(old, new, args.min_delta)
+    if args.json:
+        print(result.to_json())
+        return 0
+    labels = {diff.REGRESSED: "Regressed", diff.IMPROVED: "Improved",
+              diff.NEW: "New", diff.REMOVED: "Removed"}
+    for kind in diff.KINDS:
+        changes = result[kind]
+        if not changes:
+            continue
+        print(f"{labels[kind]} ({len(changes)})")
+        for c in changes:
+            old_pct = "-" if c.old is None else f"{c.old:.1f}%"
+            new_pct = "-" if c.new is None else f"{c.new:.1f}%"
+            delta = f" ({c.delta:+.1f})" if kind in (diff.IMPROVED, diff.REGRESSED) else ""
+            print(f"  {c.language:<6} {c.row['project']} / {c.row['component']}: "
+                  f"{old_pct} -> {new_pct}{delta}")
+    if not result:
+        print("No changes since the previous refresh.")
+    return 0
+
+
+def _weblate_rows(code: str, instances) -> list[dict]:
+    """Stored Weblate rows for a language, fetched first if there are none."""
+    rows, _ts = weblate.load_store(code, instances)
+    if rows:
+        return rows
+    done = threading.Event()
+    weblate.fetch_all_data(code, lambda _rows: done.set(),
+                           lambda e: (print(f"Fetching {code} failed: {e}", file=sys.stderr),
+                                      done.set()),
+                           instances=instances, offline_cb=lambda *_a: done.set())
+    done.wait()
+    return weblate.load_store(code, instances)[0]
+
+
+def _match(local: dict, by_key: dict, by_component: dict) -> dict | None:
+    row = by_key.get((local["project_slug"], local["component_slug"]))
+    if row is None:
+        matches = by_component.get(local["component_slug"], ())
+        row = matches[0] if len(matches) == 1 else None
+    return row
+
+
+def cmd_scan(args) -> int:
+    found = scanner.scan(args.paths, args.languages, args.workers)
+    instances = weblate.load_instances() if args.compare else []
+    report = []
+    for code, rows in sorted(found.items()):
+        if args.compare:
+            remote = _weblate_rows(code, instances)
+            by_key = {(r["project_slug"], r["component_slug"]): r for r in remote}
+            by_component = {}
+            for r in remote:
+                by_component.setdefault(r["component_slug"], []).append(r)
+        for row in rows:
+            entry = {"language": code, **row}
+            if args.compare:
+                match = _match(row, by_key, by_component)
+                entry["weblate_percent"] = match["translated_percent"] if match else None
+            report.append(entry)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    if not report:
+        print("No .po files found.")
+    for entry in report:
+        line = (f"{entry['language']:<6} "
+                f"{entry['project']} / {entry['component']}: "
+                f"{entry['translated_percent']:.1f}%")
+        if args.compare:
+            remote = entry["weblate_percent"]
+            if remote is None:
+                line += "  (not on Weblate)"
+            else:
+                line += f"  Weblate {remote:.1f}% ({entry['translated_percent'] - remote:+.1f})"
+        print(line)
+    return 0
+
+
+def cmd_site(args) -> int:
+    instances = weblate.load_instances()
+    codes = args.languages
+    if args.fetch:
+        try:
+            fetched = weblate.fetch_languages(args.languages, instances)
+            codes = codes or sorted(fetched)
+        except weblate.OfflineError as e:
+            print(f"{e} Building from the local store.", file=sys.stderr)
+        except (RuntimeError, OSError) as e:  # 401, 429, HTTP errors
+            print(f"Fetching failed: {e}", file=sys.stderr)
+            return 1
+    if not codes:
+        codes = _stored_languages(instances)
+    data = {code: weblate.load_store(code, instances) for code in codes}
+    data = {code: entry for code, entry in data.items() if entry[0]}
+    if not data:
+        print("Nothing stored yet; run with --fetch.", file=sys.stderr)
+        return 1
+    names = {}
+    for inst in instances:
+        index, _ts = weblate.load_language_index(inst)
+        if index:
+            names.update(index.names)
+    counts = dashboard.build_site(data, args.output, names, force=args.force)
+    print(f"{len(data)} languages: {counts['written']} pages written, "
+          f"{counts['unchanged']} unchanged, {counts['removed']} removed")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="elementary-l10n-cli",
+                                     description="Translation status for Weblate projects.")
+    parser.add_argument("--version", action="version", version=__version__)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("serve", help="serve Prometheus metrics and a JSON API")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=server.DEFAULT_PORT)
+    p.add_argument("--languages", nargs="+", metavar="CODE",
+                   help="languages to serve (default: prefetch languages and the locale's)")
+    p.add_argument("--interval", type=float, default=server.DEFAULT_INTERVAL,
+                   help="seconds between refreshes")
+    p.add_argument("--no-refresh", action="store_true",
+                   help="only serve the local store, never contact Weblate")
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser("diff", help="show what changed in the latest refresh")
+    p.add_argument("--languages", nargs="+", metavar="CODE",
+                   help="languages to compare (default: every stored language)")
+    p.add_argument("--min-delta", type=float, default=0.0,
+                   help="ignore moves of at most this many percentage points")
+    p.add_argument("--json", action="store_true", help="print the diff as JSON")
+    p.set_defaults(func=cmd_diff)
+
+    p = sub.add_parser("scan", help="statistics from local .po files")
+    p.add_argument("paths", nargs="+", metavar="PATH", help="checkouts to search for po/")
+    p.add_argument("--languages", nargs="+", metavar="CODE",
+                   help="languages to report (default: every .po file found)")
+    p.add_argument("--compare", action="store_true",
+                   help="show the Weblate percentage next to each local one")
+    p.add_argument("--workers", type=int, help="parser processes (default: CPU count)")
+    p.add_argument("--json", action="store_true", help="print rows as JSON")
+    p.set_defaults(func=cmd_scan)
+
+    p = sub.add_parser("site", help="build a static HTML status site")
+    p.add_argument("output", help="directory to write the site to")
+    p.add_argument("--languages", nargs="+", metavar="CODE",
+                   help="languages to include (default: all)")
+    p.add_argument("--fetch", action="store_true",
+                   help="refresh every language from Weblate in one pass first")
+    p.add_argument("--force", action="store_true", help="rewrite every page")
+    p.set_defaults(func=cmd_site)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
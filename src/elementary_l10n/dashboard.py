@@ -0,0 +1,220 @@
+"""Static HTML status site: a heatmap per language and per project.
+
+build_site() writes a self-contained site (inline CSS, no scripts or
+external assets) from {language: (rows, fetch timestamp)}:
+
+    index.html                   every language and every project
+    languages/<code>.html        one language, grouped by project
+    projects/<instance>--<slug>.html   one project, components x languages
+
+Names are reduced to safe file names by _slug(), so an instance named
+after a host and path stays one file inside projects/.
+
+Each page's inputs are hashed and recorded in MANIFEST; a page whose
+inputs are unchanged since the last build is neither rendered nor
+written, and pages that are no longer produced are removed.
+"""
+
+import hashlib
+import html
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+from . import rollups
+from .rendering import pct_rgb
+
+MANIFEST = ".manifest.json"
+_VERSION = 2  # bump when the markup changes, to rebuild every page
+
+_CSS = """
+body{font:14px/1.4 system-ui,sans-serif;margin:2em auto;max-width:72em;padding:0 1em;
+color:#333}
+a{color:inherit}
+h1{font-size:1.6em;margin-bottom:.2em}
+h2{font-size:1.15em;margin:1.5em 0 .4em}
+.meta{color:#777;font-size:.9em}
+table{border-collapse:collapse;width:100%}
+th,td{padding:.3em .6em;text-align:left;border-bottom:1px solid #eee}
+td.n{text-align:right;font-variant-numeric:tabular-nums}
+.grid{display:flex;flex-wrap:wrap;gap:6px}
+.tile{width:13em;padding:.5em .7em;border-radius:6px;text-decoration:none;color:#222}
+.tile b{display:block;white-space:nowrap;overflow:hidden;text-overflow:ellipsis}
+.pct{font-size:1.3em;font-variant-numeric:tabular-nums}
+.cell{display:block;text-align:center;border-radius:3px;text-decoration:none;color:#222;
+font-size:.85em}
+"""
+
+
+def _colour(pct: float) -> str:
+    r, g, b = pct_rgb(pct)
+    return f"rgb({r * 255:.0f},{g * 255:.0f},{b * 255:.0f})"
+
+
+def _date(ts: float | None) -> str:
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(ts)) if ts else "never"
+
+
+def _page(title: str, body: str, root: str = "") -> str:
+    e = html.escape
+    return (f'<!DOCTYPE html>\n<html lang="en"><head><meta charset="utf-8">'
+            f'<meta name="viewport" content="width=device-width,initial-scale=1">'
+            f"<title>{e(title)}</title><style>{_CSS}</style></head><body>"
+            f'<p class="meta"><a href="{root}index.html">All languages</a></p>'
+            f"<h1>{e(title)}</h1>{body}</body></html>\n")
+
+
+def _slug(name: str) -> str:
+    """A file name part for name: no separators, no "--", never empty.
+
+    Names that had to change get a short hash, so two of them cannot end
+    up with the same file.
+    """
+    slug = re.sub(r"-{2,}", "-", re.sub(r"[^\w.@-]+", "-", name, flags=re.ASCII))
+    slug = slug.strip("-.")
+    if slug != name or not slug:
+        slug = f"{slug}-{hashlib.sha1(name.encode()).hexdigest()[:8]}".lstrip("-")
+    return slug
+
+
+def language_file(code: str) -> str:
+    return f"languages/{_slug(code)}.html"
+
+
+def project_file(instance: str, project_slug: str) -> str:
+    return f"projects/{_slug(instance)}--{_slug(project_slug)}.html"
+
+
+def _sorted_projects(rows) -> dict[tuple, list]:
+    projects = {}
+    for row in sorted(rows, key=lambda r: (r["project"].lower(), r["component"].lower())):
+        projects.setdefault(rollups.project_key(row), []).append(row)
+    return projects
+
+
+def _index_page(summaries: dict, projects: dict, names: dict) -> str:
+    e = html.escape
+    lines = ["<table><tr><th>Language</th><th>Components</th><th>Complete</th>"
+             "<th>Average</th><th>Words</th><th>Updated</th></tr>"]
+    for code, s in sorted(summaries.items(), key=lambda i: names[i[0]].lower()):
+        lines.append(
+            f'<tr><td><a href="{e(language_file(code))}">{e(names[code])}</a> '
+            f'<span class="meta">{e(code)}</span></td><td class="n">{s["components"]}</td>'
+            f'<td class="n">{s["complete"]}</td>'
+            f'<td class="n" style="background:{_colour(s["average"])}">{s["average"]:.1f}%</td>'
+            f'<td class="n">{s["weighted_average"]:.1f}%</td>'
+            f'<td class="meta">{_date(s["fetched"])}</td></tr>')
+    lines.append("</table><h2>Projects</h2><ul>")
+    for (instance, slug), name in sorted(projects.items(), key=lambda i: i[1].lower()):
+        lines.append(f'<li><a href="{e(project_file(instance, slug))}">{e(name)}</a> '
+                     f'<span class="meta">{e(instance)}</span></li>')
+    lines.append("</ul>")
+    return _page("Translation Status", "".join(lines))
+
+
+def _language_page(code: str, name: str, rows: list, summary: dict) -> str:
+    e = html.escape
+    parts = [f'<p class="meta">{summary["components"]} components · '
+             f'{summary["complete"]} fully translated · average {summary["average"]:.1f}% · '
+             f'word-weighted {summary["weighted_average"]:.1f}%</p>']
+    for (instance, slug), project_rows in _sorted_projects(rows).items():
+        parts.append(f'<h2><a href="../{e(project_file(instance, slug))}">'
+                     f'{e(project_rows[0]["project"])}</a></h2><div class="grid">')
+        for row in project_rows:
+            pct = row["translated_percent"]
+            parts.append(f'<a class="tile" style="background:{_colour(pct)}" '
+                         f'href="{e(row["translate_url"])}"><b>{e(row["component"])}</b>'
+                         f'<span class="pct">{pct:.0f}%</span></a>')
+        parts.append("</div>")
+    return _page(code if name == code else f"{name} ({code})", "".join(parts), "../")
+
+
+def _project_page(name: str, components: dict, codes: list[str]) -> str:
+    e = html.escape
+    parts = ["<table><tr><th>Component</th>"]
+    parts.extend(f'<th><a href="../{e(language_file(c))}">{e(c)}</a></th>' for c in codes)
+    parts.append("</tr>")
+    for component, by_code in components.items():
+        parts.append(f"<tr><td>{e(component)}</td>")
+        for code in codes:
+            row = by_code.get(code)
+            if row is None:
+                parts.append("<td></td>")
+                continue
+            pct = row["translated_percent"]
+            parts.append(f'<td><a class="cell" style="background:{_colour(pct)}" '
+                         f'href="{e(row["translate_url"])}">{pct:.0f}</a></td>')
+        parts.append("</tr>")
+    parts.append("</table>")
+    return _page(name, "".join(parts), "../")
+
+
+def _pages(data: dict, names: dict):
+    """Yield (path, inputs, render) for every page; render() builds the HTML."""
+    index = rollups.RollupIndex()
+    summaries, projects, matrix = {}, {}, {}
+    for code, (rows, ts) in data.items():
+        index.replace(code, rows)
+        r = index.language(code)
+        summaries[code] = {"components": r.count, "complete": r.complete,
+                           "average": round(r.average, 2),
+                           "weighted_average": round(r.weighted_average, 2), "fetched": ts}
+        for row in rows:
+            key = rollups.project_key(row)
+            projects[key] = row["project"]
+            matrix.setdefault(key, {}).setdefault(row["component"], {})[code] = row
+
+    names = {code: names.get(code, code) for code in data}
+    yield ("index.html", [summaries, sorted(projects.items()), names],
+           lambda: _index_page(summaries, projects, names))
+    for code, (rows, _ts) in data.items():
+        name = names[code]
+        # The fetch time is left out, so a refresh without changes keeps the page
+        summary = {k: v for k, v in summaries[code].items() if k != "fetched"}
+        yield (language_file(code), [name, rows, summary],
+               lambda code=code, name=name, rows=rows, summary=summary:
+               _language_page(code, name, rows, summary))
+    codes = sorted(data)
+    for (instance, slug), by_component in matrix.items():
+        components = dict(sorted(by_component.items(), key=lambda i: i[0].lower()))
+        yield (project_file(instance, slug), [projects[(instance, slug)], components, codes],
+               lambda key=(instance, slug), components=components:
+               _project_page(projects[key], components, codes))
+
+
+def _digest(inputs) -> str:
+    text = json.dumps([_VERSION, inputs], sort_keys=True, default=str)
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def build_site(data: dict[str, tuple[list, float | None]], out_dir,
+               names: dict[str, str] | None = None, force: bool = False) -> dict[str, int]:
+    """Write the site for data into out_dir, skipping unchanged pages.
+
+    names maps language codes to display names. Returns counts of pages
+    "written", "unchanged" and "removed".
+    """
+    out = Path(out_dir)
+    try:
+        manifest = {} if force else json.loads((out / MANIFEST).read_text())
+    except Exception:
+        manifest = {}
+    built, counts = {}, {"written": 0, "unchanged": 0, "removed": 0}
+    for path, inputs, render in _pages(data, names or {}):
+        digest = built[path] = _digest(inputs)
+        target = out / path
+        if manifest.get(path) == digest and target.exists():
+            counts["unchanged"] += 1
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".tmp")
+        tmp.write_text(render(), encoding="utf-8")
+        os.replace(tmp, target)
+        counts["written"] += 1
+    for path in manifest.keys() - built.keys():
+        (out / path).unlink(missing_ok=True)
+        counts["removed"] += 1
+    (out / MANIFEST).write_text(json.dumps(built, indent=1, sort_keys=True))
+    return counts
@@ -0,0 +1,225 @@
+"""Fetch and render instrumentation shared by the client and the UI."""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+TRACE_ENV = "ELEMENTARY_L10N_TRACE"
+RECENT_REQUESTS = 200  # per-request timings kept for the diagnostics panel
+RECENT_FRAMES = 600  # frame intervals kept for frame-time percentiles
+IDLE_GAP = 0.25  # frame intervals longer than this are idle time, not jank
+
+
+class Diagnostics:
+    """Thread-safe counters for requests, sleeps, cache and rendering.
+
+    If a trace file is set, every recorded event is also appended to it in
+    Chrome trace-event format (open it in Perfetto or chrome://tracing).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._trace = None
+        self._t0 = time.perf_counter()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.request_time = 0.0
+            self.bytes = 0
+            self.wire_bytes = 0
+            self.statuses = {}
+            self.shared = 0
+            self.retries = 0
+            self.backoff_time = 0.0
+            self.timeouts = 0
+            self.timeout_time = 0.0
+            self.delays = 0
+            self.delay_time = 0.0
+            self.cache_hits = 0
+            self.cache_misses = 0
+            self.renders = 0
+            self.render_time = 0.0
+            self.ui_events = 0
+            self.ui_flushes = 0
+            self.last_render = 0.0
+            self.phases = {}
+            self.recent = deque(maxlen=RECENT_REQUESTS)
+            self.frames = deque(maxlen=RECENT_FRAMES)
+
+    # Trace file
+
+    def start_trace(self, path: str):
+        with self._lock:
+            if self._trace:
+                self._trace.close()
+            self._trace = open(path, "w", encoding="utf-8")
+            # The closing bracket is optional in the trace-event format, which
+            # lets the file be streamed and read even after a crash.
+            self._trace.write("[\n")
+
+    def stop_trace(self):
+        with self._lock:
+            if self._trace:
+                self._trace.close()
+                self._trace = None
+
+    def _emit(self, name: str, cat: str, start: float, dur: float, **args):
+        if not self._trace:
+            return
+        event = {
+            "name": name, "cat": cat, "ph": "X",
+            "ts": int((start - self._t0) * 1e6), "dur": int(dur * 1e6),
+            "pid": os.getpid(), "tid": threading.get_ident(), "args": args,
+        }
+        self._trace.write(json.dumps(event) + ",\n")
+        self._trace.flush()
+
+    # Recording
+
+    def record_request(self, url: str, status: int, start: float, elapsed: float,
+                       size: int, wire: int | None = None):
+        """size is the decoded body; wire the bytes received, if compressed."""
+        with self._lock:
+            self.requests += 1
+            self.request_time += elapsed
+            self.bytes += size
+            self.wire_bytes += size if wire is None else wire
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            self.recent.append((elapsed, status, url))
+            self._emit("GET", "request", start, elapsed, url=url, status=status, bytes=size)
+
+    def record_backoff(self, url: str, wait: float):
+        with self._lock:
+            self.retries += 1
+            self.backoff_time += wait
+            self._emit("429 backoff", "sleep", time.perf_counter(), wait, url=url)
+
+    def record_timeout(self, url: str, wait: float):
+        """A read timeout, retried after wait seconds."""
+        with self._lock:
+            self.timeouts += 1
+            self.timeout_time += wait
+            self._emit("timeout backoff", "sleep", time.perf_counter(), wait, url=url)
+
+    def record_shared(self, url: str):
+        """A request answered by an identical one already in flight."""
+        with self._lock:
+            self.shared += 1
+            self._emit("shared response", "network", time.perf_counter(), 0.0, url=url)
+
+    def record_delay(self, wait: float):
+        with self._lock:
+            self.delays += 1
+            self.delay_time += wait
+            self._emit("rate limit delay", "sleep", time.perf_counter(), wait)
+
+    def record_cache(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+    def record_render(self, start: float, elapsed: float, tiles: int):
+        with self._lock:
+            self.renders += 1
+            self.render_time += elapsed
+            self.last_render = elapsed
+            self._emit("render", "ui", start, elapsed, tiles=tiles)
+
+    def record_ui_flush(self, events: int):
+        """One main-loop delivery of events posted by worker threads."""
+        with self._lock:
+            self.ui_flushes += 1
+            self.ui_events += events
+
+    def record_frame(self, interval: float):
+        """Record the time between two consecutive painted frames."""
+        if interval <= IDLE_GAP:
+            with self._lock:
+                self.frames.append(interval)
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a named phase of a refresh (e.g. discovery, statistics)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.phases[name] = elapsed
+                self._emit(name, "phase", start, elapsed)
+
+    # Reporting
+
+    def summary(self) -> dict:
+        with self._lock:
+            lookups = self.cache_hits + self.cache_misses
+            slowest = sorted(self.recent, reverse=True)[:5]
+            frames = sorted(self.frames)
+            return {
+                "requests": self.requests,
+                "request_time": self.request_time,
+                "avg_request": self.request_time / self.requests if self.requests else 0.0,
+                "bytes": self.bytes,
+                "wire_bytes": self.wire_bytes,
+                "statuses": dict(self.statuses),
+                "shared": self.shared,
+                "retries": self.retries,
+                "backoff_time": self.backoff_time,
+                "timeouts": self.timeouts,
+                "timeout_time": self.timeout_time,
+                "delays": self.delays,
+                "delay_time": self.delay_time,
+                "cache_hit_rate": self.cache_hits / lookups if lookups else 0.0,
+                "cache_lookups": lookups,
+                "renders": self.renders,
+                "render_time": self.render_time,
+                "last_render": self.last_render,
+                "ui_events": self.ui_events,
+                "ui_flushes": self.ui_flushes,
+                "frames": len(frames),
+                "frame_avg": sum(frames) / len(frames) if frames else 0.0,
+                "frame_p95": frames[int(len(frames) * 0.95)] if frames else 0.0,
+                "phases": dict(self.phases),
+                "slowest": [{"url": u, "status": s, "elapsed": e} for e, s, u in slowest],
+            }
+
+    def format(self) -> str:
+        s = self.summary()
+        statuses = ", ".join(f"{k}: {v}" for k, v in sorted(s["statuses"].items())) or "-"
+        lines = [
+            f"Requests: {s['requests']} ({statuses})",
+            f"Network time: {s['request_time']:.2f}s "
+            f"(avg {s['avg_request'] * 1000:.0f} ms, {s['bytes'] / 1024:.1f} KiB, "
+            f"{s['wire_bytes'] / 1024:.1f} KiB on the wire)",
+            f"Shared in-flight responses: {s['shared']}",
+            f"Rate-limit delays: {s['delays']} ({s['delay_time']:.2f}s)",
+            f"429 retries: {s['retries']} ({s['backoff_time']:.2f}s backoff)",
+            f"Read-timeout retries: {s['timeouts']} ({s['timeout_time']:.2f}s backoff)",
+            f"Cache hit rate: {s['cache_hit_rate']:.0%} of {s['cache_lookups']} lookups",
+            f"Renders: {s['renders']} ({s['render_time'] * 1000:.0f} ms total, "
+            f"last {s['last_render'] * 1000:.1f} ms)",
+        ]
+        if s["ui_flushes"]:
+            lines.append(f"UI updates: {s['ui_events']} events in {s['ui_flushes']} flushes")
+        if s["frames"]:
+            lines.append(f"Frames: {s['frames']} (avg {s['frame_avg'] * 1000:.1f} ms, "
+                         f"p95 {s['frame_p95'] * 1000:.1f} ms)")
+        for name, elapsed in s["phases"].items():
+            lines.append(f"Phase {name}: {elapsed:.2f}s")
+        for r in s["slowest"]:
+            lines.append(f"Slow: {r['elapsed'] * 1000:.0f} ms {r['status']} {r['url']}")
+        return "\n".join(lines)
+
+
+DIAGNOSTICS = Diagnostics()
+
+if os.environ.get(TRACE_ENV):
+    DIAGNOSTICS.start_trace(os.environ[TRACE_ENV])
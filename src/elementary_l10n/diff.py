@@ -0,0 +1,116 @@
+"""Snapshot diffs: which components are new, removed, improved or regressed.
+
+Rows are matched on (instance, project_slug, component_slug, language)
+with one dictionary pass over each side, so a diff costs O(n + m); only
+the changed rows are sorted.
+"""
+
+import json
+
+NEW = "new"
+REMOVED = "removed"
+IMPROVED = "improved"
+REGRESSED = "regressed"
+KINDS = (REGRESSED, IMPROVED, NEW, REMOVED)
+
+
+class Change:
+    __slots__ = ("kind", "language", "row", "old", "new")
+
+    def __init__(self, kind: str, language: str, row: dict,
+                 old: float | None, new: float | None):
+        self.kind = kind
+        self.language = language
+        self.row = row
+        self.old = old
+        self.new = new
+
+    @property
+    def delta(self) -> float:
+        return (self.new or 0.0) - (self.old or 0.0)
+
+    def to_dict(self) -> dict:
+        return {
+            "kind": self.kind, "language": self.language,
+            "instance": self.row.get("instance", ""),
+            "project": self.row["project"], "project_slug": self.row["project_slug"],
+            "component": self.row["component"], "component_slug": self.row["component_slug"],
+            "old": self.old, "new": self.new, "delta": round(self.delta, 2),
+        }
+
+
+class Diff:
+    """Changes grouped by kind; regressions and improvements largest first."""
+
+    def __init__(self):
+        self.changes = {kind: [] for kind in KINDS}
+        self.unchanged = 0
+
+    def __bool__(self):
+        return any(self.changes.values())
+
+    def __len__(self):
+        return sum(len(c) for c in self.changes.values())
+
+    def __getitem__(self, kind: str) -> list[Change]:
+        return self.changes[kind]
+
+    def counts(self) -> dict[str, int]:
+        return {kind: len(c) for kind, c in self.changes.items()}
+
+    def _finish(self):
+        self.changes[REGRESSED].sort(key=lambda c: c.delta)
+        self.changes[IMPROVED].sort(key=lambda c: -c.delta)
+        return self
+
+    def to_dict(self) -> dict:
+        return {"counts": self.counts(), "unchanged": self.unchanged,
+                **{kind: [c.to_dict() for c in changes]
+                   for kind, changes in self.changes.items()}}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+
+def _key(row: dict) -> tuple:
+    return (row.get("instance", ""), row["project_slug"], row["component_slug"])
+
+
+def _diff_into(result: Diff, old_rows, new_rows, language: str, min_delta: float):
+    old = {_key(r): r for r in old_rows}
+    for row in new_rows:
+        prev = old.pop(_key(row), None)
+        pct = row["translated_percent"]
+        if prev is None:
+            result.changes[NEW].append(Change(NEW, language, row, None, pct))
+            continue
+        before = prev["translated_percent"]
+        if pct - before > min_delta:
+            result.changes[IMPROVED].append(Change(IMPROVED, language, row, before, pct))
+        elif before - pct > min_delta:
+            result.changes[REGRESSED].append(Change(REGRESSED, language, row, before, pct))
+        else:
+            result.unchanged += 1
+    for row in old.values():
+        result.changes[REMOVED].append(
+            Change(REMOVED, language, row, row["translated_percent"], None))
+
+
+def diff_rows(old_rows, new_rows, language: str = "", min_delta: float = 0.0) -> Diff:
+    """Diff two row lists of one language.
+
+    Percentage moves of at most min_delta points count as unchanged.
+    """
+    result = Diff()
+    _diff_into(result, old_rows, new_rows, language, min_delta)
+    return result._finish()
+
+
+def diff_snapshots(old: dict[str, list], new: dict[str, list],
+                   min_delta: float = 0.0) -> Diff:
+    """Diff {language: rows} snapshots; languages on one side only are
+    entirely new or removed."""
+    result = Diff()
+    for language in dict.fromkeys([*old, *new]):
+        _diff_into(result, old.get(language, ()), new.get(language, ()), language, min_delta)
+    return result._finish()
@@ -0,0 +1,81 @@
+"""Worker-thread to UI event channel, delivered at most once per frame.
+
+Fetch threads report progress for every component and may hand over
+several row batches in quick succession. Scheduling a main-loop callback
+for each one floods the loop; an EventChannel instead collects events
+under a lock and asks the UI to flush them once. Until that flush runs,
+further events only join the batch, where newer events can replace or
+absorb pending ones (the latest progress wins, row batches are merged),
+so the UI can render once for the whole batch.
+"""
+
+import threading
+from typing import Callable
+
+from .diagnostics import DIAGNOSTICS
+
+
+class EventChannel:
+    """Thread-safe mailbox for the main loop.
+
+    handlers maps event kinds to main-thread callables. schedule(flush)
+    must arrange for flush() to run once on the UI thread; it is called
+    from whichever thread posts the first event of a batch. Events are
+    delivered in the order they were posted, except that:
+
+    - replaces maps a kind to the kinds a new event of it makes obsolete;
+      pending events of those kinds are dropped (default: newer progress
+      replaces older progress). With scope(kind, args), only pending
+      events in the same scope are dropped, e.g. rows of the same language.
+    - combine maps a kind to f(old_args, new_args), which returns the args
+      of one event standing for both, or None to keep them apart; it is
+      applied to the latest pending event of the same kind.
+    """
+
+    def __init__(self, handlers: dict[str, Callable], schedule: Callable[[Callable], None],
+                 replaces: dict[str, tuple[str, ...]] | None = None,
+                 combine: dict[str, Callable] | None = None,
+                 scope: Callable[[str, tuple], object] | None = None):
+        self._handlers = handlers
+        self._schedule = schedule
+        self._replaces = replaces if replaces is not None else {"progress": ("progress",)}
+        self._combine = combine or {}
+        self._scope = scope or (lambda _kind, _args: None)
+        self._lock = threading.Lock()
+        self._pending = []
+        self._scheduled = False
+
+    def post(self, kind: str, *args):
+        """Queue an event from any thread."""
+        with self._lock:
+            self._add(kind, args)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._schedule(self.flush)
+
+    def _add(self, kind: str, args: tuple):
+        obsolete = self._replaces.get(kind)
+        if obsolete:
+            scope = self._scope(kind, args)
+            self._pending = [e for e in self._pending
+                             if e[0] not in obsolete or self._scope(*e) != scope]
+        combine = self._combine.get(kind)
+        if combine:
+            for i in range(len(self._pending) - 1, -1, -1):
+                if self._pending[i][0] == kind:
+                    merged = combine(self._pending[i][1], args)
+                    if merged is not None:
+                        self._pending[i] = (kind, merged)
+                        return
+                    break
+        self._pending.append((kind, args))
+
+    def flush(self):
+        """Deliver everything posted so far (UI thread)."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._scheduled = False
+        DIAGNOSTICS.record_ui_flush(len(pending))
+        for kind, args in pending:
+            self._handlers[kind](*args)
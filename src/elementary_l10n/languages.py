@@ -0,0 +1,54 @@
+"""Language catalog: the languages a server knows and which projects have them.
+
+Built from /api/languages/ and /api/projects/<slug>/languages/ (see
+weblate.language_index) and cached for LANGUAGES_TTL. Lookups by code or
+by locale ("sv_SE.UTF-8", "pt-BR") are dictionary hits.
+"""
+
+
+def normalize(locale_name: str) -> str:
+    """"pt-BR.UTF-8@euro" -> "pt_br", the form used as index key."""
+    return locale_name.split(".")[0].split("@")[0].replace("-", "_").lower()
+
+
+class LanguageIndex:
+    """Language names plus, when known, the language codes of each project."""
+
+    def __init__(self, names: dict[str, str], projects: dict[str, list[str]] | None = None):
+        self.names = dict(names)
+        self.projects = {slug: set(codes) for slug, codes in (projects or {}).items()}
+        self._by_key = {normalize(code): code for code in self.names}
+        self._translated = set().union(*self.projects.values()) if self.projects else None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LanguageIndex":
+        return cls(data.get("names", {}), data.get("projects"))
+
+    def to_dict(self) -> dict:
+        return {"names": self.names,
+                "projects": {slug: sorted(codes) for slug, codes in self.projects.items()}}
+
+    def merge(self, other: "LanguageIndex") -> "LanguageIndex":
+        """Union of two indexes, e.g. across instances."""
+        projects = {slug: set(codes) for slug, codes in self.projects.items()}
+        for slug, codes in other.projects.items():
+            projects.setdefault(slug, set()).update(codes)
+        return LanguageIndex({**other.names, **self.names}, projects)
+
+    def lookup(self, locale_name: str) -> str | None:
+        """Code for a locale, trying the full locale first, then the language."""
+        key = normalize(locale_name)
+        return self._by_key.get(key) or self._by_key.get(key.split("_")[0])
+
+    def has_translations(self, code: str) -> bool:
+        """True if any project has the language (or project data is missing)."""
+        return self._translated is None or code in self._translated
+
+    def project_has(self, project_slug: str, code: str) -> bool:
+        codes = self.projects.get(project_slug)
+        return codes is None or code in codes
+
+    def choices(self) -> list[tuple[str, str]]:
+        """(code, name) of languages with translations, sorted by name."""
+        return sorted(((code, name) for code, name in self.names.items()
+                       if self.has_translations(code)), key=lambda item: item[1].lower())
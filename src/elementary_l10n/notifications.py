@@ -0,0 +1,156 @@
+"""Notification engine: diff snapshots, batch changes and rate limit alerts."""
+
+import json
+import time
+from gettext import gettext as _
+from pathlib import Path
+
+from .weblate import CONFIG_DIR, DEFAULT_INSTANCE_NAME
+
+STATE_FILE = CONFIG_DIR / "notify-state.json"
+
+# Per-rule defaults. "threshold" is a percentage for "low" and a
+# percentage-point drop for "regressed"; "min_interval" is in seconds.
+DEFAULT_RULES = {
+    "low": {"enabled": True, "threshold": 50.0, "min_interval": 3600},
+    "regressed": {"enabled": True, "threshold": 5.0, "min_interval": 900},
+    "completed": {"enabled": True, "min_interval": 0},
+    "new": {"enabled": True, "min_interval": 3600},
+}
+
+MAX_NAMES = 3  # component names listed per rule in the notification body
+
+
+def _row_key(row: dict) -> str:
+    key = f"{row['project_slug']}/{row['component_slug']}"
+    instance = row.get("instance", DEFAULT_INSTANCE_NAME)
+    return key if instance == DEFAULT_INSTANCE_NAME else f"{instance}:{key}"
+
+
+def _merge_rules(rules: dict | None) -> dict:
+    merged = {name: dict(opts) for name, opts in DEFAULT_RULES.items()}
+    for name, opts in (rules or {}).items():
+        if name in merged and isinstance(opts, dict):
+            merged[name].update(opts)
+    return merged
+
+
+def _detect(rule: str, opts: dict, prev: float | None, pct: float,
+            baseline: bool) -> bool:
+    """Return True if the change prev -> pct triggers the given rule."""
+    if rule == "low":
+        threshold = opts["threshold"]
+        was_low = prev is not None and 0 < prev < threshold
+        return 0 < pct < threshold and not was_low
+    if baseline or prev is None:
+        return rule == "new" and not baseline and prev is None
+    if rule == "regressed":
+        return prev - pct >= opts["threshold"]
+    if rule == "completed":
+        return pct >= 100 and prev < 100
+    return False
+
+
+class NotificationEngine:
+    """Turn successive snapshots into at most one batched notification.
+
+    The last processed snapshot per language, pending (rate limited)
+    events and the time each rule last fired are persisted in STATE_FILE,
+    so the same change is announced once even across restarts.
+    """
+
+    def __init__(self, rules: dict | None = None, state_file: Path = STATE_FILE):
+        self._rules = _merge_rules(rules)
+        self._state_file = state_file
+        self._state = self._load_state()
+
+    def _load_state(self) -> dict:
+        try:
+            state = json.loads(self._state_file.read_text())
+        except Exception:
+            state = {}
+        state.setdefault("languages", {})
+        state.setdefault("last_sent", {})
+        return state
+
+    def _save_state(self):
+        try:
+            self._state_file.parent.mkdir(parents=True, exist_ok=True)
+            self._state_file.write_text(json.dumps(self._state))
+        except Exception:
+            pass
+
+    def process(self, language_code: str, rows: list[dict]) -> tuple[str, str] | None:
+        """Diff rows against the last snapshot; return (summary, body) or None."""
+        lang_state = self._state["languages"].setdefault(
+            language_code, {"snapshot": None, "pending": {}})
+        seen = lang_state["snapshot"]
+        baseline = seen is None
+        seen = seen or {}
+        pending = lang_state["pending"]
+
+        snapshot = {}
+        for row in rows:
+            key = _row_key(row)
+            pct = row["translated_percent"]
+            snapshot[key] = pct
+            prev = seen.get(key)
+            if prev == pct and not baseline:
+                continue
+            for rule, opts in self._rules.items():
+                if opts.get("enabled") and _detect(rule, opts, prev, pct, baseline):
+                    pending.setdefault(rule, {})[key] = {
+                        "name": row["component"], "from": prev, "to": pct}
+
+        # Drop pending events that no longer hold (e.g. a component recovered)
+        for rule, events in pending.items():
+            opts = self._rules.get(rule, {})
+            for key in list(events):
+                pct = snapshot.get(key)
+                if pct is None or (rule == "low" and not 0 < pct < opts["threshold"]):
+                    del events[key]
+
+        now = time.time()
+        due = {}
+        for rule, events in pending.items():
+            if not events:
+                continue
+            last = self._state["last_sent"].get(rule, 0)
+            if now - last >= self._rules.get(rule, {}).get("min_interval", 0):
+                due[rule] = events
+        for rule in due:
+            pending[rule] = {}
+            self._state["last_sent"][rule] = now
+
+        lang_state["snapshot"] = snapshot
+        self._save_state()
+        return self._format(due) if due else None
+
+    def _format(self, due: dict) -> tuple[str, str]:
+        lines = []
+        for rule in DEFAULT_RULES:
+            events = due.get(rule)
+            if not events:
+                continue
+            count = len(events)
+            if rule == "low":
+                line = _("{count} components below {threshold}%").format(
+                    count=count, threshold=f"{self._rules['low']['threshold']:.0f}")
+            elif rule == "regressed":
+                line = _("{count} components regressed").format(count=count)
+            elif rule == "completed":
+                line = _("{count} components fully translated").format(count=count)
+            else:
+                line = _("{count} new components").format(count=count)
+            names = sorted(e["name"] for e in events.values())
+            shown = ", ".join(names[:MAX_NAMES])
+            if count > MAX_NAMES:
+                shown += " " + _("and {count} more").format(count=count - MAX_NAMES)
+            lines.append(f"{line}: {shown}")
+
+        if list(due) == ["low"]:
+            summary = _("elementary L10n: Low translations")
+        else:
+            summary = _("elementary L10n: {count} translation updates").format(
+                count=sum(len(e) for e in due.values()))
+        return summary, "\n".join(lines)
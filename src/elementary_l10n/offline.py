@@ -0,0 +1,68 @@
+"""Offline mode: queueing refreshes and replaying them when back online.
+
+While offline the app serves every view from the local store (see
+weblate.load_store) and records each refresh it could not make in an
+OfflineQueue. Once a server answers again (weblate.check_health),
+replay() fetches the queued languages one after another on a single
+thread, so the batch shares the normal per-server rate limit instead of
+bursting.
+"""
+
+import json
+import threading
+from typing import Callable
+
+from . import weblate
+
+RETRY_INTERVAL = 60  # seconds between reachability checks while offline
+
+
+class OfflineQueue:
+    """Languages whose refresh was requested while offline, oldest first.
+
+    Persisted next to the cache, so a queue survives restarting the app.
+    """
+
+    def __init__(self, path=None):
+        self._path = path or weblate.CACHE_DIR / "offline-queue.json"
+        self._lock = threading.Lock()
+        try:
+            self._languages = list(json.loads(self._path.read_text()))
+        except Exception:
+            self._languages = []
+
+    def __len__(self):
+        return len(self._languages)
+
+    def add(self, language_code: str):
+        with self._lock:
+            if language_code in self._languages:
+                return
+            self._languages.append(language_code)
+            self._save()
+
+    def take(self) -> list[str]:
+        """Remove and return everything queued."""
+        with self._lock:
+            languages, self._languages = self._languages, []
+            self._save()
+            return languages
+
+    def _save(self):
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._path.write_text(json.dumps(self._languages))
+        except Exception:
+            pass
+
+
+def replay(languages: list[str], done_cb: Callable | None = None,
+           instances: list | None = None) -> threading.Thread:
+    """Refresh the store for queued languages in the background.
+
+    Languages are fetched sequentially at background priority, so a
+    refresh of the current language runs first and the batch shares the
+    per-server request slots. done_cb(fetched, failed) runs on the worker
+    thread with lists of language codes.
+    """
+    return weblate.prefetch_languages(languages, done_cb, instances, max_age=0)
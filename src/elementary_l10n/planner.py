@@ -0,0 +1,68 @@
+"""Watch lists and fetch planning.
+
+Users pin projects and components in config.json:
+
+    "watch": {"projects": ["desktop"], "components": ["apps/files"]}
+
+The planner splits the statistics work so pinned items are fetched first
+at the normal rate, and the rest of the catalog afterwards at a lower one.
+"""
+
+BACKGROUND_DELAY_FACTOR = 2.0  # REQUEST_DELAY multiplier for the full refresh
+
+
+class WatchList:
+    """Pinned project slugs and "project/component" keys."""
+
+    def __init__(self, projects=(), components=()):
+        self.projects = set(projects)
+        self.components = set(components)
+
+    @classmethod
+    def from_config(cls, config: dict) -> "WatchList":
+        watch = config.get("watch") or {}
+        return cls(watch.get("projects", []), watch.get("components", []))
+
+    def to_config(self) -> dict:
+        return {"projects": sorted(self.projects), "components": sorted(self.components)}
+
+    def __bool__(self):
+        return bool(self.projects or self.components)
+
+    def wants_project(self, project_slug: str) -> bool:
+        """True if the project or any of its components is pinned."""
+        if project_slug in self.projects:
+            return True
+        prefix = f"{project_slug}/"
+        return any(key.startswith(prefix) for key in self.components)
+
+    def is_pinned(self, project_slug: str, component_slug: str) -> bool:
+        return (project_slug in self.projects
+                or f"{project_slug}/{component_slug}" in self.components)
+
+    def toggle_component(self, project_slug: str, component_slug: str) -> bool:
+        """Pin or unpin a component; returns the new pinned state."""
+        key = f"{project_slug}/{component_slug}"
+        if key in self.components:
+            self.components.discard(key)
+            return False
+        self.components.add(key)
+        return True
+
+
+def split_projects(projects: list[dict], watch: WatchList) -> tuple[list[dict], list[dict]]:
+    """Split projects into (needed for pinned items, everything else)."""
+    pinned, rest = [], []
+    for proj in projects:
+        (pinned if watch.wants_project(proj["slug"]) else rest).append(proj)
+    return pinned, rest
+
+
+def split_tasks(tasks: list[tuple[dict, dict]],
+                watch: WatchList) -> tuple[list[tuple[dict, dict]], list[tuple[dict, dict]]]:
+    """Split (project, component) tasks into (pinned, rest), keeping order."""
+    pinned, rest = [], []
+    for proj, comp in tasks:
+        target = pinned if watch.is_pinned(proj["slug"], comp["slug"]) else rest
+        target.append((proj, comp))
+    return pinned, rest
@@ -1,6 +1,23 @@
-"""Print to PDF helper using GtkPrintOperation or cairo."""
+"""Report rendering to PDF/SVG with cairo, and printing via GtkPrintOperation.
+
+The report (summary, heatmap and full component table) is laid out with a
+fixed number of items per page, so any page can be drawn on its own.
+render_report() streams pages straight to a cairo PDFSurface/SVGSurface
+without a display; print_to_pdf() feeds the same pages to Gtk.PrintOperation.
+"""
+import math
 import os
+import threading
 import time
+
+from .rendering import pct_rgb
+
+try:
+    import cairo
+    HAS_CAIRO = True
+except ImportError:
+    HAS_CAIRO = False
+
 try:
     import gi
     gi.require_version('Gtk', '4.0')
@@ -8,30 +25,205 @@ try:
 except Exception:
     pass
 
+PAGE_SIZES = {"a4": (595.28, 841.89), "letter": (612.0, 792.0)}  # points
+MARGIN = 42
+HEADER_H = 64
+FOOTER_H = 20
+CELL = 10  # heatmap square size
+CELL_GAP = 2
+ROW_H = 14  # table row height
+
+
+def _fit(cr, text: str, width: float) -> str:
+    """Truncate text with an ellipsis so it fits in width."""
+    if cr.text_extents(text).x_advance <= width:
+        return text
+    while text and cr.text_extents(text + "…").x_advance > width:
+        text = text[:-1]
+    return text + "…"
+
+
+class ReportLayout:
+    """Paginated layout of a component report.
+
+    rows is any sequence of row dicts (as produced by weblate.fetch_all_data);
+    pages only index into it, so nothing per-page is kept in memory.
+    """
 
-def print_to_pdf(widget, title="Document", output_dir=None):
-    """Save widget content as PDF using Gtk.PrintOperation."""
+    def __init__(self, rows, title="Translation Status", page_size="a4",
+                 timestamp: str | None = None):
+        self.rows = rows
+        self.title = title
+        self.width, self.height = PAGE_SIZES.get(page_size, PAGE_SIZES["a4"])
+        self.timestamp = timestamp or time.strftime("%Y-%m-%d %H:%M")
+
+        n = len(rows)
+        self.count = n
+        self.complete = sum(1 for r in rows if r["translated_percent"] >= 100)
+        self.average = sum(r["translated_percent"] for r in rows) / n if n else 0.0
+
+        body_w = self.width - 2 * MARGIN
+        body_h = self.height - 2 * MARGIN - HEADER_H - FOOTER_H
+        self.cols = max(1, int((body_w + CELL_GAP) // (CELL + CELL_GAP)))
+        self.heat_per_page = self.cols * max(1, int((body_h + CELL_GAP) // (CELL + CELL_GAP)))
+        self.table_per_page = max(1, int(body_h // ROW_H) - 1)  # minus column header
+        self.heat_pages = math.ceil(n / self.heat_per_page)
+        self.table_pages = math.ceil(n / self.table_per_page)
+        self.n_pages = max(1, self.heat_pages + self.table_pages)
+
+    def draw_page(self, cr, page_nr: int):
+        """Draw page page_nr (0-based) onto a cairo context."""
+        cr.select_font_face("Sans")
+        self._draw_header(cr, page_nr)
+        if page_nr < self.heat_pages:
+            self._draw_heatmap(cr, page_nr)
+        elif self.count:
+            self._draw_table(cr, page_nr - self.heat_pages)
+        cr.set_source_rgb(0.4, 0.4, 0.4)
+        cr.set_font_size(8)
+        cr.move_to(MARGIN, self.height - MARGIN)
+        cr.show_text(f"{page_nr + 1} / {self.n_pages}")
+
+    def _draw_header(self, cr, page_nr: int):
+        cr.set_source_rgb(0, 0, 0)
+        cr.set_font_size(16)
+        cr.move_to(MARGIN, MARGIN + 16)
+        cr.show_text(f"{self.title} — {self.timestamp}")
+        cr.set_font_size(9)
+        cr.set_source_rgb(0.3, 0.3, 0.3)
+        cr.move_to(MARGIN, MARGIN + 34)
+        cr.show_text(
+            f"{self.count} components · {self.complete} fully translated · "
+            f"Average: {self.average:.1f}%")
+
+    def _draw_heatmap(self, cr, page: int):
+        start = page * self.heat_per_page
+        top = MARGIN + HEADER_H
+        for i in range(start, min(start + self.heat_per_page, self.count)):
+            idx = i - start
+            x = MARGIN + (idx % self.cols) * (CELL + CELL_GAP)
+            y = top + (idx // self.cols) * (CELL + CELL_GAP)
+            cr.set_source_rgb(*pct_rgb(self.rows[i]["translated_percent"]))
+            cr.rectangle(x, y, CELL, CELL)
+            cr.fill()
+
+    def _draw_table(self, cr, page: int):
+        start = page * self.table_per_page
+        body_w = self.width - 2 * MARGIN
+        col_project = MARGIN
+        col_component = MARGIN + body_w * 0.3
+        col_bar = MARGIN + body_w * 0.72
+        bar_w = body_w * 0.18
+        col_pct = MARGIN + body_w
+        y = MARGIN + HEADER_H + ROW_H - 3
+
+        cr.set_font_size(9)
+        cr.set_source_rgb(0, 0, 0)
+        for x, text in ((col_project, "Project"), (col_component, "Component"),
+                        (col_bar, "Progress")):
+            cr.move_to(x, y)
+            cr.show_text(text)
+
+        cr.set_font_size(8)
+        for i in range(start, min(start + self.table_per_page, self.count)):
+            row = self.rows[i]
+            pct = row["translated_percent"]
+            y += ROW_H
+            cr.set_source_rgb(0.1, 0.1, 0.1)
+            cr.move_to(col_project, y)
+            cr.show_text(_fit(cr, row["project"], col_component - col_project - 6))
+            cr.move_to(col_component, y)
+            cr.show_text(_fit(cr, row["component"], col_bar - col_component - 6))
+            cr.set_source_rgb(0.85, 0.85, 0.85)
+            cr.rectangle(col_bar, y - 7, bar_w, 7)
+            cr.fill()
+            cr.set_source_rgb(*pct_rgb(pct))
+            cr.rectangle(col_bar, y - 7, bar_w * min(pct, 100) / 100, 7)
+            cr.fill()
+            text = f"{pct:.0f}%"
+            cr.set_source_rgb(0.1, 0.1, 0.1)
+            cr.move_to(col_pct - cr.text_extents(text).x_advance, y)
+            cr.show_text(text)
+
+
+def render_report(rows, path: str, fmt: str = "pdf", title: str = "Translation Status",
+                  page_size: str = "a4") -> list[str]:
+    """Render a report headlessly; returns the written file paths.
+
+    PDF output is a single multi-page file. SVG has no pages, so each page
+    goes to its own file (report-001.svg, report-002.svg, ...). Pages are
+    emitted one at a time, so memory stays flat for thousands of rows.
+    """
+    if not HAS_CAIRO:
+        raise RuntimeError("Report rendering requires pycairo")
+    layout = ReportLayout(rows, title, page_size)
+    if fmt == "pdf":
+        surface = cairo.PDFSurface(path, layout.width, layout.height)
+        cr = cairo.Context(surface)
+        for page in range(layout.n_pages):
+            layout.draw_page(cr, page)
+            cr.show_page()
+        surface.finish()
+        return [path]
+    if fmt == "svg":
+        root, ext = os.path.splitext(path)
+        paths = []
+        for page in range(layout.n_pages):
+            page_path = path if layout.n_pages == 1 else f"{root}-{page + 1:03d}{ext or '.svg'}"
+            surface = cairo.SVGSurface(page_path, layout.width, layout.height)
+            layout.draw_page(cairo.Context(surface), page)
+            surface.finish()
+            paths.append(page_path)
+        return paths
+    raise ValueError(f"Unknown report format: {fmt}")
+
+
+def render_report_async(rows, path: str, callback, error_cb, fmt: str = "pdf",
+                        title: str = "Translation Status", page_size: str = "a4"):
+    """Render a report on a background thread.
+
+    callback(paths) on success, error_cb(exception) on failure; both run on
+    the worker thread, so GUI callers wrap them in GLib.idle_add.
+    """
+    rows = list(rows)  # snapshot: the caller may replace its list meanwhile
+
+    def _worker():
+        try:
+            callback(render_report(rows, path, fmt, title, page_size))
+        except Exception as e:
+            error_cb(e)
+
+    t = threading.Thread(target=_worker, daemon=True)
+    t.start()
+    return t
+
+
+def print_to_pdf(widget, title="Document", output_dir=None, rows=None):
+    """Save a report as PDF using Gtk.PrintOperation.
+
+    With rows, the full paginated report is exported; without, only the
+    title page.
+    """
     if output_dir is None:
         output_dir = GLib.get_user_special_dir(GLib.UserDirectory.DIRECTORY_DOCUMENTS) or os.path.expanduser("~")
-    
+
     timestamp = time.strftime("%Y%m%d_%H%M%S")
     filename = f"{title.replace(' ', '_')}_{timestamp}.pdf"
     filepath = os.path.join(output_dir, filename)
-    
+
     print_op = Gtk.PrintOperation()
     print_op.set_export_filename(filepath)
-    
+    layout = ReportLayout(rows or [], title)
+
     def on_draw_page(op, context, page_nr):
         cr = context.get_cairo_context()
-        cr.set_source_rgb(0, 0, 0)
-        cr.select_font_face("Sans")
-        cr.set_font_size(12)
-        cr.move_to(72, 72)
-        cr.show_text(f"{title} — {time.strftime('%Y-%m-%d %H:%M')}")
-        
+        # The print context is already offset by the page margins
+        cr.scale(context.get_width() / layout.width, context.get_height() / layout.height)
+        layout.draw_page(cr, page_nr)
+
     print_op.connect("draw-page", on_draw_page)
-    print_op.set_n_pages(1)
-    
+    print_op.set_n_pages(layout.n_pages)
+
     try:
         result = print_op.run(Gtk.PrintOperationAction.EXPORT, None)
         if result == Gtk.PrintOperationResult.APPLY:
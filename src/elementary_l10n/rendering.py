@@ -0,0 +1,91 @@
+"""Shared rendering layer: colour palette and cached tile textures.
+
+There are only 101 distinct integer percentages, so the colour ramp is
+precomputed once and tile backgrounds are rendered once per (percent,
+size, scale) into a Gdk.Texture. Tiles then show the texture with a
+Gtk.Picture, and GTK scales/composites it without calling back into
+Python when the heatmap scrolls or the window is resized.
+"""
+
+import sys
+
+try:
+    import cairo
+    import gi
+    gi.require_version("Gdk", "4.0")
+    from gi.repository import Gdk, GLib
+    HAS_GDK = True
+except (ImportError, ValueError):
+    HAS_GDK = False
+
+TILE_WIDTH = 200
+TILE_HEIGHT = 80
+BAR_HEIGHT = 4
+
+
+def _ramp(pct: float) -> tuple[float, float, float]:
+    """Map 0-100% to red→yellow→green."""
+    if pct < 50:
+        return 0.9, 0.2 + (pct / 50) * 0.7, 0.2
+    return 0.9 - ((pct - 50) / 50) * 0.7, 0.9, 0.2
+
+
+PALETTE = tuple(_ramp(p) for p in range(101))
+
+
+def bucket(pct: float) -> int:
+    """Clamp and round a percentage to a palette index."""
+    return min(100, max(0, int(round(pct))))
+
+
+def pct_rgb(pct: float) -> tuple[float, float, float]:
+    return PALETTE[bucket(pct)]
+
+
+class TileTextures:
+    """Cache of tile background textures keyed by (bucket, size, scale)."""
+
+    def __init__(self):
+        self._cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, pct: float, width: int = TILE_WIDTH, height: int = TILE_HEIGHT,
+            scale: int = 1) -> "Gdk.Texture":
+        key = (bucket(pct), width, height, scale)
+        texture = self._cache.get(key)
+        if texture is None:
+            self.misses += 1
+            texture = self._cache[key] = self._render(*key)
+        else:
+            self.hits += 1
+        return texture
+
+    def _render(self, b: int, width: int, height: int, scale: int) -> "Gdk.Texture":
+        w, h = width * scale, height * scale
+        bar = BAR_HEIGHT * scale
+        r, g, bl = PALETTE[b]
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, w, h)
+        cr = cairo.Context(surface)
+        # Background with heatmap color at low opacity
+        cr.set_source_rgba(r, g, bl, 0.15)
+        cr.rectangle(0, 0, w, h)
+        cr.fill()
+        # Progress bar at bottom
+        cr.set_source_rgba(r, g, bl, 0.7)
+        cr.rectangle(0, h - bar, w * b / 100, bar)
+        cr.fill()
+        # Track
+        cr.set_source_rgba(0.5, 0.5, 0.5, 0.15)
+        cr.rectangle(w * b / 100, h - bar, w - w * b / 100, bar)
+        cr.fill()
+        surface.flush()
+        # cairo ARGB32 is premultiplied native-endian, i.e. BGRA on little-endian
+        fmt = (Gdk.MemoryFormat.B8G8R8A8_PREMULTIPLIED if sys.byteorder == "little"
+               else Gdk.MemoryFormat.A8R8G8B8_PREMULTIPLIED)
+        return Gdk.MemoryTexture.new(
+            w, h, fmt,
+            GLib.Bytes.new(bytes(surface.get_data())), surface.get_stride())
+
+    def clear(self):
+        self._cache.clear()
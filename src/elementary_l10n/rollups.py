@@ -0,0 +1,166 @@
+"""Precomputed project, language and status rollups.
+
+RollupIndex keeps running sums per language (overall, per status filter
+and per project) and updates them incrementally as rows are added,
+changed or removed, so summary statistics cost O(1) per render.
+"""
+
+HISTOGRAM_BINS = 11  # 0-9%, 10-19%, ..., 90-99%, 100%
+
+STATUSES = ("complete", "partial", "untranslated")
+
+
+def row_status(pct: float) -> str:
+    """Status filter key for a percentage, matching the app's filters."""
+    if pct >= 100:
+        return "complete"
+    if pct > 0:
+        return "partial"
+    return "untranslated"
+
+
+def row_key(row: dict) -> tuple:
+    return (row.get("instance", ""), row["project_slug"], row["component_slug"])
+
+
+def project_key(row: dict) -> tuple:
+    return (row.get("instance", ""), row["project_slug"])
+
+
+class Rollup:
+    """Running totals for a set of rows."""
+
+    __slots__ = ("count", "pct_sum", "complete", "total_words", "translated_words",
+                 "histogram")
+
+    def __init__(self):
+        self.count = 0
+        self.pct_sum = 0.0
+        self.complete = 0
+        self.total_words = 0
+        self.translated_words = 0
+        self.histogram = [0] * HISTOGRAM_BINS
+
+    def add(self, row: dict, sign: int = 1):
+        pct = row["translated_percent"]
+        self.count += sign
+        self.pct_sum += sign * pct
+        self.complete += sign * (pct >= 100)
+        self.total_words += sign * row.get("total_words", 0)
+        self.translated_words += sign * row.get("translated_words", 0)
+        self.histogram[min(int(pct // 10), HISTOGRAM_BINS - 1)] += sign
+
+    def remove(self, row: dict):
+        self.add(row, -1)
+
+    @property
+    def average(self) -> float:
+        """Mean of component percentages."""
+        return self.pct_sum / self.count if self.count else 0.0
+
+    @property
+    def weighted_average(self) -> float:
+        """Share of translated source words; falls back to the plain mean."""
+        if self.total_words > 0:
+            return 100 * self.translated_words / self.total_words
+        return self.average
+
+    def histogram_text(self, width: int = 20) -> str:
+        peak = max(self.histogram) or 1
+        lines = []
+        for i, n in enumerate(self.histogram):
+            label = "100%" if i == HISTOGRAM_BINS - 1 else f"{i * 10}-{i * 10 + 9}%"
+            lines.append(f"{label:>7} {'█' * round(width * n / peak)} {n}")
+        return "\n".join(lines)
+
+
+class _LanguageRollups:
+    __slots__ = ("all", "status", "projects", "rows")
+
+    def __init__(self):
+        self.all = Rollup()
+        self.status = {s: Rollup() for s in STATUSES}
+        self.projects = {}
+        self.rows = {}
+
+    def _apply(self, row: dict, sign: int):
+        self.all.add(row, sign)
+        self.status[row_status(row["translated_percent"])].add(row, sign)
+        key = project_key(row)
+        project = self.projects.get(key)
+        if project is None:
+            project = self.projects[key] = Rollup()
+        project.add(row, sign)
+        if not project.count:
+            del self.projects[key]
+
+
+class RollupIndex:
+    """Incrementally maintained rollups for every loaded language."""
+
+    def __init__(self):
+        self._languages = {}
+
+    def _lang(self, language_code: str) -> _LanguageRollups:
+        lang = self._languages.get(language_code)
+        if lang is None:
+            lang = self._languages[language_code] = _LanguageRollups()
+        return lang
+
+    def upsert(self, language_code: str, row: dict):
+        lang = self._lang(language_code)
+        key = row_key(row)
+        old = lang.rows.get(key)
+        if old is not None:
+            if (old["translated_percent"] == row["translated_percent"]
+                    and old.get("total_words") == row.get("total_words")
+                    and old.get("translated_words") == row.get("translated_words")):
+                lang.rows[key] = row
+                return
+            lang._apply(old, -1)
+        lang.rows[key] = row
+        lang._apply(row, 1)
+
+    def remove(self, language_code: str, row: dict):
+        lang = self._lang(language_code)
+        old = lang.rows.pop(row_key(row), None)
+        if old is not None:
+            lang._apply(old, -1)
+
+    def replace(self, language_code: str, rows: list[dict]):
+        """Bring a language in line with rows, touching only what changed."""
+        lang = self._lang(language_code)
+        keep = set()
+        for row in rows:
+            keep.add(row_key(row))
+            self.upsert(language_code, row)
+        for key in [k for k in lang.rows if k not in keep]:
+            lang._apply(lang.rows.pop(key), -1)
+
+    def language(self, language_code: str) -> Rollup:
+        return self._lang(language_code).all
+
+    def status(self, language_code: str, filter_key: str) -> Rollup:
+        """Rollup for one of the app's status filters ("all" or a status)."""
+        lang = self._lang(language_code)
+        return lang.all if filter_key == "all" else lang.status[filter_key]
+
+    def project(self, language_code: str, key: tuple) -> Rollup:
+        """Rollup for a project_key() (instance, project_slug)."""
+        return self._lang(language_code).projects.get(key) or Rollup()
+
+    def projects(self, language_code: str) -> dict[tuple, Rollup]:
+        return self._lang(language_code).projects
+
+    def overall(self) -> Rollup:
+        """Totals across every loaded language."""
+        total = Rollup()
+        for lang in self._languages.values():
+            r = lang.all
+            total.count += r.count
+            total.pct_sum += r.pct_sum
+            total.complete += r.complete
+            total.total_words += r.total_words
+            total.translated_words += r.translated_words
+            total.histogram = [a + b for a, b in zip(total.histogram, r.histogram)]
+        return total
@@ -0,0 +1,238 @@
+"""Statistics from local .po/.pot files, without the network.
+
+scan() walks checkouts for po/ directories laid out like elementary's
+repositories (po/<lang>.po plus po/<domain>.pot, extra components in
+po/<name>/), parses the files with a line-based parser, in a process
+pool when there are many, and returns rows in the same model as
+weblate.fetch_all_data, tagged with instance LOCAL_INSTANCE.
+
+Parsed statistics are cached in CACHE_DIR/scan.json by path. A file whose
+size and mtime are unchanged is not read; one that was touched but has
+the same content hash is not parsed again. Files a scan no longer finds
+are dropped from the cache.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from . import weblate
+
+LOCAL_INSTANCE = "local"
+POOL_THRESHOLD = 16  # files to parse before a process pool pays for itself
+SKIP_DIRS = {".git", ".flatpak-builder", "node_modules", "build", "_build", "builddir"}
+_CACHE_VERSION = 1
+
+# Rows need an instance; local files have no server, so no web URLs either
+_LOCAL = weblate.Instance(LOCAL_INSTANCE, "")
+
+
+def _words(parts: list[bytes]) -> int:
+    return len(b"".join(parts).replace(b"\\n", b" ").split())
+
+
+def parse_po(path: str) -> dict:
+    """Translated, fuzzy and untranslated strings and words of a .po/.pot file.
+
+    Only the structure is parsed: strings are never unescaped or decoded,
+    which is all the counts need. Obsolete (#~) entries and the header
+    are skipped; a plural entry counts as translated only if every form is.
+    """
+    total = translated = fuzzy = 0
+    total_words = translated_words = 0
+    msgid, forms = [], []
+    is_fuzzy = False
+    section = None
+
+    def _flush():
+        nonlocal total, translated, fuzzy, total_words, translated_words
+        if section is None or not any(msgid):
+            return  # nothing collected, or the header entry
+        words = _words(msgid)
+        total += 1
+        total_words += words
+        if forms and all(forms):
+            if is_fuzzy:
+                fuzzy += 1
+            else:
+                translated += 1
+                translated_words += words
+
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                _flush()
+                msgid, forms, is_fuzzy, section = [], [], False, None
+                continue
+            first = line[:1]
+            if first == b'"':
+                if section == "msgid":
+                    msgid.append(line[1:-1])
+                elif section == "msgstr":
+                    forms[-1] = forms[-1] or len(line) > 2
+                continue
+            if section == "msgstr" and first in (b"#", b"m"):
+                if not line.startswith(b"msgstr"):
+                    # A new entry without a blank line in between
+                    _flush()
+                    msgid, forms, is_fuzzy, section = [], [], False, None
+            if first == b"#":
+                if line.startswith(b"#,") and b"fuzzy" in line:
+                    is_fuzzy = True
+            elif line.startswith(b"msgid_plural"):
+                section = "plural"
+            elif line.startswith(b"msgid"):
+                section = "msgid"
+                msgid.append(line[7:-1])
+            elif line.startswith(b"msgstr"):
+                section = "msgstr"
+                forms.append(not line.endswith(b' ""'))
+            elif line.startswith(b"msgctxt"):
+                section = "msgctxt"
+        _flush()
+
+    return {
+        "total": total,
+        "translated": translated,
+        "fuzzy": fuzzy,
+        "untranslated": total - translated - fuzzy,
+        "total_words": total_words,
+        "translated_words": translated_words,
+        "translated_percent": round(100 * translated / total, 1) if total else 100.0,
+    }
+
+
+def _component(directory: Path) -> tuple[str, str]:
+    """(project, component) for a directory of .po files.
+
+    repo/po -> (repo, repo); repo/po/extra -> (repo, extra); anything
+    else -> (parent, directory).
+    """
+    if directory.name == "po":
+        return directory.parent.name, directory.parent.name
+    if directory.parent.name == "po":
+        return directory.parent.parent.name, directory.name
+    return directory.parent.name, directory.name
+
+
+def find_components(roots: list) -> dict[tuple[str, str], dict]:
+    """{(project, component): {"po": {lang: path}, "pot": path or None}}."""
+    components = {}
+    for root in roots:
+        for dirpath, dirnames, filenames in os.walk(os.path.abspath(root)):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.startswith(".")]
+            po = {name[:-3]: os.path.join(dirpath, name)
+                  for name in filenames if name.endswith(".po")}
+            pot = next((os.path.join(dirpath, name)
+                        for name in sorted(filenames) if name.endswith(".pot")), None)
+            if po or pot:
+                components[_component(Path(dirpath).resolve())] = {"po": po, "pot": pot}
+    return components
+
+
+def _fingerprint(path: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _load_cache(cache_file: Path) -> dict:
+    try:
+        data = json.loads(cache_file.read_text())
+    except Exception:
+        return {}
+    return data.get("files", {}) if data.get("version") == _CACHE_VERSION else {}
+
+
+def _save_cache(cache_file: Path, files: dict):
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"version": _CACHE_VERSION, "files": files}))
+        tmp.replace(cache_file)
+    except Exception:
+        pass
+
+
+def file_stats(paths: list[str], workers: int | None = None,
+               cache_file: Path | None = None, keep=None) -> dict[str, dict]:
+    """Statistics of each file, parsing only files that changed.
+
+    Cache entries for files outside keep (default: paths) are dropped.
+    """
+    cache_file = cache_file or weblate.CACHE_DIR / "scan.json"
+    cache = _load_cache(cache_file)
+    results, todo, entries = {}, [], {}
+    for path in paths:
+        st = os.stat(path)
+        entry = cache.get(path)
+        if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            results[path] = entry["stats"]
+            continue
+        digest = _fingerprint(path)
+        entries[path] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "hash": digest}
+        if entry and entry["hash"] == digest:
+            results[path] = entries[path]["stats"] = entry["stats"]
+        else:
+            todo.append(path)
+
+    workers = workers or os.cpu_count() or 1
+    if len(todo) >= POOL_THRESHOLD and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = pool.map(parse_po, todo, chunksize=max(1, len(todo) // (workers * 4)))
+            results.update(zip(todo, parsed))
+    else:
+        results.update((path, parse_po(path)) for path in todo)
+
+    for path in todo:
+        entries[path]["stats"] = results[path]
+    keep = set(paths if keep is None else keep)
+    kept = {path: entry for path, entry in cache.items() if path in keep}
+    if entries or len(kept) < len(cache):
+        _save_cache(cache_file, {**kept, **entries})
+    return results
+
+
+def scan(roots: list, languages: list[str] | None = None, workers: int | None = None,
+         cache_file: Path | None = None) -> dict[str, list[dict]]:
+    """Rows per language for every component found under roots.
+
+    With languages, only those .po files are read, and a component that
+    has a template but no file for a language gets a 0% row from the .pot,
+    as Weblate would show it.
+    """
+    components = find_components(roots)
+    wanted = set(languages) if languages else None
+    paths, found = [], []
+    for comp in components.values():
+        paths.extend(p for lang, p in comp["po"].items() if wanted is None or lang in wanted)
+        if wanted and comp["pot"] and not wanted <= comp["po"].keys():
+            paths.append(comp["pot"])
+        found.extend(comp["po"].values())
+        if comp["pot"]:
+            found.append(comp["pot"])
+    # Files of other languages stay cached; those no longer found do not
+    stats = file_stats(paths, workers, cache_file, keep=found)
+
+    rows = {code: [] for code in languages or ()}
+    for (project, component), comp in sorted(components.items()):
+        proj = {"name": project, "slug": project}
+        info = {"name": component, "slug": component}
+        for code in languages or sorted(comp["po"]):
+            if code in comp["po"]:
+                lang_stats = stats[comp["po"][code]]
+            elif comp["pot"]:
+                lang_stats = {**stats[comp["pot"]], "translated": 0, "translated_words": 0,
+                              "fuzzy": 0, "translated_percent": 0.0}
+                lang_stats["untranslated"] = lang_stats["total"]
+            else:
+                continue
+            row = weblate._make_row(proj, info, code, lang_stats, _LOCAL)
+            row["url"] = row["translate_url"] = ""
+            rows.setdefault(code, []).append(row)
+    return rows
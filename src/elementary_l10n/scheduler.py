@@ -0,0 +1,167 @@
+"""Priority scheduling of pending statistics requests.
+
+Pending (project, component) tasks are served highest score first:
+
+    score = VISIBLE_WEIGHT  if the tile is on screen
+          + SHOWN_WEIGHT    if it passes the current filter
+          + STALENESS_WEIGHT * (time since last fetch, capped at STALE_HORIZON)
+          + CHANGE_WEIGHT   * (share of past fetches where the value changed)
+
+The UI publishes what is on screen through VISIBILITY; a running
+scheduler notices the change on its next pop() and re-orders what is
+left, so scrolling or filtering re-prioritises a refresh in flight.
+"""
+
+import heapq
+import json
+import os
+import threading
+import time
+
+VISIBLE_WEIGHT = 100.0
+SHOWN_WEIGHT = 10.0
+STALENESS_WEIGHT = 5.0
+CHANGE_WEIGHT = 5.0
+STALE_HORIZON = 7 * 24 * 3600  # seconds after which an entry counts as fully stale
+
+
+class Visibility:
+    """Thread-safe record of which rows the UI currently shows."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.version = 0
+        self._language = None
+        self._visible = frozenset()
+        self._shown = frozenset()
+
+    def update(self, language_code: str, visible, shown=()):
+        """visible: row keys on screen; shown: row keys passing the filter."""
+        with self._lock:
+            self._language = language_code
+            self._visible = frozenset(visible)
+            self._shown = frozenset(shown)
+            self.version += 1
+
+    def snapshot(self, language_code: str) -> tuple[int, frozenset, frozenset]:
+        with self._lock:
+            if language_code != self._language:
+                return self.version, frozenset(), frozenset()
+            return self.version, self._visible, self._shown
+
+
+VISIBILITY = Visibility()
+
+
+class FetchHistory:
+    """Per-row fetch times and change counts, persisted as JSON at path."""
+
+    def __init__(self, path):
+        self._path = path
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        try:
+            self._entries = json.loads(path.read_text())
+        except Exception:
+            self._entries = {}
+
+    @staticmethod
+    def _key(language_code: str, key: tuple) -> str:
+        return "|".join((language_code, *key))
+
+    def get(self, language_code: str, key: tuple) -> dict | None:
+        return self._entries.get(self._key(language_code, key))
+
+    def record(self, language_code: str, row: dict):
+        k = self._key(language_code, (row["instance"], row["project_slug"],
+                                      row["component_slug"]))
+        pct = row["translated_percent"]
+        with self._lock:
+            entry = self._entries.setdefault(k, {"fetches": 0, "changes": 0})
+            if entry["fetches"] and entry.get("pct") != pct:
+                entry["changes"] += 1
+            entry["fetches"] += 1
+            entry["pct"] = pct
+            entry["fetched"] = time.time()
+
+    def save(self):
+        """Write the entries atomically; concurrent saves are serialised.
+
+        Workers of several instances save the same history, so the
+        snapshot and the write happen under one lock (a later save never
+        loses to an earlier one), and the file is replaced rather than
+        rewritten in place (a reader never sees half of it).
+        """
+        with self._save_lock:
+            with self._lock:
+                data = json.dumps(self._entries)
+            tmp = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp.write_text(data)
+                os.replace(tmp, self._path)
+            except Exception:
+                pass
+
+
+class FetchScheduler:
+    """Hand out (project, component) tasks in priority order.
+
+    Scores are computed once per visibility change rather than per pop, so
+    draining n tasks costs O(n log n) plus a rebuild whenever the UI
+    reports a new viewport.
+    """
+
+    def __init__(self, tasks: list[tuple[dict, dict]], language_code: str,
+                 instance_name: str, history: FetchHistory | None = None,
+                 visibility: Visibility = VISIBILITY):
+        self._language = language_code
+        self._instance = instance_name
+        self._history = history
+        self._visibility = visibility
+        self._pending = {self._task_key(t): t for t in tasks}
+        self._order = {k: i for i, k in enumerate(self._pending)}  # tie-break: API order
+        self._version = None
+        self._heap = []
+
+    def __len__(self):
+        return len(self._pending)
+
+    def _task_key(self, task: tuple[dict, dict]) -> tuple:
+        proj, comp = task
+        return (self._instance, proj["slug"], comp["slug"])
+
+    def score(self, key: tuple, visible: frozenset, shown: frozenset,
+              now: float) -> float:
+        score = 0.0
+        if key in visible:
+            score += VISIBLE_WEIGHT
+        if key in shown:
+            score += SHOWN_WEIGHT
+        entry = self._history.get(self._language, key) if self._history else None
+        if entry is None:
+            return score + STALENESS_WEIGHT
+        age = now - entry.get("fetched", 0)
+        score += STALENESS_WEIGHT * min(age / STALE_HORIZON, 1.0)
+        if entry.get("fetches"):
+            score += CHANGE_WEIGHT * entry.get("changes", 0) / entry["fetches"]
+        return score
+
+    def _rebuild(self, version: int, visible: frozenset, shown: frozenset):
+        now = time.time()
+        self._heap = [(-self.score(k, visible, shown, now), self._order[k], k)
+                      for k in self._pending]
+        heapq.heapify(self._heap)
+        self._version = version
+
+    def pop(self) -> tuple[dict, dict] | None:
+        """Next task, re-prioritising first if the UI's viewport changed."""
+        version, visible, shown = self._visibility.snapshot(self._language)
+        if version != self._version:
+            self._rebuild(version, visible, shown)
+        while self._heap:
+            _score, _order, key = heapq.heappop(self._heap)
+            task = self._pending.pop(key, None)
+            if task is not None:
+                return task
+        return None
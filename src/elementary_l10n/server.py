@@ -0,0 +1,125 @@
+"""Headless runtime and local HTTP endpoint for dashboards.
+
+Runtime keeps a Snapshot of the local store in memory and, unless told
+not to, refreshes its languages from Weblate on an interval. The HTTP
+server only ever reads the current snapshot:
+
+    GET /metrics                    Prometheus text format
+    GET /api/languages              summary per language
+    GET /api/languages/<code>       summary and rows; ?project= ?instance= ?status=
+    GET /healthz                    snapshot age
+"""
+
+import json
+import sys
+import threading
+import time
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from . import weblate
+from .diagnostics import DIAGNOSTICS
+from .snapshot import Snapshot
+
+DEFAULT_PORT = 9273
+DEFAULT_INTERVAL = 3600  # seconds between refresh passes
+
+
+class Runtime:
+    """Refresh loop plus the snapshot it publishes."""
+
+    def __init__(self, languages: list[str], interval: float = DEFAULT_INTERVAL,
+                 refresh: bool = True, instances: list | None = None):
+        self.languages = list(languages)
+        self.interval = interval
+        self.refresh = refresh
+        self.instances = instances if instances is not None else weblate.load_instances()
+        self.durations = {}
+        self._stop = threading.Event()
+        self._thread = None
+        self.snapshot = self._build()
+
+    def _build(self) -> Snapshot:
+        data = {code: weblate.load_store(code, self.instances) for code in self.languages}
+        return Snapshot(data, DIAGNOSTICS.summary(), self.durations)
+
+    def refresh_languages(self):
+        """Fetch every language into the store in one pass (blocking) and republish.
+
+        Each component's statistics cover all of its languages, so a pass
+        costs about one request per component however many languages are
+        served. Every language records the duration of the whole pass.
+        """
+        start = time.perf_counter()
+        try:
+            weblate.fetch_languages(self.languages, self.instances)
+        except (weblate.OfflineError, RuntimeError, OSError) as e:
+            print(f"elementary-l10n: refresh failed: {e}", file=sys.stderr)
+        seconds = time.perf_counter() - start
+        self.durations.update(dict.fromkeys(self.languages, seconds))
+        self.snapshot = self._build()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh_languages()
+            except Exception:
+                # An unexpected failure must not end the refreshes for good
+                print("elementary-l10n: refresh failed unexpectedly:", file=sys.stderr)
+                traceback.print_exc()
+            self._stop.wait(self.interval)
+
+    def start(self):
+        if self.refresh:
+            self._thread = threading.Thread(target=self._loop, daemon=True, name="refresh")
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+
+def _handler(runtime: Runtime):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *_args):
+            pass
+
+        def _send(self, status: int, body: bytes, content_type: str = "application/json"):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            snapshot = runtime.snapshot  # one consistent view per request
+            parts = urlsplit(self.path)
+            path = parts.path.rstrip("/")
+            if path == "/metrics":
+                self._send(200, snapshot.metrics, "text/plain; version=0.0.4; charset=utf-8")
+            elif path == "/api/languages":
+                self._send(200, snapshot.languages_json)
+            elif path.startswith("/api/languages/"):
+                query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+                body = snapshot.query(path.rsplit("/", 1)[1], query.get("project"),
+                                      query.get("instance"), query.get("status"))
+                if body is None:
+                    self._send(404, b'{"detail": "Unknown language."}')
+                else:
+                    self._send(200, body)
+            elif path == "/healthz":
+                self._send(200, json.dumps({
+                    "status": "ok", "snapshot_age": time.time() - snapshot.created,
+                }).encode())
+            else:
+                self._send(404, b'{"detail": "Not found."}')
+
+    return Handler
+
+
+def serve(runtime: Runtime, host: str = "127.0.0.1",
+          port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """Create the HTTP server for runtime; call serve_forever() on it."""
+    server = ThreadingHTTPServer((host, port), _handler(runtime))
+    server.daemon_threads = True
+    return server
@@ -0,0 +1,144 @@
+"""Immutable, precomputed views of the local store for the HTTP endpoint.
+
+A Snapshot is built once per refresh; scrapes and API calls only read the
+pre-encoded bytes (or filter in-memory rows), so serving never touches
+the network or the cache files.
+"""
+
+import json
+import time
+
+from . import rollups
+
+PREFIX = "elementary_l10n"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+
+
+class _Metrics:
+    """Prometheus text exposition format, one metric family at a time."""
+
+    def __init__(self):
+        self.lines = []
+
+    def family(self, name: str, kind: str, help_text: str):
+        self.lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+        self.lines.append(f"# TYPE {PREFIX}_{name} {kind}")
+
+    def sample(self, name: str, value, **labels):
+        label_text = "{" + _labels(**labels) + "}" if labels else ""
+        self.lines.append(f"{PREFIX}_{name}{label_text} {value}")
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def _summary(code: str, rollup: rollups.Rollup, fetched: float | None) -> dict:
+    return {
+        "language": code,
+        "components": rollup.count,
+        "complete": rollup.complete,
+        "average": round(rollup.average, 2),
+        "weighted_average": round(rollup.weighted_average, 2),
+        "total_words": rollup.total_words,
+        "translated_words": rollup.translated_words,
+        "fetched": fetched,
+    }
+
+
+class Snapshot:
+    """Rows, summaries, JSON documents and metrics text for a set of languages.
+
+    data maps language code -> (rows, fetch timestamp or None); diagnostics
+    is a weblate DIAGNOSTICS.summary(); durations maps language code ->
+    seconds the last refresh of that language took.
+    """
+
+    def __init__(self, data: dict[str, tuple[list, float | None]],
+                 diagnostics: dict | None = None,
+                 durations: dict[str, float] | None = None):
+        self.created = time.time()
+        self.rows = {code: rows for code, (rows, _ts) in data.items()}
+        self.fetched = {code: ts for code, (_rows, ts) in data.items()}
+        index = rollups.RollupIndex()
+        for code, rows in self.rows.items():
+            index.replace(code, rows)
+        self.summaries = {code: _summary(code, index.language(code), self.fetched[code])
+                          for code in self.rows}
+        self.languages_json = json.dumps(sorted(self.summaries.values(),
+                                                key=lambda s: s["language"])).encode()
+        self.language_json = {
+            code: json.dumps({**self.summaries[code], "rows": rows}).encode()
+            for code, rows in self.rows.items()
+        }
+        self.metrics = self._metrics(diagnostics or {}, durations or {}).encode()
+
+    def query(self, code: str, project: str | None = None, instance: str | None = None,
+              status: str | None = None) -> bytes | None:
+        """JSON for one language, optionally filtered; None if unknown."""
+        if code not in self.rows:
+            return None
+        if not (project or instance or status):
+            return self.language_json[code]
+        rows = [r for r in self.rows[code]
+                if (project is None or r["project_slug"] == project)
+                and (instance is None or r.get("instance") == instance)
+                and (status is None or rollups.row_status(r["translated_percent"]) == status)]
+        return json.dumps({**self.summaries[code], "rows": rows}).encode()
+
+    def _metrics(self, diagnostics: dict, durations: dict[str, float]) -> str:
+        m = _Metrics()
+        m.family("component_translated_percent", "gauge",
+                 "Translated strings of a component in a language, in percent.")
+        for code, rows in self.rows.items():
+            for r in rows:
+                m.sample("component_translated_percent", r["translated_percent"],
+                         instance=r.get("instance", ""), project=r["project_slug"],
+                         component=r["component_slug"], language=code)
+        for name, key, help_text in (
+                ("language_translated_percent", "average",
+                 "Mean of component percentages for a language."),
+                ("language_translated_words_percent", "weighted_average",
+                 "Share of source words translated for a language."),
+                ("language_components", "components", "Components with statistics."),
+                ("language_complete_components", "complete", "Fully translated components.")):
+            m.family(name, "gauge", help_text)
+            for code, summary in self.summaries.items():
+                m.sample(name, summary[key], language=code)
+        m.family("language_fetched_timestamp_seconds", "gauge",
+                 "Unix time the language's statistics were fetched.")
+        for code, ts in self.fetched.items():
+            if ts is not None:
+                m.sample("language_fetched_timestamp_seconds", round(ts, 3), language=code)
+        m.family("fetch_duration_seconds", "gauge", "Duration of the last refresh.")
+        for code, seconds in durations.items():
+            m.sample("fetch_duration_seconds", round(seconds, 3), language=code)
+
+        if diagnostics:
+            m.family("requests_total", "counter", "Weblate API requests made.")
+            m.sample("requests_total", diagnostics["requests"])
+            m.family("responses_total", "counter", "Weblate API responses by status.")
+            for status, count in sorted(diagnostics["statuses"].items()):
+                m.sample("responses_total", count, status=status)
+            m.family("rate_limited_total", "counter", "429 responses from Weblate.")
+            m.sample("rate_limited_total", diagnostics["statuses"].get(429, 0))
+            m.family("request_seconds_total", "counter", "Time spent in API requests.")
+            m.sample("request_seconds_total", round(diagnostics["request_time"], 3))
+            m.family("backoff_seconds_total", "counter", "Time slept after 429 responses.")
+            m.sample("backoff_seconds_total", round(diagnostics["backoff_time"], 3))
+            m.family("read_timeouts_total", "counter", "Requests retried after a read timeout.")
+            m.sample("read_timeouts_total", diagnostics["timeouts"])
+            m.family("timeout_backoff_seconds_total", "counter",
+                     "Time slept before retrying a timed-out request.")
+            m.sample("timeout_backoff_seconds_total", round(diagnostics["timeout_time"], 3))
+            m.family("received_bytes_total", "counter", "Response bytes on the wire.")
+            m.sample("received_bytes_total", diagnostics["wire_bytes"])
+        m.family("snapshot_timestamp_seconds", "gauge", "Unix time this snapshot was built.")
+        m.sample("snapshot_timestamp_seconds", round(self.created, 3))
+        return m.text()
@@ -0,0 +1,179 @@
+"""Compact on-disk store for cached rows, one blob per language.
+
+File layout:
+
+    b"ELS1" | u32 index length | JSON index | blob | blob | ...
+
+The index maps language code -> [timestamp, offset, length, codec] and is
+decoded on its own, so listing languages or loading one of them never
+touches the others. Rows are stored column-wise ({"keys": [...],
+"cols": [[...], ...]}), which compresses much better than a list of
+dicts. Blobs use msgpack and zstd when installed, else JSON and gzip;
+the codec is recorded per blob so a file stays readable either way.
+"""
+
+import contextlib
+import gzip
+import json
+import os
+import struct
+import tempfile
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:  # Windows
+    HAS_FCNTL = False
+
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+MAGIC = b"ELS1"
+_HEADER = struct.Struct("<4sI")
+
+CODECS = ("json+gzip", "json+zstd", "msgpack+gzip", "msgpack+zstd")
+
+
+def available_codecs() -> list[str]:
+    return [c for c in CODECS
+            if ("msgpack" not in c or HAS_MSGPACK) and ("zstd" not in c or HAS_ZSTD)]
+
+
+def default_codec() -> str:
+    serializer = "msgpack" if HAS_MSGPACK else "json"
+    return f"{serializer}+{'zstd' if HAS_ZSTD else 'gzip'}"
+
+
+def _columns(rows: list[dict]) -> dict:
+    keys = list(dict.fromkeys(k for row in rows for k in row))
+    return {"keys": keys, "cols": [[row.get(k) for row in rows] for k in keys]}
+
+
+def _rows(table: dict) -> list[dict]:
+    keys = table["keys"]
+    return [dict(zip(keys, values)) for values in zip(*table["cols"])]
+
+
+def encode_rows(rows: list[dict], codec: str | None = None) -> tuple[bytes, str]:
+    """Serialize and compress rows; returns (blob, codec)."""
+    codec = codec or default_codec()
+    serializer, compressor = codec.split("+")
+    table = _columns(rows)
+    if serializer == "msgpack":
+        raw = msgpack.packb(table, use_bin_type=True)
+    else:
+        raw = json.dumps(table, separators=(",", ":")).encode()
+    if compressor == "zstd":
+        return zstandard.ZstdCompressor(level=6).compress(raw), codec
+    return gzip.compress(raw, compresslevel=6), codec
+
+
+def decode_rows(blob: bytes, codec: str) -> list[dict]:
+    serializer, compressor = codec.split("+")
+    if compressor == "zstd":
+        if not HAS_ZSTD:
+            raise ValueError("zstandard is not installed")
+        raw = zstandard.ZstdDecompressor().decompress(blob)
+    else:
+        raw = gzip.decompress(blob)
+    if serializer == "msgpack":
+        if not HAS_MSGPACK:
+            raise ValueError("msgpack is not installed")
+        return _rows(msgpack.unpackb(raw, raw=False))
+    return _rows(json.loads(raw))
+
+
+class StoreFile:
+    """A store file read into memory; blobs are decoded only on request."""
+
+    def __init__(self, data: bytes = b""):
+        self._data = data
+        self.index = {}
+        self._base = 0
+        if len(data) >= _HEADER.size:
+            magic, length = _HEADER.unpack_from(data)
+            if magic == MAGIC:
+                self._base = _HEADER.size + length
+                try:
+                    self.index = json.loads(data[_HEADER.size:self._base])
+                except ValueError:
+                    self.index = {}
+
+    @classmethod
+    def open(cls, path) -> "StoreFile":
+        try:
+            return cls(path.read_bytes())
+        except OSError:
+            return cls()
+
+    def languages(self) -> dict[str, float]:
+        """Language code -> fetch timestamp, from the index alone."""
+        return {code: entry[0] for code, entry in self.index.items()}
+
+    def blob(self, language_code: str) -> tuple[float, bytes, str] | None:
+        entry = self.index.get(language_code)
+        if entry is None:
+            return None
+        timestamp, offset, length, codec = entry
+        start = self._base + offset
+        return timestamp, self._data[start:start + length], codec
+
+    def rows(self, language_code: str) -> tuple[list[dict], float] | None:
+        """Decoded rows and timestamp for one language, or None."""
+        entry = self.blob(language_code)
+        if entry is None:
+            return None
+        timestamp, blob, codec = entry
+        try:
+            return decode_rows(blob, codec), timestamp
+        except Exception:
+            return None
+
+
+@contextlib.contextmanager
+def locked(path):
+    """Hold an exclusive lock for path across processes (the GUI and `serve`).
+
+    The lock is taken on a separate path.lock file, since path itself is
+    replaced on every write.
+    """
+    if not HAS_FCNTL:
+        yield
+        return
+    with open(path.with_name(path.name + ".lock"), "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def write_store(path, blobs: dict[str, tuple[float, bytes, str]]):
+    """Write {language: (timestamp, blob, codec)} atomically to path."""
+    index, offset = {}, 0
+    for code, (timestamp, blob, codec) in blobs.items():
+        index[code] = [timestamp, offset, len(blob), codec]
+        offset += len(blob)
+    head = json.dumps(index, separators=(",", ":")).encode()
+    # A temp file of its own, so concurrent writers never share one
+    with tempfile.NamedTemporaryFile("wb", dir=path.parent, prefix=path.name + ".",
+                                     suffix=".tmp", delete=False) as f:
+        try:
+            f.write(_HEADER.pack(MAGIC, len(head)))
+            f.write(head)
+            for _ts, blob, _codec in blobs.values():
+                f.write(blob)
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    os.replace(f.name, path)
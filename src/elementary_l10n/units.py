@@ -0,0 +1,155 @@
+"""Untranslated and fuzzy strings of one translation, a page at a time.
+
+UnitPager reads /api/translations/<project>/<component>/<lang>/units/
+filtered to UNITS_QUERY (empty and needs-editing units). Pages are
+stored on disk under CACHE_DIR/units/ with their ETag/Last-Modified,
+served as-is for UNITS_TTL and revalidated after that. Only WINDOW_PAGES
+pages are kept in memory, so a component with thousands of open strings
+costs a few pages of RAM however far the translator pages.
+"""
+
+import hashlib
+import json
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from . import weblate
+
+UNITS_QUERY = "state:<translated"
+UNITS_TTL = 300  # seconds a stored page is shown without revalidating
+WINDOW_PAGES = 3  # pages kept in memory per pager
+
+# Unit fields the detail view needs; the API sends many more
+_FIELDS = ("id", "position", "context", "note", "source", "target", "state", "web_url")
+
+# Weblate unit states
+STATE_EMPTY = 0
+STATE_FUZZY = 10
+
+
+class UnitPager:
+    """Pages of units matching UNITS_QUERY for one component and language.
+
+    page() blocks, so call it off the main thread; concurrent calls for
+    the same page share one request. When the server is unreachable a
+    stored page is returned however old it is.
+    """
+
+    def __init__(self, instance: weblate.Instance, project_slug: str,
+                 component_slug: str, language_code: str,
+                 window: int = WINDOW_PAGES):
+        self.instance = instance
+        self.project_slug = project_slug
+        self.component_slug = component_slug
+        self.language_code = language_code
+        self.count = None  # matching units, known once a page is loaded
+        self.page_size = None
+        self._window = window
+        self._pages = OrderedDict()
+        self._loading = {}
+        self._lock = threading.Lock()
+        self._session = None
+        key = hashlib.sha1("/".join((instance.url, project_slug, component_slug,
+                                     language_code, UNITS_QUERY)).encode()).hexdigest()
+        self._dir = weblate.CACHE_DIR / "units" / key[:16]
+
+    @property
+    def pages(self) -> int | None:
+        if self.count == 0:
+            return 1
+        if self.count is None or not self.page_size:
+            return None
+        return max(1, math.ceil(self.count / self.page_size))
+
+    def page(self, number: int) -> list[dict]:
+        """Units on page number (1-based)."""
+        while True:
+            with self._lock:
+                if number in self._pages:
+                    self._pages.move_to_end(number)
+                    return self._pages[number]
+                event = self._loading.get(number)
+                if event is None:
+                    event = self._loading[number] = threading.Event()
+                    break
+            event.wait()  # another thread is loading it; check again
+        try:
+            data = self._load(number)
+            with self._lock:
+                self.count = data["count"]
+                if number == 1 or data.get("next"):
+                    self.page_size = max(self.page_size or 0, len(data["units"]))
+                self._pages[number] = data["units"]
+                while len(self._pages) > self._window:
+                    self._pages.popitem(last=False)
+            return data["units"]
+        finally:
+            with self._lock:
+                del self._loading[number]
+            event.set()
+
+    def prefetch(self, number: int) -> threading.Thread | None:
+        """Load page number in the background if it exists and is not loaded."""
+        pages = self.pages
+        with self._lock:
+            if (number < 1 or (pages is not None and number > pages)
+                    or number in self._pages or number in self._loading):
+                return None
+
+        def _worker():
+            try:
+                self.page(number)
+            except Exception:
+                pass  # the page is requested again when it is shown
+
+        thread = threading.Thread(target=_worker, daemon=True, name=f"units-{number}")
+        thread.start()
+        return thread
+
+    def _load(self, number: int) -> dict:
+        path = self._dir / f"{number}.json"
+        try:
+            cached = json.loads(path.read_text())
+        except Exception:
+            cached = None
+        if cached and time.time() - cached["timestamp"] < UNITS_TTL:
+            return cached
+
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        if self._session is None:
+            self._session = self.instance.make_session()
+        self.instance.delay()
+        try:
+            r = weblate.fetch_units_page(self.project_slug, self.component_slug,
+                                         self.language_code, self._session, self.instance,
+                                         number, UNITS_QUERY, headers)
+        except weblate.OfflineError:
+            if cached:
+                return cached
+            raise
+        if r.status_code == 304 and cached:
+            cached["timestamp"] = time.time()
+            data = cached
+        else:
+            body = r.json()
+            data = {
+                "timestamp": time.time(),
+                "etag": r.headers.get("ETag"),
+                "last_modified": r.headers.get("Last-Modified"),
+                "count": body.get("count", 0),
+                "next": body.get("next"),
+                "units": [{k: unit.get(k) for k in _FIELDS}
+                          for unit in body.get("results", [])],
+            }
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(data))
+        except Exception:
+            pass
+        return data
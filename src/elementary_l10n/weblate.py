@@ -6,9 +6,16 @@ import threading
 import time
 from pathlib import Path
 from typing import Callable
+from urllib.parse import urlencode
 
 import requests
 
+from . import store
+from .languages import LanguageIndex
+from .diagnostics import DIAGNOSTICS
+from .planner import BACKGROUND_DELAY_FACTOR, WatchList, split_projects, split_tasks
+from .scheduler import FetchHistory, FetchScheduler
+
 try:
     import gi
     gi.require_version('Secret', '1')
@@ -23,9 +30,15 @@ API = f"{BASE_URL}/api"
 CONFIG_DIR = Path.home() / ".config" / "elementary-l10n"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 CACHE_DIR = Path.home() / ".cache" / "elementary-l10n"
-CACHE_FILE = CACHE_DIR / "cache.json"
+CACHE_FILE = CACHE_DIR / "cache.bin"
 
 REQUEST_DELAY = 0.6  # seconds between API calls
+TIMEOUT = (3.05, 15)  # (connect, read) seconds; unreachable hosts fail fast
+HEALTH_TTL = 30  # seconds a failed connection keeps a server marked unreachable
+CATALOG_TTL = 7 * 24 * 3600  # seconds before the project/component catalog is revalidated
+LANGUAGES_TTL = 24 * 3600  # seconds before the language catalog is refetched
+PREFETCH_MAX_AGE = 600  # seconds stored rows count as current (no refetch, no prefetch)
+DEFAULT_INSTANCE_NAME = "elementary"
 
 # libsecret schema for storing the API key securely
 if HAS_LIBSECRET:
@@ -36,28 +49,28 @@ if HAS_LIBSECRET:
     )
 
 
-def _get_api_key_from_keyring() -> str | None:
+def _get_api_key_from_keyring(application: str = "elementary-l10n") -> str | None:
     """Retrieve API key from GNOME Keyring via libsecret."""
     if not HAS_LIBSECRET:
         return None
     try:
         return Secret.password_lookup_sync(
-            _SECRET_SCHEMA, {"application": "elementary-l10n"}, None
+            _SECRET_SCHEMA, {"application": application}, None
         )
     except Exception:
         return None
 
 
-def _store_api_key_in_keyring(api_key: str) -> bool:
+def _store_api_key_in_keyring(api_key: str, application: str = "elementary-l10n") -> bool:
     """Store API key in GNOME Keyring via libsecret."""
     if not HAS_LIBSECRET:
         return False
     try:
         Secret.password_store_sync(
             _SECRET_SCHEMA,
-            {"application": "elementary-l10n"},
+            {"application": application},
             Secret.COLLECTION_DEFAULT,
-            "elementary-l10n Weblate API Key",
+            f"{application} Weblate API Key",
             api_key,
             None,
         )
@@ -66,13 +79,13 @@ def _store_api_key_in_keyring(api_key: str) -> bool:
         return False
 
 
-def _clear_api_key_from_keyring() -> bool:
+def _clear_api_key_from_keyring(application: str = "elementary-l10n") -> bool:
     """Remove API key from GNOME Keyring."""
     if not HAS_LIBSECRET:
         return False
     try:
         Secret.password_clear_sync(
-            _SECRET_SCHEMA, {"application": "elementary-l10n"}, None
+            _SECRET_SCHEMA, {"application": application}, None
         )
         return True
     except Exception:
@@ -118,36 +131,408 @@ def save_config(config: dict):
         config["api_key"] = api_key
 
 
-def load_cache(language_code: str) -> tuple[list | None, float | None]:
-    """Load cached data. Returns (data, timestamp) or (None, None)."""
+class OfflineError(RuntimeError):
+    """The Weblate server could not be reached at all."""
+
+
+# Next free request slot per server URL, shared by every Instance for that
+# URL so separate fetches (a refresh, replayed offline requests) together
+# stay within one REQUEST_DELAY spacing.
+_slots = {}
+_slots_lock = threading.Lock()
+
+
+class _Foreground:
+    """Counts fetches the user is waiting for; background work yields to them."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._active = 0
+
+    def __enter__(self):
+        with self._cond:
+            self._active += 1
+
+    def __exit__(self, *_exc):
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def wait_idle(self):
+        with self._cond:
+            self._cond.wait_for(lambda: self._active == 0)
+
+
+_foreground = _Foreground()
+_priority = threading.local()  # .background is set on prefetch threads
+
+
+def _is_background() -> bool:
+    return getattr(_priority, "background", False)
+
+
+class Instance:
+    """One Weblate server: URL, token, rate limiter and cache namespace.
+
+    Each instance owns its requests session (and so its connection pool)
+    and its own REQUEST_DELAY spacing, so a slow or throttled server does
+    not hold back requests to the others.
+    """
+
+    def __init__(self, name: str, url: str, api_key: str | None = None,
+                 request_delay: float | None = None, namespace: str | None = None):
+        self.name = name
+        self.url = url.rstrip("/")
+        self.api_key = api_key
+        self.request_delay = request_delay
+        self.namespace = namespace
+
+    def __repr__(self):
+        return f"Instance({self.name!r}, {self.url!r})"
+
+    @property
+    def api(self) -> str:
+        return f"{self.url}/api"
+
+    @property
+    def host(self) -> str:
+        return self.url.split("://", 1)[-1]
+
+    @property
+    def cache_file(self) -> Path:
+        if self.namespace is None:
+            return CACHE_FILE
+        return CACHE_DIR / f"cache-{self.namespace}.bin"
+
+    @property
+    def previous_file(self) -> Path:
+        """Rows each language had before its latest refresh, for diffs."""
+        if self.namespace is None:
+            return CACHE_DIR / "previous.bin"
+        return CACHE_DIR / f"previous-{self.namespace}.bin"
+
+    @property
+    def catalog_file(self) -> Path:
+        if self.namespace is None:
+            return CACHE_DIR / "catalog.json"
+        return CACHE_DIR / f"catalog-{self.namespace}.json"
+
+    @property
+    def languages_file(self) -> Path:
+        if self.namespace is None:
+            return CACHE_DIR / "languages.json"
+        return CACHE_DIR / f"languages-{self.namespace}.json"
+
+    def make_session(self) -> requests.Session:
+        return _make_session(self.api_key)
+
+    def delay(self, factor: float = 1.0):
+        """Wait for this instance's next request slot (thread-safe).
+
+        factor stretches the interval, e.g. for low-priority background work.
+        On a background thread the slot is only taken while no foreground
+        fetch is running, and at BACKGROUND_DELAY_FACTOR spacing.
+        """
+        background = _is_background()
+        if background:
+            _foreground.wait_idle()
+        time.sleep(self.reserve(factor, background))
+
+    def reserve(self, factor: float = 1.0, background: bool = False) -> float:
+        """Take this instance's next request slot without waiting for it.
+
+        Returns the seconds until the slot; the caller sleeps that long,
+        which lets the asyncio client share the same budget.
+        """
+        interval = REQUEST_DELAY if self.request_delay is None else self.request_delay
+        interval *= factor
+        if background:
+            interval *= BACKGROUND_DELAY_FACTOR
+        with _slots_lock:
+            now = time.monotonic()
+            wait = max(interval, _slots.get(self.url, 0.0) - now)
+            _slots[self.url] = now + wait + interval
+        DIAGNOSTICS.record_delay(wait)
+        return wait
+
+
+def default_instance() -> Instance:
+    """The l10n.elementaryos.org instance, using the key from load_config()."""
+    inst = Instance(DEFAULT_INSTANCE_NAME, BASE_URL)
+    inst.api_key = load_config().get("api_key")
+    return inst
+
+
+def load_instances(config: dict | None = None) -> list[Instance]:
+    """Default instance plus any extra servers listed in config["instances"].
+
+    Extra entries look like {"name": "Hosted", "url": "https://hosted.weblate.org"};
+    their tokens are stored in the keyring under "elementary-l10n:<url>",
+    with an "api_key" entry in the config as fallback. Rows, results and
+    site pages are keyed by name, so a name already taken gets a " (2)",
+    " (3)"... suffix.
+    """
+    if config is None:
+        config = load_config()
+    default = Instance(DEFAULT_INSTANCE_NAME, BASE_URL, config.get("api_key"))
+    instances = [default]
+    seen = {default.url}
+    names = {default.name}
+    for entry in config.get("instances", []):
+        url = entry.get("url", "").rstrip("/")
+        if not url or url in seen:
+            continue
+        seen.add(url)
+        name = base = entry.get("name") or url.split("://", 1)[-1]
+        n = 2
+        while name in names:
+            name = f"{base} ({n})"
+            n += 1
+        names.add(name)
+        api_key = (_get_api_key_from_keyring(f"elementary-l10n:{url}")
+                   or entry.get("api_key"))
+        namespace = "".join(c if c.isalnum() else "_" for c in url.split("://", 1)[-1])
+        instances.append(Instance(name, url, api_key, entry.get("request_delay"), namespace))
+    return instances
+
+
+_cache_lock = threading.Lock()
+
+
+def _read_legacy_cache(cache_file: Path) -> dict:
+    """{language: (rows, timestamp)} from a JSON cache of older versions."""
     try:
-        cache = json.loads(CACHE_FILE.read_text())
-        if cache.get("language") == language_code:
-            return cache["data"], cache["timestamp"]
+        cache = json.loads(cache_file.with_suffix(".json").read_text())
     except Exception:
-        pass
-    return None, None
+        return {}
+    if "languages" in cache:
+        return {code: (e["data"], e["timestamp"]) for code, e in cache["languages"].items()}
+    if "language" in cache:
+        return {cache["language"]: (cache["data"], cache["timestamp"])}
+    return {}
+
+
+def _open_store(cache_file: Path) -> store.StoreFile:
+    """The store file, converting an old JSON cache on first use."""
+    if not cache_file.exists():
+        legacy = _read_legacy_cache(cache_file)
+        if legacy:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with _cache_lock, store.locked(cache_file):
+                store.write_store(cache_file, {
+                    code: (ts, *store.encode_rows(rows)) for code, (rows, ts) in legacy.items()
+                })
+            cache_file.with_suffix(".json").unlink(missing_ok=True)
+    return store.StoreFile.open(cache_file)
 
 
-def save_cache(language_code: str, data: list):
-    """Save data to cache with current timestamp."""
+def load_cache(language_code: str,
+               instance: Instance | None = None) -> tuple[list | None, float | None]:
+    """Load cached data, however old. Returns (data, timestamp) or (None, None).
+
+    Only the index and this language's blob are decoded.
+    """
+    entry = _open_store(instance.cache_file if instance else CACHE_FILE).rows(language_code)
+    return entry if entry else (None, None)
+
+
+def save_cache(language_code: str, data: list, instance: Instance | None = None):
+    """Save data for one language with the current timestamp.
+
+    Every language fetched is kept, so the whole store stays usable offline;
+    the other languages' blobs are copied over without being decoded.
+    """
+    save_caches({language_code: data}, instance)
+
+
+def save_caches(data: dict[str, list], instance: Instance | None = None):
+    """Save several languages at once, rewriting the store files once."""
+    cache_file = instance.cache_file if instance else CACHE_FILE
+    previous_file = instance.previous_file if instance else CACHE_DIR / "previous.bin"
+    encoded = {code: store.encode_rows(rows) for code, rows in data.items()}
     CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    CACHE_FILE.write_text(json.dumps({
-        "language": language_code,
-        "data": data,
-        "timestamp": time.time(),
-    }, indent=2))
+    # The GUI and `serve` may share the store: the read-modify-write below
+    # must not interleave with another process's
+    with _cache_lock, store.locked(cache_file):
+        current = store.StoreFile.open(cache_file)
+        blobs = {code: current.blob(code) for code in current.index}
+        replaced = [code for code in encoded if code in blobs]
+        if replaced:
+            # Keep the replaced rows so the next diff has something to compare
+            previous = store.StoreFile.open(previous_file)
+            old = {code: previous.blob(code) for code in previous.index}
+            old.update((code, blobs[code]) for code in replaced)
+            store.write_store(previous_file, old)
+        now = time.time()
+        blobs.update((code, (now, blob, codec)) for code, (blob, codec) in encoded.items())
+        store.write_store(cache_file, blobs)
+
+
+def cached_languages(instance: Instance | None = None) -> dict[str, float]:
+    """Language codes in the local store, with the time each was fetched."""
+    return _open_store(instance.cache_file if instance else CACHE_FILE).languages()
+
+
+def load_previous(language_code: str,
+                  instance: Instance | None = None) -> tuple[list | None, float | None]:
+    """Rows stored for a language before its latest refresh, or (None, None)."""
+    path = instance.previous_file if instance else CACHE_DIR / "previous.bin"
+    entry = store.StoreFile.open(path).rows(language_code)
+    return entry if entry else (None, None)
+
 
+def load_store(language_code: str,
+               instances: list[Instance] | None = None) -> tuple[list, float | None]:
+    """All stored rows for a language across instances, however old.
+
+    Returns (rows, oldest timestamp), or ([], None) if nothing is stored.
+    """
+    return _collect(load_cache, language_code, instances)
+
+
+def load_previous_store(language_code: str,
+                        instances: list[Instance] | None = None) -> tuple[list, float | None]:
+    """Like load_store(), for the rows before each instance's latest refresh.
+
+    An instance refreshed only once contributes its current rows, so it
+    shows up as unchanged rather than entirely new.
+    """
+    def _load(code, inst):
+        data, ts = load_previous(code, inst)
+        return (data, ts) if data else load_cache(code, inst)
+    return _collect(_load, language_code, instances)
+
+
+def _collect(load, language_code: str, instances) -> tuple[list, float | None]:
+    rows, oldest = [], None
+    for inst in instances or [default_instance()]:
+        data, ts = load(language_code, inst)
+        if data:
+            rows.extend(data)
+            oldest = ts if oldest is None else min(oldest, ts)
+    return rows, oldest
+
+
+# Outcome of the last connection attempt per server: url -> (ok, monotonic time)
+_health = {}
+_health_lock = threading.Lock()
+
+
+def _record_health(base: str, ok: bool):
+    with _health_lock:
+        _health[base] = (ok, time.monotonic())
+
+
+def recently_unreachable(url: str) -> bool:
+    """True if connecting to the server at url failed within HEALTH_TTL."""
+    with _health_lock:
+        ok, when = _health.get(url.rstrip("/"), (True, 0.0))
+    return not ok and time.monotonic() - when < HEALTH_TTL
+
+
+def check_health(instance: Instance) -> bool:
+    """Cheap reachability check: HEAD on the API root, any HTTP answer counts."""
+    try:
+        instance.make_session().head(f"{instance.api}/", timeout=TIMEOUT)
+    except requests.ReadTimeout:
+        pass  # connected, just slow
+    except requests.ConnectionError:
+        _record_health(instance.url, False)
+        return False
+    _record_health(instance.url, True)
+    return True
 
-def _request_with_retry(session: requests.Session, url: str, max_retries: int = 3) -> requests.Response:
-    """Make a GET request with exponential backoff on 429."""
+
+def _wire_size(r: requests.Response, size: int) -> int:
+    """Bytes actually received for a response body (before decompression)."""
+    try:
+        return r.raw.tell() or size
+    except Exception:
+        return size
+
+
+class _SingleFlight:
+    """Run one call per key at a time; concurrent callers share its outcome."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn: Callable, on_shared: Callable | None = None):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {"done": threading.Event()}
+        if not leader:
+            call["done"].wait()
+            if on_shared:
+                on_shared()
+            if "error" in call:
+                raise call["error"]
+            return call["result"]
+        try:
+            call["result"] = fn()
+            return call["result"]
+        except BaseException as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["done"].set()
+
+
+_in_flight = _SingleFlight()
+
+
+def _request_with_retry(session: requests.Session, url: str, max_retries: int = 3,
+                        headers: dict | None = None) -> requests.Response:
+    """Make a GET request with exponential backoff on 429 and read timeouts.
+
+    Connection failures raise OfflineError. Every request also refreshes the
+    server's health state, so no separate connectivity probe is needed.
+    A request identical to one already in flight on another thread (same
+    URL, credentials and headers) waits for that one and shares its response.
+    On a background thread it first waits for foreground fetches to finish,
+    also when the caller took no request slot.
+    """
+    if _is_background():
+        _foreground.wait_idle()
+    key = (url, session.headers.get("Authorization"), tuple(sorted((headers or {}).items())))
+    return _in_flight.do(key, lambda: _request(session, url, max_retries, headers),
+                         lambda: DIAGNOSTICS.record_shared(url))
+
+
+def _request(session: requests.Session, url: str, max_retries: int,
+             headers: dict | None) -> requests.Response:
+    base = url.split("/api/", 1)[0]
     for attempt in range(max_retries + 1):
-        r = session.get(url, timeout=15)
+        start = time.perf_counter()
+        try:
+            r = session.get(url, timeout=TIMEOUT, headers=headers)
+        except requests.ConnectionError:  # includes ConnectTimeout
+            _record_health(base, False)
+            raise OfflineError(
+                f"Could not connect to {base.split('://', 1)[-1]}. Check your network.")
+        except requests.ReadTimeout:
+            # Connected but slow to answer: the server is up, so retry
+            _record_health(base, True)
+            if attempt >= max_retries:
+                raise RuntimeError("Weblate did not answer in time. Try again later.")
+            wait = 2 ** (attempt + 1)
+            DIAGNOSTICS.record_timeout(url, wait)
+            time.sleep(wait)
+            continue
+        _record_health(base, True)
+        size = len(r.content)
+        DIAGNOSTICS.record_request(url, r.status_code, start, time.perf_counter() - start,
+                                   size, _wire_size(r, size))
         if r.status_code == 401:
             raise RuntimeError(
                 "Authentication failed (401). Your API key may be invalid or expired.\n"
                 "Go to Settings and enter a valid API key from:\n"
-                "https://l10n.elementaryos.org/accounts/profile/#api"
+                f"{base}/accounts/profile/#api"
             )
         if r.status_code == 429:
             if attempt >= max_retries:
@@ -163,6 +548,7 @@ def _request_with_retry(session: requests.Session, url: str, max_retries: int =
                     f"The server is throttling requests. Try again later."
                 )
             wait = 2 ** (attempt + 1)
+            DIAGNOSTICS.record_backoff(url, wait)
             time.sleep(wait)
             continue
         r.raise_for_status()
@@ -172,16 +558,31 @@ def _request_with_retry(session: requests.Session, url: str, max_retries: int =
     return r
 
 
-def _get_all(url: str, session: requests.Session) -> list:
-    """Paginate through Weblate API results with rate limiting."""
+def _delay(instance: Instance | None = None, factor: float = 1.0):
+    """Sleep REQUEST_DELAY between API calls, recording the time spent."""
+    if instance:
+        instance.delay(factor)
+        return
+    DIAGNOSTICS.record_delay(REQUEST_DELAY * factor)
+    time.sleep(REQUEST_DELAY * factor)
+
+
+def _get_all(url: str, session: requests.Session, instance: Instance | None = None,
+             factor: float = 1.0) -> list:
+    """Paginate through Weblate API results with rate limiting.
+
+    An endpoint that answers with a plain list is returned as-is.
+    """
     results = []
     while url:
         r = _request_with_retry(session, url)
         data = r.json()
+        if isinstance(data, list):
+            return results + data
         results.extend(data.get("results", []))
         url = data.get("next")
         if url:
-            time.sleep(REQUEST_DELAY)
+            _delay(instance, factor)
     return results
 
 
@@ -194,125 +595,549 @@ def _make_session(api_key: str | None = None) -> requests.Session:
     return session
 
 
-def fetch_projects(session: requests.Session) -> list[dict]:
-    return _get_all(f"{API}/projects/", session)
+def _api(instance: Instance | None) -> str:
+    return instance.api if instance else API
+
+
+def _base(instance: Instance | None) -> str:
+    return instance.url if instance else BASE_URL
+
 
+def fetch_projects(session: requests.Session, instance: Instance | None = None) -> list[dict]:
+    return _get_all(f"{_api(instance)}/projects/", session, instance)
 
-def fetch_components(project_slug: str, session: requests.Session) -> list[dict]:
-    return _get_all(f"{API}/projects/{project_slug}/components/", session)
+
+def fetch_components(project_slug: str, session: requests.Session,
+                     instance: Instance | None = None, factor: float = 1.0) -> list[dict]:
+    return _get_all(f"{_api(instance)}/projects/{project_slug}/components/",
+                    session, instance, factor)
 
 
 def fetch_statistics(project_slug: str, component_slug: str,
-                     language_code: str, session: requests.Session) -> dict:
-    url = f"{API}/translations/{project_slug}/{component_slug}/{language_code}/statistics/"
+                     language_code: str, session: requests.Session,
+                     instance: Instance | None = None) -> dict:
+    url = (f"{_api(instance)}/translations/{project_slug}/{component_slug}/"
+           f"{language_code}/statistics/")
     r = _request_with_retry(session, url)
     return r.json()
 
 
 def fetch_component_statistics(project_slug: str, component_slug: str,
-                               session: requests.Session) -> list[dict]:
+                               session: requests.Session,
+                               instance: Instance | None = None) -> list[dict]:
     return _get_all(
-        f"{API}/components/{project_slug}/{component_slug}/statistics/", session
+        f"{_api(instance)}/components/{project_slug}/{component_slug}/statistics/",
+        session, instance,
     )
 
 
-def component_web_url(project_slug: str, component_slug: str) -> str:
-    return f"{BASE_URL}/projects/{project_slug}/{component_slug}/"
+def fetch_units_page(project_slug: str, component_slug: str, language_code: str,
+                     session: requests.Session, instance: Instance | None = None,
+                     page: int = 1, query: str = "state:<translated",
+                     headers: dict | None = None) -> requests.Response:
+    """One page of a translation's units matching a Weblate search query.
+
+    Returns the response itself, so callers can read validators and handle
+    304 Not Modified when they pass If-None-Match/If-Modified-Since.
+    """
+    url = (f"{_api(instance)}/translations/{project_slug}/{component_slug}/"
+           f"{language_code}/units/?{urlencode({'q': query, 'page': page})}")
+    return _request_with_retry(session, url, headers=headers)
+
+
+def component_web_url(project_slug: str, component_slug: str,
+                      instance: Instance | None = None) -> str:
+    return f"{_base(instance)}/projects/{project_slug}/{component_slug}/"
 
 
 def component_translate_url(project_slug: str, component_slug: str,
-                            language_code: str) -> str:
-    return f"{BASE_URL}/projects/{project_slug}/{component_slug}/{language_code}/"
+                            language_code: str, instance: Instance | None = None) -> str:
+    return f"{_base(instance)}/projects/{project_slug}/{component_slug}/{language_code}/"
+
+
+def _make_row(proj: dict, comp: dict, language_code: str, stats: dict,
+              instance: Instance | None = None) -> dict:
+    """Build the row model shared by every fetch path from a statistics dict."""
+    ps, cs = proj["slug"], comp["slug"]
+    return {
+        "instance": instance.name if instance else DEFAULT_INSTANCE_NAME,
+        "project": proj["name"],
+        "project_slug": ps,
+        "component": comp["name"],
+        "component_slug": cs,
+        "translated_percent": stats.get("translated_percent", 0.0),
+        "total_words": stats.get("total_words", 0),
+        "translated_words": stats.get("translated_words", 0),
+        "url": component_web_url(ps, cs, instance),
+        "translate_url": component_translate_url(ps, cs, language_code, instance),
+    }
+
+
+class Catalog:
+    """Project and component listings of one instance, shared by all languages.
+
+    The listings change far less often than statistics, so they are cached
+    on disk for CATALOG_TTL. After that each listing is revalidated with
+    If-None-Match/If-Modified-Since on its first page (which carries the
+    total count), so an unchanged listing costs a single 304.
+    """
+
+    def __init__(self, instance: Instance, session: requests.Session):
+        self._instance = instance
+        self._session = session
+        try:
+            data = json.loads(instance.catalog_file.read_text())
+        except Exception:
+            data = {}
+        self._lists = data.get("lists", {})
+        self.timestamp = data.get("timestamp", 0.0)
+        self.fresh = bool(self._lists) and time.time() - self.timestamp < CATALOG_TTL
+        self._seen = {}
+        self._fetched = False
+
+    def projects(self) -> list[dict]:
+        # Often the first request of a fetch: the user's starts at once,
+        # background work waits for its slot
+        return self._listing(f"{self._instance.api}/projects/", 1.0, delay=_is_background())
+
+    def components(self, project_slug: str, factor: float = 1.0) -> list[dict]:
+        return self._listing(
+            f"{self._instance.api}/projects/{project_slug}/components/", factor)
+
+    def _listing(self, url: str, factor: float, delay: bool = True) -> list[dict]:
+        if url in self._seen:
+            return self._seen[url]["results"]
+        cached = self._lists.get(url)
+        if self.fresh and cached is not None:
+            self._seen[url] = cached
+            return cached["results"]
+
+        if delay:
+            _delay(self._instance, factor)
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        r = _request_with_retry(self._session, url, headers=headers)
+        self._fetched = True
+        if r.status_code == 304 and cached is not None:
+            self._seen[url] = cached
+            return cached["results"]
+
+        entry = {"results": [], "etag": r.headers.get("ETag"),
+                 "last_modified": r.headers.get("Last-Modified")}
+        while True:
+            data = r.json()
+            # Rows only need names and slugs; keep the file small
+            entry["results"].extend({"name": item["name"], "slug": item["slug"]}
+                                    for item in data.get("results", []))
+            url_next = data.get("next")
+            if not url_next:
+                break
+            _delay(self._instance, factor)
+            r = _request_with_retry(self._session, url_next)
+        self._seen[url] = entry
+        return entry["results"]
+
+    def save(self, complete: bool = True):
+        """Persist the listings seen this run.
+
+        Pass complete=False after discovering only some projects: the
+        listings seen are merged in and the catalog keeps its age, so the
+        others are still revalidated when it goes stale.
+        """
+        if not self._fetched:
+            return
+        if self.fresh or not complete:
+            # Add what was fetched, keep the age
+            timestamp, lists = self.timestamp, {**self._lists, **self._seen}
+        else:
+            timestamp, lists = time.time(), self._seen
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            self._instance.catalog_file.write_text(json.dumps({
+                "timestamp": timestamp,
+                "lists": lists,
+            }))
+        except Exception:
+            pass
+
+
+def load_language_index(instance: Instance) -> tuple[LanguageIndex | None, float]:
+    """Cached language index and its timestamp (0 if there is none)."""
+    try:
+        data = json.loads(instance.languages_file.read_text())
+        return LanguageIndex.from_dict(data), data.get("timestamp", 0.0)
+    except Exception:
+        return None, 0.0
+
+
+def language_index(instance: Instance, session: requests.Session | None = None,
+                   catalog: Catalog | None = None) -> LanguageIndex | None:
+    """The instance's language index, refetched when older than LANGUAGES_TTL.
+
+    Costs one paginated /languages/ listing plus one request per project.
+    Returns the stale index, or None, if the refetch fails.
+    """
+    index, timestamp = load_language_index(instance)
+    if index is not None and time.time() - timestamp < LANGUAGES_TTL:
+        return index
+    session = session or instance.make_session()
+    catalog = catalog or Catalog(instance, session)
+    try:
+        if _is_background():
+            _delay(instance)
+        names = {lang["code"]: lang["name"]
+                 for lang in _get_all(f"{instance.api}/languages/", session, instance)}
+        projects = {}
+        for proj in catalog.projects():
+            _delay(instance)
+            items = _get_all(f"{instance.api}/projects/{proj['slug']}/languages/",
+                             session, instance)
+            projects[proj["slug"]] = [lang["code"] for lang in items]
+            for lang in items:
+                # The /languages/ listing names a language best; only fill gaps
+                names.setdefault(lang["code"], lang.get("name", lang["code"]))
+    except (OfflineError, requests.HTTPError, ValueError, KeyError):
+        return index
+    index = LanguageIndex(names, projects)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        instance.languages_file.write_text(json.dumps({**index.to_dict(),
+                                                       "timestamp": time.time()}))
+    except Exception:
+        pass
+    return index
+
+
+_histories = {}
+_histories_lock = threading.Lock()
+
+
+def discover(instance: Instance, session: requests.Session | None = None
+             ) -> tuple[list[tuple[dict, dict]], LanguageIndex | None]:
+    """Every (project, component) of an instance and its language index.
+
+    Blocking. Listings come from the Catalog while it is fresh and are
+    revalidated with conditional requests after that, so an unchanged
+    server costs a few 304s at most. Raises OfflineError straight away if
+    the server failed moments ago.
+    """
+    if recently_unreachable(instance.url):
+        raise OfflineError(f"Could not connect to {instance.host}. Check your network.")
+    session = session or instance.make_session()
+    catalog = Catalog(instance, session)
+    languages = language_index(instance, session, catalog)
+    with DIAGNOSTICS.phase(f"discovery {instance.name}"):
+        tasks = [(proj, comp) for proj in catalog.projects()
+                 for comp in catalog.components(proj["slug"])]
+    catalog.save()
+    return tasks, languages
+
+
+def _fetch_history() -> FetchHistory:
+    """The FetchHistory shared by all instance threads (one per cache dir)."""
+    path = CACHE_DIR / "fetch-history.json"
+    with _histories_lock:
+        if path not in _histories:
+            _histories[path] = FetchHistory(path)
+        return _histories[path]
+
+
+def _fetch_rows(instance: Instance, language_code: str,
+                progress_cb: Callable | None = None, watch: WatchList | None = None,
+                partial_cb: Callable | None = None,
+                watch_only: bool = False) -> list[dict]:
+    """Fetch the row model for one instance and language (blocking).
+
+    With a watch list, pinned components are fetched first and handed to
+    partial_cb(rows); the rest follows at a lower rate unless watch_only.
+    """
+    session = instance.make_session()
+
+    # The first real request doubles as the connectivity check; only a
+    # server that failed moments ago is skipped without trying again.
+    if recently_unreachable(instance.url):
+        raise OfflineError(f"Could not connect to {instance.host}. Check your network.")
+
+    watch = watch or WatchList()
+    history = _fetch_history()
+    catalog = Catalog(instance, session)
+    languages = language_index(instance, session, catalog)
+    rows = []
+
+    def _fetch_stats(tasks, start, total, factor):
+        # Visible, stale and frequently changing components go first
+        scheduler = FetchScheduler(tasks, language_code, instance.name, history)
+        idx = start
+        while (task := scheduler.pop()) is not None:
+            proj, comp = task
+            ps = proj["slug"]
+            cs = comp["slug"]
+            if progress_cb:
+                progress_cb(idx, total, comp["name"])
+            idx += 1
+            if languages and not languages.project_has(ps, language_code):
+                # Nothing translated into this language yet; no request needed
+                stats = {}
+            else:
+                _delay(instance, factor)
+                try:
+                    stats = fetch_statistics(ps, cs, language_code, session, instance)
+                except requests.HTTPError:
+                    stats = {}
+
+            row = _make_row(proj, comp, language_code, stats, instance)
+            history.record(language_code, row)
+            rows.append(row)
+        history.save()
+
+    with DIAGNOSTICS.phase(f"discovery {instance.name}"):
+        projects = catalog.projects()
+    pinned_projects, other_projects = split_projects(projects, watch)
+
+    # Pinned items first, at the normal rate, so they are current in seconds
+    all_tasks = []
+    pinned_tasks = []
+    if watch:
+        with DIAGNOSTICS.phase(f"pinned {instance.name}"):
+            for proj in pinned_projects:
+                for comp in catalog.components(proj["slug"]):
+                    all_tasks.append((proj, comp))
+            pinned_tasks, _rest = split_tasks(all_tasks, watch)
+            _fetch_stats(pinned_tasks, 0, len(pinned_tasks), 1.0)
+        if partial_cb:
+            partial_cb(list(rows))
+        if watch_only:
+            catalog.save(complete=False)
+            if progress_cb:
+                progress_cb(len(rows), len(rows), '')
+            return rows
+    else:
+        other_projects = projects
+
+    # Then everything else; slower when it is only background work
+    factor = BACKGROUND_DELAY_FACTOR if pinned_tasks else 1.0
+    with DIAGNOSTICS.phase(f"discovery {instance.name}"):
+        for proj in other_projects:
+            for comp in catalog.components(proj["slug"], factor):
+                all_tasks.append((proj, comp))
+    catalog.save()
+
+    _pinned, remaining = split_tasks(all_tasks, watch)
+    total = len(all_tasks)
+    with DIAGNOSTICS.phase(f"statistics {instance.name}"):
+        _fetch_stats(remaining, len(pinned_tasks), total, factor)
+
+    if progress_cb:
+        progress_cb(total, total, '')
+    return rows
 
 
 def fetch_all_data(language_code: str, callback: Callable, error_cb: Callable,
-                   cache_cb: Callable | None = None, progress_cb: Callable | None = None):
+                   cache_cb: Callable | None = None, progress_cb: Callable | None = None,
+                   instances: list[Instance] | None = None,
+                   partial_cb: Callable | None = None,
+                   offline_cb: Callable | None = None,
+                   max_age: float | None = None):
     """Fetch all projects, components and stats in a background thread.
 
+    Each instance is fetched on its own thread with its own session and
+    rate limit; rows are merged and tagged with row["instance"]. Pinned
+    components from config["watch"] are fetched first; with
+    config["watch_only"] the rest is served from the cache instead.
+
     callback(data) on fresh data.
     error_cb(exception) on failure.
     cache_cb(data, age_minutes) if cached data is available (<1h old).
     progress_cb(current, total, component_name) for progress updates.
+    partial_cb(data) with fresh rows for pinned components, before callback.
+    offline_cb(data, timestamp) instead of error_cb when no server could be
+    reached; data is everything stored for the language, however old.
+    With max_age, nothing is fetched if every instance has stored rows
+    younger than that (e.g. prefetched); they go to cache_cb only.
     """
+    config = load_config()
+    if instances is None:
+        instances = [default_instance()]
+    watch = WatchList.from_config(config)
+    watch_only = bool(watch and config.get("watch_only"))
+
     # Check cache first
-    cached_data, cached_ts = load_cache(language_code)
-    if cached_data and cached_ts:
-        age_seconds = time.time() - cached_ts
-        if age_seconds < 3600:  # < 1 hour
-            age_minutes = int(age_seconds / 60)
-            if cache_cb:
-                cache_cb(cached_data, age_minutes)
+    cached_rows, oldest, current = [], None, True
+    for inst in instances:
+        cached_data, cached_ts = load_cache(language_code, inst)
+        fresh = bool(cached_data and cached_ts and time.time() - cached_ts < 3600)
+        DIAGNOSTICS.record_cache(fresh)
+        if fresh:  # < 1 hour
+            cached_rows.extend(cached_data)
+            oldest = cached_ts if oldest is None else min(oldest, cached_ts)
+        current = current and fresh and max_age is not None and (
+            time.time() - cached_ts < max_age)
+    if cached_rows and cache_cb:
+        cache_cb(cached_rows, int((time.time() - oldest) / 60))
+        if current:
+            return
+
+    lock = threading.Lock()
+    progress = {}
+    results = {}
+
+    def _progress(inst, current, total, name):
+        if not progress_cb:
+            return
+        with lock:
+            progress[inst.name] = (current, total)
+            current = sum(c for c, _t in progress.values())
+            total = sum(t for _c, t in progress.values())
+        progress_cb(current, total, name)
+
+    def _instance_worker(inst):
+        try:
+            rows = _fetch_rows(
+                inst, language_code,
+                lambda c, t, n: _progress(inst, c, t, n),
+                watch, partial_cb, watch_only)
+            if watch_only:
+                # Keep unwatched components from the cache, however old
+                fetched = {(r["project_slug"], r["component_slug"]) for r in rows}
+                stale, _ts = load_cache(language_code, inst)
+                rows = rows + [r for r in stale or []
+                               if (r["project_slug"], r["component_slug"]) not in fetched]
+            save_cache(language_code, rows, inst)
+            results[inst.name] = rows
+        except requests.ConnectionError:  # e.g. mid-response
+            results[inst.name] = OfflineError(
+                f"Lost the connection to {inst.host}. Check your network.")
+        except Exception as e:
+            results[inst.name] = e
 
     def _worker():
+        threads = [threading.Thread(target=_instance_worker, args=(inst,), daemon=True)
+                   for inst in instances]
+        with _foreground:
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        rows, errors = [], []
+        for inst in instances:
+            result = results.get(inst.name)
+            if isinstance(result, Exception):
+                errors.append((inst, result))
+                # Keep a failed instance visible with its last known rows
+                stale, _ts = load_cache(language_code, inst)
+                rows.extend(stale or [])
+            else:
+                rows.extend(result or [])
+        if errors and len(errors) == len(instances):
+            if offline_cb and all(isinstance(e, OfflineError) for _i, e in errors):
+                offline_cb(*load_store(language_code, instances))
+                return
+            error_cb(errors[0][1] if len(errors) == 1 else RuntimeError(
+                "\n\n".join(f"{inst.name}: {e}" for inst, e in errors)))
+        else:
+            callback(rows)
+
+    t = threading.Thread(target=_worker, daemon=True)
+    t.start()
+
+
+def fetch_languages(languages: list[str] | None = None,
+                    instances: list[Instance] | None = None,
+                    progress_cb: Callable | None = None) -> dict[str, list]:
+    """Rows for many languages in one pass, saved to the store (blocking).
+
+    Each component's /statistics/ listing covers all of its languages, so
+    a pass costs about one request per component however many languages
+    there are. A component without a language gets a 0% row for it, as
+    with fetch_all_data. languages limits what is kept (default: every
+    language seen). Raises OfflineError if no instance could be reached.
+
+    progress_cb(current, total, component_name) for progress updates.
+    """
+    wanted = set(languages) if languages else None
+    merged, errors = {}, []
+    for inst in instances or [default_instance()]:
         try:
-            config = load_config()
-            api_key = config.get("api_key")
-            session = _make_session(api_key)
+            rows = _fetch_languages(inst, wanted, progress_cb)
+        except (OfflineError, requests.RequestException, RuntimeError) as e:
+            errors.append(e)
+            continue
+        save_caches(rows, inst)
+        for code, data in rows.items():
+            merged.setdefault(code, []).extend(data)
+    if errors and not merged:
+        raise errors[0]
+    return merged
 
-            # Quick connectivity check first
-            try:
-                r = session.get(f"{API}/projects/", timeout=10)
-                if r.status_code == 429:
-                    try:
-                        detail = r.json().get("errors", [{}])[0].get("detail", "")
-                    except Exception:
-                        detail = ""
-                    raise RuntimeError(
-                        f"Weblate is rate limiting requests. {detail}\n"
-                        "Try again later or check your API key in Settings."
-                    )
-                if r.status_code == 401:
-                    raise RuntimeError(
-                        "API key is invalid or expired (401).\n"
-                        "Update your key in Settings:\n"
-                        "https://l10n.elementaryos.org/accounts/profile/#api"
-                    )
-            except requests.ConnectionError:
-                raise RuntimeError("Could not connect to l10n.elementaryos.org. Check your network.")
-            except requests.Timeout:
-                raise RuntimeError("Connection to Weblate timed out. Try again later.")
-
-            projects = fetch_projects(session)
-            rows = []
-
-            # First pass: collect all components to know total count
-            all_tasks = []
-            for proj in projects:
-                ps = proj["slug"]
-                time.sleep(REQUEST_DELAY)
-                components = fetch_components(ps, session)
-                for comp in components:
-                    all_tasks.append((proj, comp))
 
-            total = len(all_tasks)
-            for idx, (proj, comp) in enumerate(all_tasks):
-                ps = proj["slug"]
-                cs = comp["slug"]
-                if progress_cb:
-                    progress_cb(idx, total, comp["name"])
-                time.sleep(REQUEST_DELAY)
-                try:
-                    stats = fetch_statistics(ps, cs, language_code, session)
-                    pct = stats.get("translated_percent", 0.0)
-                except requests.HTTPError:
-                    pct = 0.0
-
-                rows.append({
-                        "project": proj["name"],
-                        "project_slug": ps,
-                        "component": comp["name"],
-                        "component_slug": cs,
-                        "translated_percent": pct,
-                        "url": component_web_url(ps, cs),
-                        "translate_url": component_translate_url(ps, cs, language_code),
-                    })
+def _fetch_languages(instance: Instance, wanted: set | None,
+                     progress_cb: Callable | None) -> dict[str, list]:
+    if recently_unreachable(instance.url):
+        raise OfflineError(f"Could not connect to {instance.host}. Check your network.")
+    session = instance.make_session()
+    catalog = Catalog(instance, session)
+    with DIAGNOSTICS.phase(f"discovery {instance.name}"):
+        tasks = [(proj, comp) for proj in catalog.projects()
+                 for comp in catalog.components(proj["slug"])]
+    catalog.save()
 
+    found = []
+    with DIAGNOSTICS.phase(f"statistics {instance.name}"):
+        for idx, (proj, comp) in enumerate(tasks):
             if progress_cb:
-                progress_cb(total, total, '')
-            save_cache(language_code, rows)
-            callback(rows)
-        except Exception as e:
-            error_cb(e)
+                progress_cb(idx, len(tasks), comp["name"])
+            _delay(instance)
+            try:
+                stats = fetch_component_statistics(proj["slug"], comp["slug"],
+                                                   session, instance)
+            except requests.HTTPError:
+                stats = []
+            found.append({s["code"]: s for s in stats
+                          if s.get("code") and (wanted is None or s["code"] in wanted)})
+    if progress_cb:
+        progress_cb(len(tasks), len(tasks), "")
 
-    t = threading.Thread(target=_worker, daemon=True)
+    codes = set(wanted) if wanted is not None else set().union(*found)
+    return {code: [_make_row(proj, comp, code, by_code.get(code, {}), instance)
+                   for (proj, comp), by_code in zip(tasks, found)]
+            for code in sorted(codes)}
+
+
+def prefetch_languages(languages: list[str], done_cb: Callable | None = None,
+                       instances: list[Instance] | None = None,
+                       max_age: float = PREFETCH_MAX_AGE) -> threading.Thread:
+    """Fetch languages into the store one after another, at background priority.
+
+    Requests wait while a foreground fetch runs and are spaced at
+    BACKGROUND_DELAY_FACTOR, sharing each server's request slots. Languages
+    stored less than max_age seconds ago are skipped.
+    done_cb(fetched, failed) runs on the worker thread with language codes.
+    """
+    if instances is None:
+        instances = load_instances()
+    watch = WatchList.from_config(load_config())
+
+    def _worker():
+        _priority.background = True
+        fetched, failed = [], []
+        for code in languages:
+            ok = True
+            for inst in instances:
+                _data, ts = load_cache(code, inst)
+                if ts is not None and time.time() - ts < max_age:
+                    continue
+                try:
+                    save_cache(code, _fetch_rows(inst, code, watch=watch), inst)
+                except Exception:
+                    ok = False
+            (fetched if ok else failed).append(code)
+        if done_cb:
+            done_cb(fetched, failed)
+
+    t = threading.Thread(target=_worker, daemon=True, name="prefetch")
     t.start()
+    return t
@@ -0,0 +1,308 @@
+"""asyncio Weblate client, a concurrent alternative to the threaded one.
+
+Requires httpx (``pip install elementary-l10n[async]``). All requests share
+one event loop and one connection pool. Request *starts* take slots from
+the same per-instance budget as the threaded client (Instance.reserve),
+rather than serialising whole round-trips, so server latency is
+overlapped while the rate limit holds across both clients.
+
+Headless tools can await the coroutines directly::
+
+    rows = await weblate_async.fetch_rows("sv")
+
+GUI code calls fetch_all_data(), which has the same callback signature as
+weblate.fetch_all_data() but runs on a single shared loop thread instead
+of one thread per job. It currently covers the default instance only.
+
+Only the statistics phase is asynchronous. Discovery goes through
+weblate.discover(), so the catalog cache, conditional revalidation, the
+language index and the health fast-fail apply as in the threaded client.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Callable
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+from . import weblate
+from .diagnostics import DIAGNOSTICS
+from .planner import WatchList, split_tasks
+
+MAX_CONCURRENCY = 8  # simultaneous in-flight requests
+
+
+class AsyncClient:
+    """Shared httpx client and concurrency limit for one instance.
+
+    A background client waits for foreground fetches to finish before
+    each request and takes slots at BACKGROUND_DELAY_FACTOR spacing, like
+    a background thread of the threaded client.
+    """
+
+    def __init__(self, instance: "weblate.Instance | None" = None,
+                 concurrency: int = MAX_CONCURRENCY, background: bool = False,
+                 api_key: str | None = None):
+        if not HAS_HTTPX:
+            raise RuntimeError("The asyncio client requires httpx: pip install httpx")
+        self.instance = instance or weblate.default_instance()
+        self.api = self.instance.api
+        self.background = background
+        api_key = api_key or self.instance.api_key
+        headers = {"User-Agent": "elementary-l10n/0.1.0"}
+        if api_key:
+            headers["Authorization"] = f"Token {api_key}"
+        self._client = httpx.AsyncClient(
+            headers=headers, timeout=httpx.Timeout(weblate.TIMEOUT[1],
+                                                    connect=weblate.TIMEOUT[0]),
+            limits=httpx.Limits(max_connections=concurrency),
+        )
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_exc):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def _slot(self):
+        if self.background:
+            await asyncio.to_thread(weblate._foreground.wait_idle)
+        wait = self.instance.reserve(background=self.background)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def get(self, url: str, max_retries: int = 3) -> "httpx.Response":
+        """GET with rate limiting and exponential backoff on 429 and read timeouts.
+
+        Errors map as in weblate._request: connection failures raise
+        weblate.OfflineError, a server that keeps timing out RuntimeError.
+        """
+        base = url.split("/api/", 1)[0]
+        for attempt in range(max_retries + 1):
+            await self._slot()
+            failure = None
+            async with self._semaphore:
+                start = time.perf_counter()
+                try:
+                    r = await self._client.get(url)
+                except (httpx.ConnectError, httpx.ConnectTimeout):
+                    failure = "offline"
+                except httpx.TimeoutException:
+                    failure = "timeout"
+                except httpx.TransportError:  # e.g. dropped mid-response
+                    failure = "offline"
+            if failure == "offline":
+                weblate._record_health(base, False)
+                raise weblate.OfflineError(
+                    f"Could not connect to {base.split('://', 1)[-1]}. Check your network.")
+            weblate._record_health(base, True)
+            if failure == "timeout":
+                # Connected but slow to answer: the server is up, so retry
+                if attempt >= max_retries:
+                    raise RuntimeError("Weblate did not answer in time. Try again later.")
+                wait = 2 ** (attempt + 1)
+                DIAGNOSTICS.record_timeout(url, wait)
+                await asyncio.sleep(wait)
+                continue
+            DIAGNOSTICS.record_request(url, r.status_code, start,
+                                       time.perf_counter() - start, len(r.content))
+            if r.status_code == 401:
+                raise RuntimeError(
+                    "Authentication failed (401). Your API key may be invalid or expired.\n"
+                    "Go to Settings and enter a valid API key from:\n"
+                    f"{base}/accounts/profile/#api"
+                )
+            if r.status_code == 429:
+                if attempt >= max_retries:
+                    try:
+                        detail = json.loads(r.text).get("errors", [{}])[0].get("detail", "")
+                    except Exception:
+                        detail = ""
+                    raise RuntimeError(
+                        f"Rate limited by Weblate (429). {detail}\n"
+                        f"The server is throttling requests. Try again later."
+                    )
+                wait = 2 ** (attempt + 1)
+                DIAGNOSTICS.record_backoff(url, wait)
+                await asyncio.sleep(wait)
+                continue
+            r.raise_for_status()
+            return r
+        r.raise_for_status()
+        return r
+
+    async def get_all(self, url: str) -> list:
+        """Paginate through Weblate API results."""
+        results = []
+        while url:
+            data = (await self.get(url)).json()
+            results.extend(data.get("results", []))
+            url = data.get("next")
+        return results
+
+    async def fetch_projects(self) -> list[dict]:
+        return await self.get_all(f"{self.api}/projects/")
+
+    async def fetch_components(self, project_slug: str) -> list[dict]:
+        return await self.get_all(f"{self.api}/projects/{project_slug}/components/")
+
+    async def fetch_statistics(self, project_slug: str, component_slug: str,
+                               language_code: str) -> dict:
+        url = (f"{self.api}/translations/{project_slug}/{component_slug}/"
+               f"{language_code}/statistics/")
+        return (await self.get(url)).json()
+
+    async def fetch_component_statistics(self, project_slug: str,
+                                         component_slug: str) -> list[dict]:
+        return await self.get_all(
+            f"{self.api}/components/{project_slug}/{component_slug}/statistics/")
+
+
+async def _gather(coros) -> list:
+    """asyncio.gather() that cancels and awaits the other tasks when one fails.
+
+    The client is closed as soon as the error propagates, so no task may
+    be left running against it.
+    """
+    tasks = [asyncio.ensure_future(c) for c in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def fetch_rows(language_code: str, api_key: str | None = None,
+                     progress_cb: Callable | None = None,
+                     concurrency: int = MAX_CONCURRENCY,
+                     instance: "weblate.Instance | None" = None,
+                     watch: WatchList | None = None, partial_cb: Callable | None = None,
+                     watch_only: bool = False, background: bool = False) -> list[dict]:
+    """Fetch the row model for one language, statistics concurrently.
+
+    Pinned components from watch are fetched first and handed to
+    partial_cb(rows); with watch_only the rest is not fetched. A
+    background fetch yields to foreground fetches of either client.
+    """
+    instance = instance or weblate.default_instance()
+    tasks, languages = await asyncio.to_thread(weblate.discover, instance)
+    watch = watch or WatchList()
+    pinned, rest = split_tasks(tasks, watch)
+    if watch_only:
+        rest = []
+    total = len(pinned) + len(rest)
+    done = 0
+
+    async with AsyncClient(instance, concurrency, background, api_key) as client:
+        async def one(proj: dict, comp: dict) -> dict:
+            nonlocal done
+            if languages and not languages.project_has(proj["slug"], language_code):
+                stats = {}  # nothing translated into this language; no request
+            else:
+                try:
+                    stats = await client.fetch_statistics(proj["slug"], comp["slug"],
+                                                          language_code)
+                except httpx.HTTPStatusError:
+                    stats = {}
+            done += 1
+            if progress_cb:
+                progress_cb(done, total, comp["name"])
+            return weblate._make_row(proj, comp, language_code, stats, instance)
+
+        rows = []
+        with DIAGNOSTICS.phase("statistics"):
+            if pinned:
+                rows.extend(await _gather(one(p, c) for p, c in pinned))
+                if partial_cb:
+                    partial_cb(list(rows))
+            rows.extend(await _gather(one(p, c) for p, c in rest))
+        return rows
+
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared client loop, starting its thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, daemon=True,
+                             name="weblate-async").start()
+        return _loop
+
+
+def submit(coro, callback: Callable, error_cb: Callable):
+    """Run coro on the shared loop; callback(result) or error_cb(exception).
+
+    Callbacks run on the loop thread, like the threaded client's callbacks
+    run on its worker thread; GUI callers marshal with GLib.idle_add.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _get_loop())
+
+    def _done(f):
+        try:
+            result = f.result()
+        except Exception as e:
+            error_cb(e)
+            return
+        # Outside the try: a failing callback must not also report an error
+        callback(result)
+
+    future.add_done_callback(_done)
+    return future
+
+
+def fetch_all_data(language_code: str, callback: Callable, error_cb: Callable,
+                   cache_cb: Callable | None = None, progress_cb: Callable | None = None,
+                   offline_cb: Callable | None = None, partial_cb: Callable | None = None,
+                   max_age: float | None = None):
+    """Drop-in asyncio counterpart of weblate.fetch_all_data()."""
+    config = weblate.load_config()
+    watch = WatchList.from_config(config)
+    watch_only = bool(watch and config.get("watch_only"))
+    cached_data, cached_ts = weblate.load_cache(language_code)
+    fresh = bool(cached_data and cached_ts and time.time() - cached_ts < 3600)
+    DIAGNOSTICS.record_cache(fresh)
+    if fresh and cache_cb:
+        cache_cb(cached_data, int((time.time() - cached_ts) / 60))
+        if max_age is not None and time.time() - cached_ts < max_age:
+            return None
+
+    async def _job():
+        # The user is waiting: background prefetches of both clients hold back
+        with weblate._foreground:
+            rows = await fetch_rows(language_code, config.get("api_key"), progress_cb,
+                                    watch=watch, partial_cb=partial_cb,
+                                    watch_only=watch_only)
+        if watch_only:
+            # Keep unwatched components from the cache, however old
+            fetched = {(r["project_slug"], r["component_slug"]) for r in rows}
+            rows += [r for r in cached_data or []
+                     if (r["project_slug"], r["component_slug"]) not in fetched]
+        if progress_cb:
+            progress_cb(len(rows), len(rows), "")
+        weblate.save_cache(language_code, rows)
+        return rows
+
+    def _error(e):
+        if offline_cb and isinstance(e, weblate.OfflineError):
+            offline_cb(*weblate.load_store(language_code))
+        else:
+            error_cb(e)
+
+    return submit(_job(), callback, _error)
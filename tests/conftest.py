@@ -0,0 +1,46 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from elementary_l10n import weblate  # noqa: E402
+from mock_weblate import Dataset, MockWeblate  # noqa: E402
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the cache and config directories at a temporary directory."""
+    monkeypatch.setattr(weblate, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(weblate, "CACHE_FILE", tmp_path / "cache" / "cache.bin")
+    monkeypatch.setattr(weblate, "CONFIG_DIR", tmp_path / "config")
+    monkeypatch.setattr(weblate, "CONFIG_FILE", tmp_path / "config" / "config.json")
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def mock_weblate(cache_dir, monkeypatch):
+    """The benchmarks' mock Weblate (2 projects x 3 components) as the default instance."""
+    with MockWeblate(Dataset(6, per_project=3)) as server:
+        monkeypatch.setattr(weblate, "BASE_URL", server.url)
+        monkeypatch.setattr(weblate, "API", f"{server.url}/api")
+        monkeypatch.setattr(weblate, "REQUEST_DELAY", 0)
+        yield server
+
+
+def make_row(project, component, pct, instance="elementary", total_words=100):
+    return {
+        "instance": instance,
+        "project": project.title(),
+        "project_slug": project,
+        "component": component.title(),
+        "component_slug": component,
+        "translated_percent": pct,
+        "total_words": total_words,
+        "translated_words": round(total_words * pct / 100),
+        "url": f"https://l10n.example.org/projects/{project}/{component}/",
+        "translate_url": f"https://l10n.example.org/translate/{project}/{component}/sv/",
+    }
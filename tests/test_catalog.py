@@ -0,0 +1,87 @@
+import json
+
+from elementary_l10n import weblate
+
+
+def _catalog():
+    inst = weblate.default_instance()
+    return weblate.Catalog(inst, inst.make_session())
+
+
+def _listings(catalog):
+    return {p["slug"]: [c["slug"] for c in catalog.components(p["slug"])]
+            for p in catalog.projects()}
+
+
+def _age(days):
+    path = weblate.default_instance().catalog_file
+    data = json.loads(path.read_text())
+    data["timestamp"] -= days * 86400
+    path.write_text(json.dumps(data))
+
+
+def test_listings_follow_pagination_and_are_saved(mock_weblate):
+    mock_weblate.page_size = 2
+    catalog = _catalog()
+    assert _listings(catalog) == {
+        "project-0": ["component-0", "component-1", "component-2"],
+        "project-1": ["component-0", "component-1", "component-2"],
+    }
+    # Projects, then two pages of components per project
+    assert mock_weblate.requests == 5
+    catalog.save()
+
+    mock_weblate.reset_counters()
+    fresh = _catalog()
+    assert fresh.fresh
+    assert _listings(fresh) == _listings(catalog)
+    assert mock_weblate.requests == 0
+
+
+def test_stale_catalog_is_revalidated_with_etags(mock_weblate, monkeypatch):
+    mock_weblate.page_size = 2
+    catalog = _catalog()
+    expected = _listings(catalog)
+    catalog.save()
+    _age(weblate.CATALOG_TTL / 86400 + 1)
+
+    mock_weblate.reset_counters()
+    stale = _catalog()
+    assert not stale.fresh
+    assert _listings(stale) == expected
+    # One 304 per listing: the first page stands for the rest
+    assert mock_weblate.requests == mock_weblate.not_modified == 3
+
+
+def test_changed_listing_is_refetched(mock_weblate):
+    catalog = _catalog()
+    _listings(catalog)
+    catalog.save()
+    _age(weblate.CATALOG_TTL / 86400 + 1)
+    mock_weblate.dataset.components["project-1"].append(
+        {"name": "New", "slug": "new", "project": {"slug": "project-1"}})
+
+    mock_weblate.reset_counters()
+    stale = _catalog()
+    assert _listings(stale)["project-1"][-1] == "new"
+    assert mock_weblate.not_modified == 2
+    stale.save()
+    assert _catalog().fresh
+
+
+def test_partial_save_keeps_the_catalog_age(mock_weblate):
+    catalog = _catalog()
+    _listings(catalog)
+    catalog.save()
+    _age(weblate.CATALOG_TTL / 86400 + 1)
+    timestamp = _catalog().timestamp
+
+    stale = _catalog()
+    stale.components("project-0")
+    stale.save(complete=False)
+    saved = _catalog()
+    assert saved.timestamp == timestamp and not saved.fresh
+    # The listings not seen this run are still there
+    mock_weblate.reset_counters()
+    assert len(_listings(saved)) == 2
+    assert mock_weblate.requests == mock_weblate.not_modified
@@ -0,0 +1,45 @@
+import pytest
+
+from conftest import make_row
+from elementary_l10n import dashboard
+
+DATA = {
+    "sv": ([make_row("files", "files", 100.0), make_row("mail", "mail", 40.0),
+            make_row("files", "files", 80.0, instance="l10n.example.org/weblate")], 100.0),
+    "de": ([make_row("files", "files", 60.0)], 200.0),
+}
+
+
+@pytest.mark.parametrize("instance, slug", [
+    ("l10n.example.org/weblate", "files"),
+    ("..", "../../etc"),
+    ("", "x"),
+])
+def test_project_file_stays_in_projects(instance, slug):
+    path = dashboard.project_file(instance, slug)
+    assert path.startswith("projects/") and path.count("/") == 1
+    assert ".." not in path.split("/")
+
+
+def test_changed_names_do_not_collide():
+    assert dashboard.project_file("a--b", "c") != dashboard.project_file("a", "b--c")
+    assert dashboard.project_file("a b", "x") != dashboard.project_file("a_b", "x")
+    assert dashboard.project_file("elementary", "files") == "projects/elementary--files.html"
+
+
+def test_build_site_writes_linked_pages(tmp_path):
+    counts = dashboard.build_site(DATA, tmp_path, {"sv": "Swedish"})
+    assert counts == {"written": 6, "unchanged": 0, "removed": 0}
+    assert sorted(p.parent.name for p in tmp_path.glob("projects/*.html")) == ["projects"] * 3
+    page = (tmp_path / "languages" / "sv.html").read_text()
+    remote = dashboard.project_file("l10n.example.org/weblate", "files")
+    assert f'href="../{remote}"' in page
+    assert (tmp_path / remote).exists()
+
+
+def test_build_site_skips_unchanged_and_removes_stale(tmp_path):
+    dashboard.build_site(DATA, tmp_path)
+    assert dashboard.build_site(DATA, tmp_path)["unchanged"] == 6
+    counts = dashboard.build_site({"sv": DATA["sv"]}, tmp_path)
+    assert counts["removed"] == 1
+    assert not (tmp_path / "languages" / "de.html").exists()
@@ -0,0 +1,51 @@
+from conftest import make_row
+from elementary_l10n import diff
+
+OLD = [make_row("files", "files", 80.0), make_row("mail", "mail", 60.0),
+       make_row("code", "code", 50.0), make_row("music", "music", 90.0),
+       make_row("photos", "photos", 10.0)]
+NEW = [make_row("files", "files", 95.0), make_row("mail", "mail", 40.0),
+       make_row("code", "code", 50.0), make_row("music", "music", 89.5),
+       make_row("tasks", "tasks", 5.0)]
+
+
+def _slugs(changes):
+    return [c.row["component_slug"] for c in changes]
+
+
+def test_diff_rows_classifies_changes():
+    result = diff.diff_rows(OLD, NEW, "sv")
+    assert _slugs(result[diff.IMPROVED]) == ["files"]
+    assert _slugs(result[diff.REGRESSED]) == ["mail", "music"]
+    assert _slugs(result[diff.NEW]) == ["tasks"]
+    assert _slugs(result[diff.REMOVED]) == ["photos"]
+    assert result.unchanged == 1
+    assert result[diff.REGRESSED][0].delta == -20.0
+    assert result[diff.REMOVED][0].new is None
+
+
+def test_min_delta_counts_small_moves_as_unchanged():
+    result = diff.diff_rows(OLD, NEW, "sv", min_delta=1.0)
+    assert _slugs(result[diff.REGRESSED]) == ["mail"]
+    assert result.unchanged == 2
+
+
+def test_rows_are_matched_per_instance():
+    other = [{**row, "instance": "hosted"} for row in OLD]
+    result = diff.diff_rows(OLD, OLD + other)
+    assert len(result[diff.NEW]) == len(OLD)
+    assert result.unchanged == len(OLD)
+
+
+def test_sorted_by_size_of_change():
+    old = [make_row("a", "a", 50.0), make_row("b", "b", 50.0), make_row("c", "c", 50.0)]
+    new = [make_row("a", "a", 40.0), make_row("b", "b", 10.0), make_row("c", "c", 45.0)]
+    assert _slugs(diff.diff_rows(old, new)[diff.REGRESSED]) == ["b", "a", "c"]
+
+
+def test_snapshots_with_language_on_one_side():
+    result = diff.diff_snapshots({"sv": OLD}, {"sv": OLD, "de": NEW[:2]})
+    assert result.counts() == {diff.REGRESSED: 0, diff.IMPROVED: 0,
+                               diff.NEW: 2, diff.REMOVED: 0}
+    assert {c.language for c in result[diff.NEW]} == {"de"}
+    assert not diff.diff_snapshots({"sv": OLD}, {"sv": OLD})
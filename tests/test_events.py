@@ -0,0 +1,58 @@
+from elementary_l10n.events import EventChannel
+
+
+def _channel(**kwargs):
+    log, scheduled = [], []
+    handlers = {kind: (lambda *args, kind=kind: log.append((kind, *args)))
+                for kind in ("progress", "rows", "merge", "error")}
+    return EventChannel(handlers, scheduled.append, **kwargs), log, scheduled
+
+
+def test_one_flush_per_batch():
+    channel, log, scheduled = _channel()
+    channel.post("rows", [1])
+    channel.post("error", "boom")
+    assert len(scheduled) == 1 and not log
+    scheduled.pop()()
+    assert log == [("rows", [1]), ("error", "boom")]
+    channel.post("rows", [2])
+    assert len(scheduled) == 1
+
+
+def test_latest_progress_wins():
+    channel, log, scheduled = _channel()
+    for i in range(5):
+        channel.post("progress", i, 5)
+    scheduled[0]()
+    assert log == [("progress", 4, 5)]
+
+
+def test_replaces_and_combine():
+    def combine(old, new):  # merge row batches of the same language
+        return (old[0], old[1] + new[1]) if old[0] == new[0] else None
+
+    channel, log, scheduled = _channel(
+        replaces={"rows": ("rows", "merge")}, combine={"merge": combine})
+    channel.post("merge", "sv", [1])
+    channel.post("error", "x")
+    channel.post("merge", "sv", [2])
+    channel.post("merge", "de", [3])
+    channel.post("merge", "de", [4])
+    scheduled[0]()
+    assert log == [("merge", "sv", [1, 2]), ("error", "x"), ("merge", "de", [3, 4])]
+
+    log.clear()
+    channel.post("merge", "sv", [5])
+    channel.post("rows", [6])
+    scheduled[1]()
+    assert log == [("rows", [6])]
+
+
+def test_scope_limits_replacement():
+    channel, log, scheduled = _channel(
+        replaces={"rows": ("rows",)}, scope=lambda kind, args: args[0])
+    channel.post("rows", "sv", [1])
+    channel.post("rows", "de", [2])
+    channel.post("rows", "sv", [3])
+    scheduled[0]()
+    assert log == [("rows", "de", [2]), ("rows", "sv", [3])]
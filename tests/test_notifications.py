@@ -0,0 +1,47 @@
+from conftest import make_row
+from elementary_l10n.notifications import NotificationEngine
+
+BASE = [make_row("files", "files", 80.0), make_row("mail", "mail", 100.0)]
+REGRESSED = [make_row("files", "files", 60.0), make_row("mail", "mail", 100.0)]
+
+
+def test_first_snapshot_is_a_baseline(tmp_path):
+    engine = NotificationEngine(state_file=tmp_path / "state.json")
+    assert engine.process("sv", BASE) is None
+
+
+def test_change_is_announced_once(tmp_path):
+    engine = NotificationEngine(state_file=tmp_path / "state.json")
+    engine.process("sv", BASE)
+    summary, body = engine.process("sv", REGRESSED)
+    assert "1 components regressed: Files" in body
+    assert summary
+    assert engine.process("sv", REGRESSED) is None
+
+
+def test_no_repeat_after_restart(tmp_path):
+    state = tmp_path / "state.json"
+    engine = NotificationEngine(state_file=state)
+    engine.process("sv", BASE)
+    assert engine.process("sv", REGRESSED) is not None
+    assert NotificationEngine(state_file=state).process("sv", REGRESSED) is None
+
+
+def test_rate_limited_events_wait(tmp_path):
+    engine = NotificationEngine(state_file=tmp_path / "state.json")
+    engine.process("sv", BASE)
+    engine.process("sv", REGRESSED)
+    worse = [make_row("files", "files", 55.0), make_row("mail", "mail", 100.0)]
+    assert engine.process("sv", worse) is None  # within min_interval
+
+    # Fires with the next snapshot once the interval allows it
+    engine = NotificationEngine({"regressed": {"min_interval": 0}},
+                                state_file=tmp_path / "state.json")
+    summary, body = engine.process("sv", worse)
+    assert "regressed" in body
+
+
+def test_languages_are_tracked_separately(tmp_path):
+    engine = NotificationEngine(state_file=tmp_path / "state.json")
+    engine.process("sv", BASE)
+    assert engine.process("de", REGRESSED) is None  # a baseline for de
@@ -0,0 +1,72 @@
+import threading
+
+from elementary_l10n import planner, weblate
+
+TASKS = [({"slug": p}, {"slug": c}) for p in ("a", "b") for c in ("x", "y")]
+
+
+def _stats_paths(server):
+    return ["/".join(p.split("/")[3:5]) for p in server.paths
+            if p.startswith("/api/translations/")]
+
+
+def _fetch_all(language="sv"):
+    done, out = threading.Event(), {"partial": []}
+    weblate.fetch_all_data(
+        language, lambda rows: (out.update(rows=rows), done.set()),
+        lambda e: (out.update(error=e), done.set()),
+        partial_cb=out["partial"].append)
+    assert done.wait(10)
+    assert "error" not in out
+    return out
+
+
+def test_watch_list_config_round_trip():
+    watch = planner.WatchList.from_config(
+        {"watch": {"projects": ["b"], "components": ["a/y", "c/x"]}})
+    assert watch.to_config() == {"projects": ["b"], "components": ["a/y", "c/x"]}
+    assert not planner.WatchList.from_config({})
+    assert planner.WatchList.from_config({"watch": None}).to_config() == {
+        "projects": [], "components": []}
+
+
+def test_pinning():
+    watch = planner.WatchList(["b"], ["a/y"])
+    assert watch.wants_project("a") and watch.wants_project("b")
+    assert not watch.wants_project("ab")
+    assert watch.is_pinned("b", "x") and watch.is_pinned("a", "y")
+    assert not watch.is_pinned("a", "x")
+    assert watch.toggle_component("a", "x") is True
+    assert watch.toggle_component("a", "x") is False
+    assert not watch.is_pinned("a", "x")
+
+
+def test_split_keeps_order():
+    watch = planner.WatchList(components=["b/x", "a/y"])
+    pinned, rest = planner.split_tasks(TASKS, watch)
+    assert [(p["slug"], c["slug"]) for p, c in pinned] == [("a", "y"), ("b", "x")]
+    assert len(rest) == 2
+    projects = [{"slug": "a"}, {"slug": "b"}, {"slug": "c"}]
+    assert planner.split_projects(projects, planner.WatchList(["c"])) == (
+        [{"slug": "c"}], [{"slug": "a"}, {"slug": "b"}])
+
+
+def test_pinned_components_are_fetched_first(mock_weblate):
+    weblate.save_config({"watch": {"components": ["project-1/component-2"]}})
+    out = _fetch_all()
+    assert _stats_paths(mock_weblate)[0] == "project-1/component-2"
+    assert [[r["component_slug"] for r in rows] for rows in out["partial"]] == [
+        ["component-2"]]
+    assert len(out["rows"]) == 6
+
+
+def test_watch_only_fetches_pinned_and_keeps_the_rest_cached(mock_weblate):
+    _fetch_all()
+    before = {(r["project_slug"], r["component_slug"]): r for r in weblate.load_cache("sv")[0]}
+    weblate.save_config({"watch": {"projects": ["project-0"]}, "watch_only": True})
+    mock_weblate.reset_counters()
+    out = _fetch_all()
+    assert sorted(_stats_paths(mock_weblate)) == [
+        "project-0/component-0", "project-0/component-1", "project-0/component-2"]
+    # Unwatched components keep their cached rows
+    assert {(r["project_slug"], r["component_slug"]) for r in out["rows"]} == before.keys()
@@ -0,0 +1,107 @@
+import socket
+import threading
+
+import pytest
+
+from elementary_l10n import weblate
+from elementary_l10n.diagnostics import DIAGNOSTICS
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Backoff waits requested by the client, without sleeping."""
+    waits = []
+    monkeypatch.setattr(weblate.time, "sleep", waits.append)
+    DIAGNOSTICS.reset()
+    return waits
+
+
+def _slow(server, monkeypatch, seconds=0.3):
+    """Delay the mock's answers (time.sleep is patched out by the sleeps fixture)."""
+    route = server.route
+    slow = {"on": True}
+
+    def delayed(path, query):
+        if slow["on"]:
+            threading.Event().wait(seconds)
+        return route(path, query)
+
+    monkeypatch.setattr(server, "route", delayed)
+    monkeypatch.setattr(weblate, "TIMEOUT", (3.05, seconds / 6))
+    return slow
+
+
+def _closed_port_url():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{s.getsockname()[1]}"
+
+
+def test_429_backs_off_and_retries(mock_weblate, sleeps, monkeypatch):
+    mock_weblate.rate_limit = 1
+    session = weblate._make_session()
+    weblate._request_with_retry(session, f"{weblate.API}/projects/")
+    # The window is full; the backoff sleep lets it drain
+    monkeypatch.setattr(weblate.time, "sleep",
+                        lambda wait: (sleeps.append(wait), mock_weblate._window.clear()))
+    r = weblate._request_with_retry(session, f"{weblate.API}/projects/")
+    assert r.status_code == 200
+    assert sleeps == [2]
+    assert mock_weblate.throttled == 1
+    assert (DIAGNOSTICS.retries, DIAGNOSTICS.backoff_time, DIAGNOSTICS.timeouts) == (1, 2, 0)
+
+
+def test_429_gives_up_after_max_retries(mock_weblate, sleeps):
+    mock_weblate.rate_limit = 1
+    session = weblate._make_session()
+    weblate._request_with_retry(session, f"{weblate.API}/projects/")
+    with pytest.raises(RuntimeError, match="Rate limited"):
+        weblate._request_with_retry(session, f"{weblate.API}/projects/", max_retries=2)
+    assert sleeps == [2, 4]
+    assert mock_weblate.throttled == 3
+
+
+def test_read_timeout_is_retried_and_keeps_the_server_healthy(mock_weblate, sleeps,
+                                                               monkeypatch):
+    _slow(mock_weblate, monkeypatch)
+    with pytest.raises(RuntimeError, match="did not answer in time"):
+        weblate._request_with_retry(weblate._make_session(), f"{weblate.API}/projects/",
+                                    max_retries=1)
+    assert sleeps == [2]
+    assert (DIAGNOSTICS.timeouts, DIAGNOSTICS.timeout_time, DIAGNOSTICS.retries) == (1, 2, 0)
+    assert not weblate.recently_unreachable(mock_weblate.url)
+
+
+def test_read_timeout_then_answer(mock_weblate, sleeps, monkeypatch):
+    slow = _slow(mock_weblate, monkeypatch)
+    monkeypatch.setattr(weblate.time, "sleep",
+                        lambda wait: (sleeps.append(wait), slow.update(on=False)))
+    r = weblate._request_with_retry(weblate._make_session(), f"{weblate.API}/projects/")
+    assert r.json()["count"] == 2
+    assert sleeps == [2]
+
+
+def test_refused_connection_raises_offline_and_marks_unreachable(cache_dir):
+    url = _closed_port_url()
+    with pytest.raises(weblate.OfflineError):
+        weblate._request_with_retry(weblate._make_session(), f"{url}/api/projects/")
+    assert weblate.recently_unreachable(url)
+    # Fetches skip the server until HEALTH_TTL passes, without a request
+    inst = weblate.Instance("down", url)
+    with pytest.raises(weblate.OfflineError):
+        weblate.fetch_languages(["sv"], [inst])
+
+
+def test_check_health(mock_weblate):
+    inst = weblate.default_instance()
+    assert weblate.check_health(inst)
+    assert not weblate.recently_unreachable(inst.url)
+    down = weblate.Instance("down", _closed_port_url())
+    assert not weblate.check_health(down)
+    assert weblate.recently_unreachable(down.url)
+
+
+def test_401_points_at_the_instance_profile(mock_weblate, sleeps, monkeypatch):
+    monkeypatch.setattr(mock_weblate, "route", lambda path, query: (401, {"detail": "no"}))
+    with pytest.raises(RuntimeError, match=f"{mock_weblate.url}/accounts/profile/"):
+        weblate._request_with_retry(weblate._make_session(), f"{weblate.API}/projects/")
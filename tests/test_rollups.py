@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from conftest import make_row
+from elementary_l10n import rollups
+
+
+def _totals(r: rollups.Rollup) -> tuple:
+    return (r.count, round(r.pct_sum, 6), r.complete, r.total_words,
+            r.translated_words, r.histogram)
+
+
+def _from_scratch(rows) -> rollups.Rollup:
+    r = rollups.Rollup()
+    for row in rows:
+        r.add(row)
+    return r
+
+
+def test_averages():
+    r = _from_scratch([make_row("a", "a", 100.0, total_words=300),
+                       make_row("a", "b", 0.0, total_words=100)])
+    assert r.average == 50.0
+    assert r.weighted_average == 75.0
+    assert r.complete == 1
+    assert r.histogram[0] == r.histogram[-1] == 1
+    assert rollups.Rollup().average == 0.0
+
+
+def test_weighted_average_without_words_is_the_mean():
+    r = _from_scratch([make_row("a", "a", 20.0, total_words=0),
+                       make_row("a", "b", 40.0, total_words=0)])
+    assert r.weighted_average == pytest.approx(30.0)
+
+
+def test_incremental_updates_match_a_full_pass():
+    rng = random.Random(3)
+    rows = [make_row(f"p{i % 5}", f"c{i}", rng.choice([0.0, 12.5, 50.0, 99.9, 100.0]),
+                     total_words=rng.randint(0, 500)) for i in range(40)]
+    index = rollups.RollupIndex()
+    index.replace("sv", rows)
+    for _ in range(3):
+        rows = [make_row(r["project_slug"], r["component_slug"], rng.uniform(0, 100),
+                         total_words=r["total_words"])
+                for r in rows if rng.random() > 0.1]
+        index.replace("sv", rows)
+
+        assert _totals(index.language("sv")) == _totals(_from_scratch(rows))
+        for status in rollups.STATUSES:
+            expected = [r for r in rows
+                        if rollups.row_status(r["translated_percent"]) == status]
+            assert _totals(index.status("sv", status)) == _totals(_from_scratch(expected))
+        for key, project in index.projects("sv").items():
+            expected = [r for r in rows if rollups.project_key(r) == key]
+            assert _totals(project) == _totals(_from_scratch(expected))
+
+
+def test_remove_and_overall():
+    index = rollups.RollupIndex()
+    a, b = make_row("a", "a", 100.0), make_row("b", "b", 50.0)
+    index.replace("sv", [a, b])
+    index.replace("de", [a])
+    index.remove("sv", b)
+    assert index.project("sv", rollups.project_key(b)).count == 0
+    assert rollups.project_key(b) not in index.projects("sv")
+    assert index.overall().count == 2
+    assert index.overall().complete == 2
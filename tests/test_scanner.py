@@ -0,0 +1,116 @@
+from pathlib import Path
+
+import pytest
+
+from elementary_l10n import scanner
+
+REPO_PO = Path(__file__).resolve().parent.parent / "po"
+
+# Expected counts are what msgfmt --statistics reports for this file
+# (4 translated, 1 fuzzy, 2 untranslated), plus source words by hand.
+SAMPLE = r'''# Swedish translation
+msgid ""
+msgstr ""
+"Content-Type: text/plain; charset=UTF-8\n"
+
+#: src/a.vala:1
+msgid "Open file"
+msgstr "Öppna fil"
+
+#, fuzzy
+msgid "Close"
+msgstr "Stäng"
+
+msgid "Save all files"
+msgstr ""
+
+msgctxt "menu"
+msgid "Quit"
+msgstr "Avsluta"
+
+msgid "One item"
+msgid_plural "%d items"
+msgstr[0] "Ett objekt"
+msgstr[1] ""
+
+msgid ""
+"Multi line "
+"source text"
+msgstr ""
+"Flerradig "
+"källtext"
+msgid "Two files"
+msgid_plural "%d files"
+msgstr[0] "Två filer"
+msgstr[1] "%d filer"
+#~ msgid "Old"
+#~ msgstr "Gammal"
+'''
+
+TEMPLATE = '''msgid ""
+msgstr ""
+
+msgid "Open file"
+msgstr ""
+
+msgid "Save all files"
+msgstr ""
+'''
+
+
+def test_parse_po_matches_msgfmt(tmp_path):
+    path = tmp_path / "sv.po"
+    path.write_text(SAMPLE, encoding="utf-8")
+    assert scanner.parse_po(str(path)) == {
+        "total": 7, "translated": 4, "fuzzy": 1, "untranslated": 2,
+        "total_words": 15, "translated_words": 9, "translated_percent": 57.1,
+    }
+
+
+def test_parse_repository_translation():
+    stats = scanner.parse_po(str(REPO_PO / "sv.po"))
+    assert (stats["total"], stats["translated"], stats["fuzzy"]) == (44, 44, 0)
+    assert stats["translated_percent"] == 100.0
+
+
+def test_parse_template_is_untranslated():
+    stats = scanner.parse_po(str(REPO_PO / "elementary-l10n.pot"))
+    assert stats["total"] == 44
+    assert stats["translated"] == stats["fuzzy"] == 0
+
+
+@pytest.fixture
+def tree(tmp_path):
+    po = tmp_path / "src" / "files" / "po"
+    (po / "extra").mkdir(parents=True)
+    (po / "sv.po").write_text(SAMPLE, encoding="utf-8")
+    (po / "files.pot").write_text(TEMPLATE)
+    (po / "extra" / "extra.pot").write_text(TEMPLATE)
+    return tmp_path / "src"
+
+
+def test_scan_rows(tree, tmp_path):
+    rows = scanner.scan([tree], ["sv", "de"], cache_file=tmp_path / "scan.json")
+    sv = {r["component_slug"]: r for r in rows["sv"]}
+    assert sv["files"]["translated_percent"] == 57.1
+    assert sv["files"]["project_slug"] == "files"
+    assert sv["files"]["instance"] == scanner.LOCAL_INSTANCE
+    assert sv["files"]["url"] == sv["files"]["translate_url"] == ""
+    # No sv.po for the extra component: a 0% row from its template
+    assert sv["extra"]["translated_percent"] == 0.0
+    assert sv["extra"]["total_words"] == 5
+    assert len(rows["de"]) == 2
+
+
+def test_scan_cache_reuses_and_prunes(tree, tmp_path, monkeypatch):
+    cache = tmp_path / "scan.json"
+    first = scanner.scan([tree], cache_file=cache)
+
+    def fail(_path):
+        raise AssertionError("unchanged file parsed again")
+    monkeypatch.setattr(scanner, "parse_po", fail)
+    assert scanner.scan([tree], cache_file=cache) == first
+
+    (tree / "files" / "po" / "sv.po").unlink()
+    assert scanner.scan([tree], cache_file=cache) == {}
+    assert scanner._load_cache(cache) == {}
@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+from conftest import make_row
+from elementary_l10n import scheduler, weblate
+
+TASKS = [({"slug": p}, {"slug": c}) for p in ("a", "b") for c in ("x", "y", "z")]
+
+
+def _drain(s):
+    order = []
+    while (task := s.pop()) is not None:
+        order.append(f"{task[0]['slug']}/{task[1]['slug']}")
+    return order
+
+
+def _stats_paths(server):
+    return ["/".join(p.split("/")[3:5]) for p in server.paths
+            if p.startswith("/api/translations/")]
+
+
+@pytest.fixture
+def visibility():
+    """The shared VISIBILITY, cleared again after the test."""
+    yield scheduler.VISIBILITY
+    scheduler.VISIBILITY.update(None, ())
+
+
+def test_without_history_or_viewport_api_order_is_kept():
+    s = scheduler.FetchScheduler(TASKS, "sv", "i", visibility=scheduler.Visibility())
+    assert len(s) == 6
+    assert _drain(s) == ["a/x", "a/y", "a/z", "b/x", "b/y", "b/z"]
+    assert s.pop() is None
+
+
+def test_visible_then_shown_then_stale_and_changing(tmp_path):
+    history = scheduler.FetchHistory(tmp_path / "history.json")
+    now = time.time()
+    for slug, pct in (("x", 10.0), ("y", 10.0), ("y", 20.0)):
+        history.record("sv", make_row("a", slug, pct, instance="i"))
+    # a/x was fetched a horizon ago, as stale as never fetched; a/y is
+    # fresh, and changed on one of its two fetches
+    history.get("sv", ("i", "a", "x"))["fetched"] = now - scheduler.STALE_HORIZON
+    vis = scheduler.Visibility()
+    vis.update("sv", visible=[("i", "b", "z")], shown=[("i", "b", "y")])
+    s = scheduler.FetchScheduler(TASKS, "sv", "i", history, vis)
+    assert _drain(s) == ["b/z", "b/y", "a/x", "a/z", "b/x", "a/y"]
+
+
+def test_viewport_change_reorders_the_rest():
+    vis = scheduler.Visibility()
+    s = scheduler.FetchScheduler(TASKS, "sv", "i", visibility=vis)
+    assert s.pop()[1]["slug"] == "x"
+    vis.update("sv", visible=[("i", "b", "y")])
+    assert _drain(s) == ["b/y", "a/y", "a/z", "b/x", "b/z"]
+    # Another language's viewport does not count
+    vis.update("de", visible=[("i", "a", "z")])
+    s = scheduler.FetchScheduler(TASKS, "sv", "i", visibility=vis)
+    assert _drain(s)[0] == "a/x"
+
+
+def test_history_round_trip_and_concurrent_saves(tmp_path):
+    path = tmp_path / "history.json"
+    history = scheduler.FetchHistory(path)
+
+    def record(slug):
+        for pct in (10.0, 20.0, 20.0):
+            history.record("sv", make_row("a", slug, pct, instance="i"))
+            history.save()
+
+    threads = [threading.Thread(target=record, args=(f"c{i}",)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    loaded = scheduler.FetchHistory(path)
+    entry = loaded.get("sv", ("i", "a", "c3"))
+    assert (entry["fetches"], entry["changes"], entry["pct"]) == (3, 1, 20.0)
+    assert len(loaded._entries) == 8
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_fetch_follows_the_viewport(mock_weblate, visibility):
+    name = weblate.default_instance().name
+    visibility.update("sv", visible=[(name, "project-1", "component-2")],
+                      shown=[(name, "project-1", "component-0")])
+    rows = weblate._fetch_rows(weblate.default_instance(), "sv")
+    assert len(rows) == 6
+    assert _stats_paths(mock_weblate)[:2] == ["project-1/component-2",
+                                              "project-1/component-0"]
+
+
+def test_fetch_records_history(mock_weblate):
+    weblate._fetch_rows(weblate.default_instance(), "sv")
+    history = scheduler.FetchHistory(weblate.CACHE_DIR / "fetch-history.json")
+    name = weblate.default_instance().name
+    assert history.get("sv", (name, "project-0", "component-1"))["fetches"] == 1
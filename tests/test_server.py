@@ -0,0 +1,63 @@
+import json
+import threading
+import time
+import urllib.request
+
+from elementary_l10n import server, weblate
+
+
+def _get(httpd, path):
+    with urllib.request.urlopen(f"http://127.0.0.1:{httpd.server_address[1]}{path}") as r:
+        return r.read()
+
+
+def test_refresh_publishes_a_snapshot(mock_weblate):
+    runtime = server.Runtime(["sv", "de"], refresh=False)
+    assert runtime.snapshot.summaries["sv"]["components"] == 0
+
+    runtime.refresh_languages()
+    # One statistics listing per component covers both languages
+    assert mock_weblate.paths.keys() >= {"/api/projects/"}
+    assert sum(1 for p in mock_weblate.paths if p.startswith("/api/components/")) == 6
+    assert runtime.snapshot.summaries["sv"]["components"] == 6
+    assert runtime.snapshot.summaries["de"]["components"] == 6
+    assert weblate.load_cache("sv")[0]
+
+
+def test_http_endpoint_reads_the_snapshot(mock_weblate):
+    runtime = server.Runtime(["sv"], refresh=False)
+    runtime.refresh_languages()
+    httpd = server.serve(runtime, port=0)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    try:
+        mock_weblate.reset_counters()
+        assert b'elementary_l10n_language_components{language="sv"} 6' in _get(
+            httpd, "/metrics")
+        rows = json.loads(_get(httpd, "/api/languages/sv?project=project-1"))["rows"]
+        assert {r["project_slug"] for r in rows} == {"project-1"}
+        assert json.loads(_get(httpd, "/api/languages"))[0]["language"] == "sv"
+        # Serving never reaches Weblate
+        assert mock_weblate.requests == 0
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_unexpected_refresh_errors_keep_the_loop_running(monkeypatch, capsys):
+    calls = []
+
+    def fail(*_args):
+        calls.append(1)
+        raise KeyError("boom")
+
+    monkeypatch.setattr(weblate, "fetch_languages", fail)
+    runtime = server.Runtime(["sv"], interval=0.01, instances=[])
+    runtime.start()
+    try:
+        deadline = time.monotonic() + 5
+        while len(calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        runtime.stop()
+    assert len(calls) >= 2
+    assert "KeyError" in capsys.readouterr().err
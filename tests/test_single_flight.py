@@ -0,0 +1,103 @@
+import threading
+
+import pytest
+import requests
+
+from elementary_l10n import weblate
+from elementary_l10n.diagnostics import DIAGNOSTICS
+
+
+def _together(n, fn):
+    """Call fn from n threads at once; returns results or exceptions in order."""
+    barrier = threading.Barrier(n)
+    out = [None] * n
+
+    def run(i):
+        barrier.wait()
+        try:
+            out[i] = fn(i)
+        except Exception as e:
+            out[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return out
+
+
+def test_followers_share_the_leaders_result():
+    flight = weblate._SingleFlight()
+    calls, shared = [], []
+    started, release = threading.Event(), threading.Event()
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(2)
+        return "rows"
+
+    def call(i):
+        if i:
+            # Followers join once the leader is in flight
+            started.wait(2)
+            threading.Timer(0.05, release.set).start()
+        return flight.do("k", slow, lambda: shared.append(i))
+
+    assert _together(4, call) == ["rows"] * 4
+    assert len(calls) == 1 and sorted(shared) == [1, 2, 3]
+    # The key is free again once the call finished
+    assert flight.do("k", lambda: "again") == "again"
+
+
+def test_leader_error_is_raised_in_every_caller():
+    flight = weblate._SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(2)
+        raise ValueError("broken")
+
+    def call(i):
+        if i:
+            started.wait(2)
+            threading.Timer(0.05, release.set).start()
+        return flight.do("k", fail)
+
+    assert all(isinstance(r, ValueError) for r in _together(3, call))
+
+
+def test_identical_requests_reach_the_server_once(mock_weblate):
+    mock_weblate.latency = 0.2
+    DIAGNOSTICS.reset()
+    url = f"{weblate.API}/projects/"
+    results = _together(4, lambda _i: weblate._request_with_retry(
+        weblate._make_session(), url).json())
+    assert all(r == results[0] for r in results)
+    assert mock_weblate.paths == {"/api/projects/": 1}
+    assert DIAGNOSTICS.shared == 3
+
+
+def test_other_credentials_are_not_shared(mock_weblate):
+    mock_weblate.latency = 0.2
+    url = f"{weblate.API}/projects/"
+    _together(2, lambda i: weblate._request_with_retry(weblate._make_session(f"key{i}"), url))
+    assert mock_weblate.paths == {"/api/projects/": 2}
+
+
+def test_shared_http_errors(mock_weblate):
+    mock_weblate.latency = 0.2
+    url = f"{weblate.API}/projects/missing/components/"
+    results = _together(3, lambda _i: weblate._request_with_retry(weblate._make_session(), url))
+    assert all(isinstance(r, requests.HTTPError) for r in results)
+    assert mock_weblate.requests == 1
+
+
+@pytest.mark.parametrize("headers", [None, {"If-None-Match": '"x"'}])
+def test_sequential_requests_are_not_deduplicated(mock_weblate, headers):
+    session = weblate._make_session()
+    for _ in range(2):
+        weblate._request_with_retry(session, f"{weblate.API}/projects/", headers=headers)
+    assert mock_weblate.requests == 2
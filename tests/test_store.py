@@ -0,0 +1,90 @@
+import json
+import multiprocessing
+
+import pytest
+
+from conftest import make_row
+from elementary_l10n import store, weblate
+
+ROWS = [make_row("files", "files", 100.0), make_row("mail", "mail", 42.5),
+        {**make_row("code", "code", 0.0), "total_words": 0}]
+
+
+@pytest.mark.parametrize("codec", store.available_codecs())
+def test_rows_round_trip(codec):
+    blob, used = store.encode_rows(ROWS, codec)
+    assert used == codec
+    assert store.decode_rows(blob, codec) == ROWS
+
+
+def test_store_file_reads_one_language(tmp_path):
+    path = tmp_path / "cache.bin"
+    store.write_store(path, {"sv": (1.0, *store.encode_rows(ROWS)),
+                             "de": (2.0, *store.encode_rows(ROWS[:1]))})
+    f = store.StoreFile.open(path)
+    assert f.languages() == {"sv": 1.0, "de": 2.0}
+    assert f.rows("de") == (ROWS[:1], 2.0)
+    assert f.rows("fr") is None
+
+
+@pytest.mark.parametrize("data", [b"", b"not a store", store.MAGIC + b"\xff\xff\xff\x00"])
+def test_unreadable_store_is_empty(tmp_path, data):
+    path = tmp_path / "cache.bin"
+    path.write_bytes(data)
+    assert store.StoreFile.open(path).languages() == {}
+
+
+def test_missing_store_is_empty(tmp_path):
+    assert store.StoreFile.open(tmp_path / "missing.bin").rows("sv") is None
+
+
+def test_save_and_load_cache(cache_dir):
+    weblate.save_cache("sv", ROWS)
+    weblate.save_cache("de", ROWS[:2])
+    rows, ts = weblate.load_cache("sv")
+    assert rows == ROWS and ts is not None
+    assert set(weblate.cached_languages()) == {"sv", "de"}
+
+
+def test_replaced_rows_become_previous(cache_dir):
+    weblate.save_cache("sv", ROWS)
+    assert weblate.load_previous("sv") == (None, None)
+    newer = [{**ROWS[1], "translated_percent": 50.0}]
+    weblate.save_cache("sv", newer)
+    assert weblate.load_cache("sv")[0] == newer
+    assert weblate.load_previous("sv")[0] == ROWS
+
+
+@pytest.mark.parametrize("legacy", [
+    {"languages": {"sv": {"data": ROWS, "timestamp": 100.0},
+                   "de": {"data": ROWS[:1], "timestamp": 200.0}}},
+    {"language": "sv", "data": ROWS, "timestamp": 100.0},
+])
+def test_legacy_json_cache_is_migrated(cache_dir, legacy):
+    cache_dir.mkdir()
+    legacy_file = cache_dir / "cache.json"
+    legacy_file.write_text(json.dumps(legacy))
+
+    assert weblate.load_cache("sv") == (ROWS, 100.0)
+    assert not legacy_file.exists()
+    assert (cache_dir / "cache.bin").exists()
+    if "languages" in legacy:
+        assert weblate.load_cache("de") == (ROWS[:1], 200.0)
+
+
+def _save_languages(codes):
+    for code in codes:
+        weblate.save_cache(code, ROWS)
+
+
+def test_concurrent_writers_keep_every_language(cache_dir):
+    # Separate processes do not share _cache_lock; only the file lock orders them
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_save_languages, args=([f"{p}{i}" for i in range(10)],))
+               for p in "abcd"]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    assert len(weblate.cached_languages()) == 40
+    assert not list(cache_dir.glob("*.tmp"))
@@ -0,0 +1,150 @@
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from elementary_l10n import weblate, weblate_async  # noqa: E402
+from elementary_l10n.diagnostics import DIAGNOSTICS  # noqa: E402
+
+
+def _key(row):
+    return row["project_slug"], row["component_slug"]
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Backoff waits requested by the client, without sleeping them."""
+    waits = []
+    real_sleep = asyncio.sleep
+
+    async def record(wait):
+        if wait > 0:
+            waits.append(wait)
+        await real_sleep(0)
+
+    monkeypatch.setattr(weblate_async.asyncio, "sleep", record)
+    DIAGNOSTICS.reset()
+    return waits
+
+
+async def _get(url, **kwargs):
+    async with weblate_async.AsyncClient() as client:
+        return await client.get(url, **kwargs)
+
+
+def test_rows_match_the_threaded_client(mock_weblate):
+    rows = asyncio.run(weblate_async.fetch_rows("sv"))
+    threaded = weblate._fetch_rows(weblate.default_instance(), "sv")
+    assert sorted(rows, key=_key) == sorted(threaded, key=_key)
+    assert len(rows) == 6
+
+
+def test_request_starts_share_the_instance_budget(mock_weblate, monkeypatch):
+    monkeypatch.setattr(weblate, "REQUEST_DELAY", 0.05)
+    weblate.discover(weblate.default_instance())  # catalog and language index
+    mock_weblate.reset_counters()
+    start = time.perf_counter()
+    asyncio.run(weblate_async.fetch_rows("sv"))
+    # Six statistics requests, at least one REQUEST_DELAY apart
+    assert mock_weblate.requests == 6
+    assert time.perf_counter() - start >= 5 * 0.05
+
+
+def test_429_backs_off(mock_weblate, sleeps):
+    mock_weblate.rate_limit = 1
+    url = f"{weblate.API}/projects/"
+    asyncio.run(_get(url))
+    with pytest.raises(RuntimeError, match="Rate limited"):
+        asyncio.run(_get(url, max_retries=2))
+    assert sleeps == [2, 4] and DIAGNOSTICS.retries == 2
+
+
+def test_read_timeout_is_retried_and_keeps_the_server_healthy(mock_weblate, sleeps,
+                                                               monkeypatch):
+    route = mock_weblate.route
+
+    def slow(path, query):
+        threading.Event().wait(0.3)
+        return route(path, query)
+
+    monkeypatch.setattr(mock_weblate, "route", slow)
+    monkeypatch.setattr(weblate, "TIMEOUT", (3.05, 0.05))
+    with pytest.raises(RuntimeError, match="did not answer in time"):
+        asyncio.run(_get(f"{weblate.API}/projects/", max_retries=1))
+    assert sleeps == [2] and DIAGNOSTICS.timeouts == 1
+    assert not weblate.recently_unreachable(mock_weblate.url)
+
+
+def test_refused_connection_raises_offline(cache_dir):
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        url = f"http://127.0.0.1:{s.getsockname()[1]}"
+    with pytest.raises(weblate.OfflineError):
+        asyncio.run(_get(f"{url}/api/projects/"))
+    assert weblate.recently_unreachable(url)
+
+
+def test_401_points_at_the_instance_profile(mock_weblate, monkeypatch):
+    monkeypatch.setattr(mock_weblate, "route", lambda path, query: (401, {}))
+    with pytest.raises(RuntimeError, match=f"{mock_weblate.url}/accounts/profile/"):
+        asyncio.run(_get(f"{weblate.API}/projects/"))
+
+
+def test_a_failure_cancels_the_other_requests():
+    started, cancelled = [], []
+
+    async def slow(i):
+        started.append(i)
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(i)
+            raise
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise weblate.OfflineError("down")
+
+    with pytest.raises(weblate.OfflineError):
+        asyncio.run(weblate_async._gather([slow(0), fail(), slow(1)]))
+    assert sorted(cancelled) == sorted(started) == [0, 1]
+
+
+def test_background_client_waits_for_foreground_fetches(mock_weblate):
+    async def run():
+        async with weblate_async.AsyncClient(background=True) as client:
+            with weblate._foreground:
+                task = asyncio.ensure_future(client.get(f"{weblate.API}/projects/"))
+                await asyncio.sleep(0.1)
+                assert not task.done() and mock_weblate.requests == 0
+            return (await task).status_code
+
+    assert asyncio.run(run()) == 200
+
+
+def test_fetch_all_data_saves_and_calls_back(mock_weblate):
+    done, out = threading.Event(), {}
+    weblate_async.fetch_all_data("sv", lambda rows: (out.update(rows=rows), done.set()),
+                                 lambda e: (out.update(error=e), done.set()))
+    assert done.wait(10) and "error" not in out
+    assert len(out["rows"]) == 6
+    assert weblate.load_cache("sv")[0] == out["rows"]
+
+
+def test_fetch_all_data_goes_offline(cache_dir, monkeypatch):
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        url = f"http://127.0.0.1:{s.getsockname()[1]}"
+    monkeypatch.setattr(weblate, "BASE_URL", url)
+    monkeypatch.setattr(weblate, "API", f"{url}/api")
+    done, out = threading.Event(), {}
+    weblate_async.fetch_all_data("sv", lambda rows: done.set(),
+                                 lambda e: (out.update(error=e), done.set()),
+                                 offline_cb=lambda rows, ts: (out.update(offline=rows),
+                                                              done.set()))
+    assert done.wait(10)
+    assert out == {"offline": []}